@@ -0,0 +1,236 @@
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from models import db, Player, Performance, PlayerSeasonStats
+
+CAREER = 'career'
+
+STAT_FIELDS = ('goals', 'assists', 'tackles', 'passes_completed', 'passes_attempted')
+
+
+# ---------------- SEASON KEY ----------------
+def season_for(d):
+    # Η ποδοσφαιρική σεζόν ξεκινά τον Ιούλιο: 2024-08-10 -> "2024-25"
+    start = d.year if d.month >= 7 else d.year - 1
+    return f"{start}-{(start + 1) % 100:02d}"
+
+
+def _seasons(d):
+    return (season_for(d), CAREER) if d else (CAREER,)
+
+
+# ---------------- INCREMENTAL UPDATE ----------------
+UPSERT_DIALECTS = {'sqlite': sqlite.insert, 'postgresql': postgresql.insert}
+DELTA_FIELDS = ('appearances', 'rating_sum') + STAT_FIELDS
+
+
+def _apply_delta(player_id, season, appearances, rating_sum, stats):
+    values = {"player_id": player_id, "season": season,
+              "appearances": appearances, "rating_sum": rating_sum, **stats}
+    table = PlayerSeasonStats.__table__
+    insert = UPSERT_DIALECTS.get(db.engine.dialect.name)
+
+    if insert is not None:
+        # Μία πράξη: δύο ταυτόχρονα πρώτα inserts δεν συγκρούονται στο UNIQUE
+        stmt = insert(table).values(**values)
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=['player_id', 'season'],
+            set_={f: table.c[f] + stmt.excluded[f] for f in DELTA_FIELDS}
+        ))
+        return
+
+    deltas = {table.c[f]: table.c[f] + values[f] for f in DELTA_FIELDS}
+    for _ in range(2):
+        updated = (
+            PlayerSeasonStats.query
+            .filter_by(player_id=player_id, season=season)
+            .update(deltas, synchronize_session=False)
+        )
+        if updated:
+            return
+        try:
+            with db.session.begin_nested():
+                db.session.add(PlayerSeasonStats(**values))
+            return
+        except IntegrityError:
+            # Άλλο request έγραψε πρώτο τη γραμμή: ξανά ως UPDATE
+            continue
+
+
+def record_performance(perf):
+    """Add one Performance row to its season and career totals.
+
+    Runs in the caller's session; the caller commits together with the
+    Performance insert so totals never drift from the history.
+    """
+    record_performance_rows([{
+        "player_id": perf.player_id,
+        "date": perf.date,
+        "rating": perf.rating,
+        **{field: getattr(perf, field) for field in STAT_FIELDS}
+    }])
+
+
+def record_performance_rows(rows):
+    """Batch version of record_performance() for dicts of Performance columns.
+
+    Deltas are summed in memory first, so a batch costs one UPDATE (or
+    INSERT) per touched (player, season) instead of one per row.
+    """
+    acc = {}
+    for row in rows:
+        for season in _seasons(row["date"]):
+            a = acc.setdefault((row["player_id"], season), [0, 0.0, dict.fromkeys(STAT_FIELDS, 0)])
+            a[0] += 1
+            a[1] += row.get("rating") or 0
+            for field in STAT_FIELDS:
+                a[2][field] += row.get(field) or 0
+
+    for (player_id, season), (appearances, rating_sum, stats) in acc.items():
+        _apply_delta(player_id, season, appearances, rating_sum, stats)
+
+
+# ---------------- READ ----------------
+def player_totals(player_id, season=CAREER):
+    row = PlayerSeasonStats.query.filter_by(player_id=player_id, season=season).first()
+
+    totals = {field: getattr(row, field) if row else 0 for field in STAT_FIELDS}
+    totals["appearances"] = row.appearances if row else 0
+    totals["avg_rating"] = row.avg_rating if row else 0.0
+    return totals
+
+
+# ---------------- REBUILD (BACKFILL) ----------------
+def rebuild_player_totals(player_id=None):
+    """Recompute the aggregate rows from the Performance history.
+
+    Returns the number of (player, season) rows written.
+    """
+    delete_q = PlayerSeasonStats.query
+    # Ομαδοποίηση στη βάση ανά (player, ημερομηνία) κρατά μικρό το αποτέλεσμα
+    grouped = db.session.query(
+        Performance.player_id,
+        Performance.date,
+        func.count(Performance.id),
+        func.coalesce(func.sum(Performance.goals), 0),
+        func.coalesce(func.sum(Performance.assists), 0),
+        func.coalesce(func.sum(Performance.tackles), 0),
+        func.coalesce(func.sum(Performance.passes_completed), 0),
+        func.coalesce(func.sum(Performance.passes_attempted), 0),
+        func.coalesce(func.sum(Performance.rating), 0)
+    ).group_by(Performance.player_id, Performance.date)
+
+    if player_id is not None:
+        delete_q = delete_q.filter_by(player_id=player_id)
+        grouped = grouped.filter(Performance.player_id == player_id)
+
+    delete_q.delete(synchronize_session=False)
+
+    rows = {}
+    for pid, d, apps, goals, assists, tackles, pc, pa, rating in grouped:
+        for season in _seasons(d):
+            acc = rows.setdefault((pid, season), [0, 0, 0, 0, 0, 0, 0.0])
+            acc[0] += apps
+            acc[1] += goals
+            acc[2] += assists
+            acc[3] += tackles
+            acc[4] += pc
+            acc[5] += pa
+            acc[6] += rating
+
+    db.session.bulk_insert_mappings(PlayerSeasonStats, [
+        {
+            "player_id": pid,
+            "season": season,
+            "appearances": acc[0],
+            "goals": acc[1],
+            "assists": acc[2],
+            "tackles": acc[3],
+            "passes_completed": acc[4],
+            "passes_attempted": acc[5],
+            "rating_sum": acc[6]
+        }
+        for (pid, season), acc in rows.items()
+    ])
+    db.session.commit()
+
+    return len(rows)
+
+
+# ---------------- PLAYER SERIES (chart) ----------------
+def rating_series(rows):
+    """Chart.js payload from rows with .date and .rating, already ordered by date."""
+    rows = [r for r in rows if r.date]
+    return {
+        "labels": [r.date.strftime("%Y-%m-%d") for r in rows],
+        "values": [r.rating for r in rows]
+    }
+
+
+def player_rating_series(player_id):
+    rows = (
+        db.session.query(Performance.date, Performance.rating)
+        .filter(Performance.player_id == player_id, Performance.date.isnot(None))
+        .order_by(Performance.date.asc())
+        .all()
+    )
+    return rating_series(rows)
+
+
+# ---------------- TEAM SERIES (GROUP BY στη βάση) ----------------
+def _season_start_year(col):
+    year = db.cast(func.strftime('%Y', col), db.Integer)
+    month = db.cast(func.strftime('%m', col), db.Integer)
+    return db.case((month >= 7, year), else_=year - 1)
+
+
+BUCKETS = {
+    'match': lambda col: col,
+    'week': lambda col: func.date(col, 'weekday 0', '-6 days'),
+    'month': lambda col: func.strftime('%Y-%m', col),
+    'season': _season_start_year,
+}
+
+
+def bucket_label(bucket, key):
+    if bucket == 'season':
+        return f"{key}-{(key + 1) % 100:02d}"
+    if hasattr(key, 'strftime'):
+        return key.strftime("%Y-%m-%d")
+    return str(key)
+
+
+def team_performance_series(team_id, start=None, end=None, bucket='match'):
+    """Average rating and appearance count per bucket for a team's players.
+
+    One grouped query joined through Player.team_id; only the aggregated
+    rows leave the database. Returns columnar lists ready for Chart.js.
+    """
+    if bucket not in BUCKETS:
+        raise ValueError(f"Unknown bucket '{bucket}'")
+
+    key = BUCKETS[bucket](Performance.date).label('bucket')
+
+    q = (
+        db.session.query(
+            key,
+            func.avg(Performance.rating),
+            func.count(Performance.id)
+        )
+        .join(Player, Performance.player_id == Player.id)
+        .filter(Player.team_id == team_id)
+        # Αγώνας χωρίς ημερομηνία δεν ανήκει σε κανένα bucket
+        .filter(Performance.date.isnot(None))
+    )
+    if start:
+        q = q.filter(Performance.date >= start)
+    if end:
+        q = q.filter(Performance.date <= end)
+
+    labels, values, counts = [], [], []
+    for k, avg_rating, n in q.group_by(key).order_by(key):
+        labels.append(bucket_label(bucket, k))
+        values.append(round(avg_rating or 0, 2))
+        counts.append(n)
+
+    return {"labels": labels, "values": values, "counts": counts}
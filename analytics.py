@@ -0,0 +1,244 @@
+import importlib.util
+from sqlalchemy import func
+from models import db, Player, Performance
+
+FORM_WINDOWS = (5, 10)
+TREND_WINDOW = 10
+INVOLVEMENT_WINDOW = 10
+DEFAULT_ALPHA = 0.3
+
+
+# ---------------- LOAD (ένα query για όλη την ομάδα) ----------------
+def _form_rows(team_id=None, player_id=None, start=None, end=None):
+    q = (
+        db.session.query(
+            Performance.player_id,
+            Player.name,
+            Performance.date,
+            func.coalesce(Performance.rating, 0),
+            func.coalesce(Performance.goals, 0) + func.coalesce(Performance.assists, 0)
+        )
+        .join(Player, Performance.player_id == Player.id)
+        # Αγώνας χωρίς ημερομηνία δεν έχει θέση στη σειρά
+        .filter(Performance.date.isnot(None))
+        .order_by(Performance.player_id, Performance.date, Performance.id)
+    )
+    if team_id is not None:
+        q = q.filter(Player.team_id == team_id)
+    if player_id is not None:
+        q = q.filter(Performance.player_id == player_id)
+    if start:
+        q = q.filter(Performance.date >= start)
+    if end:
+        q = q.filter(Performance.date <= end)
+    return q.all()
+
+
+def _round(x):
+    return round(float(x), 3)
+
+
+# ---------------- NUMPY (προαιρετικό: pip install numpy) ----------------
+def numpy_available():
+    return importlib.util.find_spec('numpy') is not None
+
+
+def _form_numpy(rows, alpha):
+    """All rolling metrics for every player of `rows` in one vectorized pass.
+
+    Each player's matches become one row of a (players x max matches)
+    matrix, so every metric is a whole-matrix operation: rolling windows
+    from cumulative sums and streaks from running maxima. The EWM is one
+    recursion step per match column, applied to all players at once, so
+    memory stays players x matches however long a career is.
+    """
+    import numpy as np
+
+    pid = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+    rating = np.fromiter((r[3] for r in rows), dtype=float, count=len(rows))
+    involved = np.fromiter((r[4] > 0 for r in rows), dtype=bool, count=len(rows))
+
+    starts = np.flatnonzero(np.r_[True, pid[1:] != pid[:-1]])
+    counts = np.diff(np.r_[starts, len(rows)])
+    n_players, width = len(starts), int(counts.max())
+    row = np.repeat(np.arange(n_players), counts)
+    pos = np.arange(len(rows)) - np.repeat(starts, counts)
+    cols = np.arange(width)
+    last = counts - 1
+    every = np.arange(n_players)
+
+    R = np.zeros((n_players, width))
+    R[row, pos] = rating
+    valid = np.zeros((n_players, width), dtype=bool)
+    valid[row, pos] = True
+    inv = np.zeros((n_players, width))
+    inv[row, pos] = involved
+
+    def rolling(M, w):
+        cs = np.concatenate([np.zeros((n_players, 1)), np.cumsum(M, axis=1)], axis=1)
+        lo = np.maximum(cols + 1 - w, 0)
+        return (cs[:, cols + 1] - cs[:, lo]) / np.minimum(cols + 1, w)
+
+    rolls = {w: rolling(R, w) for w in FORM_WINDOWS}
+
+    # EWM (adjust=False): e_0 = x_0, e_j = a x_j + (1-a) e_(j-1)
+    ewm = np.empty_like(R)
+    ewm[:, 0] = R[:, 0]
+    for j in range(1, width):
+        ewm[:, j] = alpha * R[:, j] + (1 - alpha) * ewm[:, j - 1]
+
+    inv_rate = rolling(inv, INVOLVEMENT_WINDOW)[every, last]
+
+    # Σερί αγώνων με γκολ ή ασίστ: απόσταση από το τελευταίο "κενό"
+    breaks = np.where(valid & (inv == 0) | ~valid, cols, -1)
+    run = cols - np.maximum.accumulate(breaks, axis=1)
+    best_streak = np.where(valid & (inv > 0), run, 0).max(axis=1)
+    current_streak = np.where(inv[every, last] > 0, run[every, last], 0)
+
+    # Κλίση (OLS) της βαθμολογίας στους τελευταίους TREND_WINDOW αγώνες
+    idx = last[:, None] - (TREND_WINDOW - 1) + np.arange(TREND_WINDOW)[None, :]
+    mask = idx >= 0
+    y = np.where(mask, R[every[:, None], np.maximum(idx, 0)], 0.0)
+    x = np.broadcast_to(np.arange(TREND_WINDOW, dtype=float), y.shape)
+    k = mask.sum(axis=1)
+    xm = (x * mask).sum(axis=1) / k
+    ym = y.sum(axis=1) / k
+    dx = np.where(mask, x - xm[:, None], 0.0)
+    var = (dx ** 2).sum(axis=1)
+    trend = np.divide((dx * (y - ym[:, None])).sum(axis=1), var, out=np.zeros(n_players), where=var > 0)
+
+    avg = R.sum(axis=1) / counts
+
+    players = []
+    for i, s in enumerate(starts):
+        n = int(counts[i])
+        players.append({
+            "player_id": int(pid[s]),
+            "name": rows[s][1],
+            "dates": [r[2] for r in rows[s:s + n]],
+            "series": {
+                "rating": R[i, :n].tolist(),
+                **{f"last_{w}": rolls[w][i, :n].tolist() for w in FORM_WINDOWS},
+                "ewm_rating": ewm[i, :n].tolist(),
+            },
+            "matches": n,
+            "avg_rating": avg[i],
+            **{f"last_{w}": rolls[w][i, last[i]] for w in FORM_WINDOWS},
+            "ewm_rating": ewm[i, last[i]],
+            "goal_involvement_rate": inv_rate[i],
+            "current_streak": int(current_streak[i]),
+            "best_streak": int(best_streak[i]),
+            "trend": trend[i],
+        })
+    return players
+
+
+# ---------------- PYTHON (ένας παίκτης τη φορά) ----------------
+def _player_form_python(ratings, involved, alpha):
+    n = len(ratings)
+    rolls = {
+        w: [sum(ratings[max(0, j + 1 - w):j + 1]) / min(j + 1, w) for j in range(n)]
+        for w in FORM_WINDOWS
+    }
+
+    ewm = []
+    for j, r in enumerate(ratings):
+        ewm.append(r if j == 0 else alpha * r + (1 - alpha) * ewm[-1])
+
+    recent = involved[-INVOLVEMENT_WINDOW:]
+    best = run = 0
+    for flag in involved:
+        run = run + 1 if flag else 0
+        best = max(best, run)
+
+    ys = ratings[-TREND_WINDOW:]
+    xs = range(len(ys))
+    xm, ym = sum(xs) / len(ys), sum(ys) / len(ys)
+    var = sum((x - xm) ** 2 for x in xs)
+    trend = sum((x - xm) * (y - ym) for x, y in zip(xs, ys)) / var if var else 0.0
+
+    return {
+        "series": {
+            "rating": list(ratings),
+            **{f"last_{w}": rolls[w] for w in FORM_WINDOWS},
+            "ewm_rating": ewm,
+        },
+        "matches": n,
+        "avg_rating": sum(ratings) / n,
+        **{f"last_{w}": rolls[w][-1] for w in FORM_WINDOWS},
+        "ewm_rating": ewm[-1],
+        "goal_involvement_rate": sum(recent) / len(recent),
+        "current_streak": run,
+        "best_streak": best,
+        "trend": trend,
+    }
+
+
+def _form_python(rows, alpha):
+    players = []
+    i = 0
+    while i < len(rows):
+        j = i
+        while j < len(rows) and rows[j][0] == rows[i][0]:
+            j += 1
+        group = rows[i:j]
+        players.append({
+            "player_id": group[0][0],
+            "name": group[0][1],
+            "dates": [r[2] for r in group],
+            **_player_form_python([float(r[3]) for r in group], [r[4] > 0 for r in group], alpha),
+        })
+        i = j
+    return players
+
+
+def compute_form(rows, alpha=DEFAULT_ALPHA, vectorized=None):
+    """Per-player form from _form_rows() output (NumPy when installed)."""
+    if not rows:
+        return []
+    if vectorized is None:
+        vectorized = numpy_available()
+    return (_form_numpy if vectorized else _form_python)(rows, alpha)
+
+
+# ---------------- API PAYLOADS ----------------
+SUMMARY_FIELDS = (
+    "matches", "avg_rating", *(f"last_{w}" for w in FORM_WINDOWS), "ewm_rating",
+    "goal_involvement_rate", "current_streak", "best_streak", "trend"
+)
+
+
+def _summary(p):
+    return {f: p[f] if isinstance(p[f], int) else _round(p[f]) for f in SUMMARY_FIELDS}
+
+
+def _check_alpha(alpha):
+    if not 0 < alpha <= 1:
+        raise ValueError("alpha must be in (0, 1]")
+
+
+def team_form(team_id, start=None, end=None, alpha=DEFAULT_ALPHA):
+    """Current form of every player of a team, best EWM rating first."""
+    _check_alpha(alpha)
+    players = compute_form(_form_rows(team_id=team_id, start=start, end=end), alpha)
+    players.sort(key=lambda p: -p["ewm_rating"])
+    return {
+        "alpha": alpha,
+        "windows": list(FORM_WINDOWS),
+        "players": [{"player_id": p["player_id"], "name": p["name"], **_summary(p)} for p in players]
+    }
+
+
+def player_form(player_id, start=None, end=None, alpha=DEFAULT_ALPHA):
+    """Per-match form series of one player plus the current summary."""
+    _check_alpha(alpha)
+    players = compute_form(_form_rows(player_id=player_id, start=start, end=end), alpha)
+    if not players:
+        return {"labels": [], "series": {}, "summary": None}
+
+    p = players[0]
+    return {
+        "labels": [d.strftime("%Y-%m-%d") for d in p["dates"]],
+        "series": {name: [_round(v) for v in values] for name, values in p["series"].items()},
+        "summary": _summary(p)
+    }
@@ -0,0 +1,89 @@
+from sqlalchemy import and_, func, insert, select
+from models import db, Player, Training, TrainingAttendance
+
+
+# ---------------- WRITE ----------------
+def record_attendance(training, player_ids):
+    """Store who attended `training` (flushed, in the caller's transaction)."""
+    player_ids = sorted(set(player_ids))
+    if player_ids:
+        db.session.execute(insert(TrainingAttendance), [
+            {"training_id": training.id, "player_id": pid} for pid in player_ids
+        ])
+    training.attendance = len(player_ids)
+
+
+def _sessions(team_id, start=None, end=None):
+    q = select(Training.id).where(Training.team_id == team_id)
+    if start:
+        q = q.where(Training.date >= start)
+    if end:
+        q = q.where(Training.date <= end)
+    return q
+
+
+def _rate(attended, sessions):
+    return round(attended / sessions, 3) if sessions else None
+
+
+# ---------------- READ (ένα aggregate query) ----------------
+def team_attendance(team_id, start=None, end=None):
+    """Attendance of the current roster over the team's trainings in [start, end]."""
+    sessions = _sessions(team_id, start, end)
+    total = select(func.count()).select_from(sessions.subquery()).scalar_subquery()
+
+    rows = (
+        db.session.query(
+            Player.id, Player.name, func.count(TrainingAttendance.training_id), total
+        )
+        .outerjoin(TrainingAttendance, and_(
+            TrainingAttendance.player_id == Player.id,
+            TrainingAttendance.training_id.in_(sessions)
+        ))
+        .filter(Player.team_id == team_id)
+        .group_by(Player.id, Player.name)
+        .order_by(Player.name)
+        .all()
+    )
+
+    if rows:
+        n_sessions = rows[0][3]
+    else:
+        n_sessions = db.session.execute(select(total)).scalar()
+
+    attended = sum(r[2] for r in rows)
+    return {
+        "team_id": team_id,
+        "sessions": n_sessions,
+        "rate": _rate(attended, n_sessions * len(rows)),
+        "players": [
+            {"player_id": pid, "name": name, "attended": count, "rate": _rate(count, n_sessions)}
+            for pid, name, count, _ in rows
+        ]
+    }
+
+
+def player_attendance(player_id, start=None, end=None):
+    """Trainings of the player's current team in [start, end] and how many were attended."""
+    team_id = select(Player.team_id).where(Player.id == player_id).scalar_subquery()
+
+    q = (
+        db.session.query(func.count(Training.id), func.count(TrainingAttendance.player_id))
+        .outerjoin(TrainingAttendance, and_(
+            TrainingAttendance.training_id == Training.id,
+            TrainingAttendance.player_id == player_id
+        ))
+        .filter(Training.team_id == team_id)
+    )
+    if start:
+        q = q.filter(Training.date >= start)
+    if end:
+        q = q.filter(Training.date <= end)
+
+    sessions, attended = q.one()
+    return {
+        "player_id": player_id,
+        "sessions": sessions,
+        "attended": attended,
+        "rate": _rate(attended, sessions)
+    }
@@ -0,0 +1,86 @@
+"""Chat pagination check: every message reachable through the "older" cursor.
+
+Seeds one conversation whose messages, sent in both directions, all share
+the same second (as CURRENT_TIMESTAMP stores them) and walks the chat pages
+through the older_cursor links. Exits with status 1 if a message is
+skipped, repeated or the walk does not end. It then grows the conversation
+to --large messages and times the newest page again: with per-direction
+index reads the time stays flat instead of growing with the conversation.
+Usage:
+
+    python benchmarks/chat_pagination.py [--messages 155] [--large 50000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sqlalchemy import insert  # noqa: E402
+from app import create_app  # noqa: E402
+from models import db, Message  # noqa: E402
+from messaging import latest_messages, CHAT_PAGE_SIZE  # noqa: E402
+from league import generate_league  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--messages', type=int, default=3 * CHAT_PAGE_SIZE + 5)
+    parser.add_argument('--large', type=int, default=50000, help='conversation size for the timing')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tmp, 'chat.db'),
+            'TRAINING_CLEANUP_INTERVAL': 0,
+        })
+        with app.app_context():
+            db.create_all()
+            ids = generate_league(teams=1, players=1, seasons=1, matches=0, trainings=0, messages=0)
+            coach, player = ids['coach_user_id'], ids['player_user_id']
+            # Χωρίς timestamp: το default CURRENT_TIMESTAMP, ίδιο δευτερόλεπτο για όλα
+            def seed(n):
+                db.session.execute(insert(Message), [
+                    {'sender_id': (coach, player)[i % 2], 'receiver_id': (player, coach)[i % 2],
+                     'content': f'm{i}'}
+                    for i in range(n)
+                ])
+                db.session.commit()
+
+            def page_ms(repeat=20):
+                t0 = time.perf_counter()
+                for _ in range(repeat):
+                    latest_messages(coach, player)
+                return (time.perf_counter() - t0) * 1000 / repeat
+
+            seed(args.messages)
+            seconds = db.session.query(db.func.count(db.distinct(Message.timestamp))).scalar()
+
+            seen, cursor, pages = [], None, 0
+            while pages <= args.messages // CHAT_PAGE_SIZE + 1:
+                page, cursor = latest_messages(coach, player, before=cursor)
+                seen = [m.id for m in page] + seen
+                pages += 1
+                if cursor is None:
+                    break
+
+            small = page_ms()
+            seed(args.large - args.messages)
+            large = page_ms()
+            db.engine.dispose()
+
+    expected = list(range(1, args.messages + 1))
+    print(f"{args.messages} messages in {seconds} distinct timestamp(s), {pages} pages")
+    if seen != expected:
+        missing = sorted(set(expected) - set(seen))
+        raise SystemExit(f"pagination broken: {len(seen)} rows seen, missing {missing[:10]}")
+    print("every message reached exactly once, in order")
+    print(f"newest page: {small:.2f} ms at {args.messages} messages, "
+          f"{large:.2f} ms at {args.large} messages")
+
+
+if __name__ == '__main__':
+    main()
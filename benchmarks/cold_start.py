@@ -0,0 +1,60 @@
+"""Cold-start benchmark: import time and first-request latency.
+
+Each sample runs in a fresh interpreter against a fresh SQLite file, so
+it measures what a new worker process pays before serving its first
+request. Usage:
+
+    python benchmarks/cold_start.py [--runs 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r'''
+import json, time
+t0 = time.perf_counter()
+import app as module
+t1 = time.perf_counter()
+application = getattr(module, "app", None) or module.create_app()
+t2 = time.perf_counter()
+client = application.test_client()
+client.get("/login")
+t3 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "create_app": t2 - t1, "first_request": t3 - t2}))
+'''
+
+
+def sample():
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL='sqlite:///' + os.path.join(tmp, 'bench.db'))
+        out = subprocess.run(
+            [sys.executable, '-c', PROBE],
+            cwd=ROOT, env=env, check=True, capture_output=True, text=True
+        ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    samples = [sample() for _ in range(args.runs)]
+
+    print(f"{'phase':<15}{'median ms':>12}{'min ms':>10}{'max ms':>10}")
+    for phase in ('import', 'create_app', 'first_request'):
+        values = [s[phase] * 1000 for s in samples]
+        print(f"{phase:<15}{statistics.median(values):>12.1f}{min(values):>10.1f}{max(values):>10.1f}")
+
+    total = [sum(s.values()) * 1000 for s in samples]
+    print(f"{'total':<15}{statistics.median(total):>12.1f}{min(total):>10.1f}{max(total):>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""Coach deletion benchmark: per-team loop vs the set-based deletion service.
+
+For each team count a league is generated in which one coach owns every
+team. That coach is then deleted, once by the old per-team loop of
+admin_delete_user and once by deletion.delete_user, each on its own copy
+of the database. Usage:
+
+    python benchmarks/delete_user.py [--teams 1 --teams 50 --teams 200] [--players 15]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sqlalchemy import event  # noqa: E402
+from app import create_app  # noqa: E402
+from models import (  # noqa: E402
+    db, User, Team, Player, Performance, PlayerSeasonStats, Training, TrainingAttendance, Message,
+    ConversationSummary
+)
+from deletion import delete_user  # noqa: E402
+from league import generate_league  # noqa: E402
+
+
+def legacy_delete(user_id):
+    # Ο βρόχος ανά ομάδα που είχε το admin_delete_user (με τα FKs σεβαστά)
+    user = db.session.get(User, user_id)
+    for team in Team.query.filter_by(coach_id=user.id).all():
+        players = db.session.query(Player.id).filter(Player.team_id == team.id).scalar_subquery()
+        Performance.query.filter(Performance.player_id.in_(players)).delete(synchronize_session=False)
+        PlayerSeasonStats.query.filter(PlayerSeasonStats.player_id.in_(players)).delete(synchronize_session=False)
+        trainings = db.session.query(Training.id).filter(Training.team_id == team.id).scalar_subquery()
+        TrainingAttendance.query.filter(
+            TrainingAttendance.training_id.in_(trainings) | TrainingAttendance.player_id.in_(players)
+        ).delete(synchronize_session=False)
+        Player.query.filter_by(team_id=team.id).delete()
+        Training.query.filter_by(team_id=team.id).delete()
+        db.session.delete(team)
+    ConversationSummary.query.filter(
+        (ConversationSummary.user_id == user.id) | (ConversationSummary.peer_id == user.id)
+    ).delete()
+    Message.query.filter(
+        (Message.sender_id == user.id) | (Message.receiver_id == user.id)
+    ).delete()
+    db.session.delete(user)
+    db.session.commit()
+
+
+def service_delete(user_id):
+    delete_user(user_id)
+
+
+def measure(path, fn, user_id):
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + path,
+        'TRAINING_CLEANUP_INTERVAL': 0,
+    })
+    with app.app_context():
+        statements = []
+        event.listen(db.engine, 'before_cursor_execute', lambda *a: statements.append(1))
+        t0 = time.perf_counter()
+        fn(user_id)
+        elapsed = (time.perf_counter() - t0) * 1000
+        db.engine.dispose()
+    return elapsed, len(statements)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--teams', type=int, action='append', help='teams owned by the coach (repeatable)')
+    parser.add_argument('--players', type=int, default=15, help='players per team')
+    args = parser.parse_args()
+
+    print(f"{'teams':>6}  {'variant':<10}{'ms':>10}{'statements':>12}")
+    for teams in args.teams or [1, 10, 50, 200]:
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, 'league.db')
+            app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + source, 'TRAINING_CLEANUP_INTERVAL': 0})
+            with app.app_context():
+                db.create_all()
+                ids = generate_league(teams=teams, players=args.players, seasons=2, matches=10,
+                                      trainings=10, messages=4)
+                Team.query.update({'coach_id': ids['coach_user_id']})
+                db.session.commit()
+                db.engine.dispose()
+
+            for name, fn in (('loop', legacy_delete), ('service', service_delete)):
+                copy = os.path.join(tmp, f'{name}.db')
+                shutil.copy(source, copy)
+                elapsed, statements = measure(copy, fn, ids['coach_user_id'])
+                print(f"{teams:>6}  {name:<10}{elapsed:>10.1f}{statements:>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Rolling-form analytics benchmark: per-player Python loop vs NumPy.
+
+Generates a synthetic league (benchmarks/league.py), loads each team's
+performances with the single query of analytics.team_form and computes
+the form metrics twice: with the per-player Python loop and with the
+vectorized NumPy pass. Both results are compared before timing is
+reported. Requires numpy. Usage:
+
+    python benchmarks/form_analytics.py [--teams 10] [--players 25] [--seasons 5] [--matches 40]
+"""
+import argparse
+import math
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app import create_app  # noqa: E402
+from models import db, Team  # noqa: E402
+from analytics import compute_form, numpy_available, _form_rows, DEFAULT_ALPHA  # noqa: E402
+from league import generate_league  # noqa: E402
+
+
+def same(a, b):
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(same(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    if isinstance(a, float) or isinstance(b, float):
+        return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+    return a == b
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--teams', type=int, default=10)
+    parser.add_argument('--players', type=int, default=25, help='players per team')
+    parser.add_argument('--seasons', type=int, default=5)
+    parser.add_argument('--matches', type=int, default=40, help='matches per team/season')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if not numpy_available():
+        raise SystemExit("numpy is not installed (pip install numpy)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tmp, 'form.db'),
+            'TRAINING_CLEANUP_INTERVAL': 0,
+        })
+        with app.app_context():
+            db.create_all()
+            generate_league(teams=args.teams, players=args.players, seasons=args.seasons,
+                            matches=args.matches, trainings=0, messages=0)
+
+            t0 = time.perf_counter()
+            squads = [_form_rows(team_id=t) for (t,) in db.session.query(Team.id)]
+            load_ms = (time.perf_counter() - t0) * 1000
+            rows = sum(len(s) for s in squads)
+
+            for squad in squads:
+                python = compute_form(squad, DEFAULT_ALPHA, vectorized=False)
+                vectorized = compute_form(squad, DEFAULT_ALPHA, vectorized=True)
+                if not same(python, vectorized):
+                    raise SystemExit("python and numpy results differ")
+
+            print(f"{len(squads)} teams, {rows} performances, load {load_ms:.1f} ms")
+            print(f"{'variant':<10}{'ms':>10}{'per team':>10}")
+            for name, vectorized in (('python', False), ('numpy', True)):
+                ms = best_of(lambda: [compute_form(s, DEFAULT_ALPHA, vectorized) for s in squads], args.repeat)
+                print(f"{name:<10}{ms:>10.1f}{ms / len(squads):>10.2f}")
+            db.engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
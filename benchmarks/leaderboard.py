@@ -0,0 +1,123 @@
+"""Leaderboard benchmark: Performance scan vs the maintained ranking index.
+
+Generates a synthetic league (benchmarks/league.py) and times a top-20
+career leaderboard three ways: summing the Performance history per
+player, building the index from the season totals, and reading the
+already built index. It then records new performances one at a time,
+as add_stats does, and checks that the incrementally updated rankings
+equal a fresh rebuild. Usage:
+
+    python benchmarks/leaderboard.py [--teams 20] [--players 25] [--seasons 5] [--updates 200]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from datetime import date  # noqa: E402
+from sqlalchemy import func  # noqa: E402
+from app import create_app  # noqa: E402
+from models import db, Player, Performance  # noqa: E402
+from aggregates import record_performance, season_for  # noqa: E402
+from leaderboard import LeaderboardIndex, METRICS, bump_leaderboards  # noqa: E402
+from league import generate_league  # noqa: E402
+
+
+def scan_top(limit=20):
+    # Ό,τι θα χρειαζόταν χωρίς totals: άθροιση όλου του ιστορικού
+    return (
+        db.session.query(Performance.player_id, func.sum(Performance.goals).label('g'))
+        .group_by(Performance.player_id)
+        .order_by(func.sum(Performance.goals).desc(), Performance.player_id)
+        .limit(limit)
+        .all()
+    )
+
+
+def timed(fn, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--teams', type=int, default=20)
+    parser.add_argument('--players', type=int, default=25, help='players per team')
+    parser.add_argument('--seasons', type=int, default=5)
+    parser.add_argument('--matches', type=int, default=30, help='matches per team/season')
+    parser.add_argument('--updates', type=int, default=200, help='performances recorded incrementally')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tmp, 'board.db'),
+            'TRAINING_CLEANUP_INTERVAL': 0,
+        })
+        with app.app_context():
+            db.create_all()
+            generate_league(teams=args.teams, players=args.players, seasons=args.seasons,
+                            matches=args.matches, trainings=0, messages=0)
+            performances = db.session.query(func.count(Performance.id)).scalar()
+            season = season_for(date.today())
+
+            print(f"{performances} performances")
+            print(f"{'variant':<16}{'ms':>10}")
+            print(f"{'scan history':<16}{timed(scan_top):>10.2f}")
+            print(f"{'build index':<16}{timed(lambda: LeaderboardIndex(ttl=0).top('goals')):>10.2f}")
+            index = LeaderboardIndex(ttl=0)
+            index.top('goals')
+            print(f"{'read index':<16}{timed(lambda: index.top('goals'), repeat=50):>10.3f}")
+
+            # Φόρτωση της τρέχουσας σεζόν ώστε να ενημερώνεται κι αυτή
+            index.top('goals', season=season)
+
+            rnd = random.Random(7)
+            players = Player.query.all()
+            t0 = time.perf_counter()
+            for _ in range(args.updates):
+                player = rnd.choice(players)
+                perf = Performance(player_id=player.id, date=date.today(),
+                                   goals=rnd.randint(0, 3), assists=rnd.randint(0, 2),
+                                   tackles=rnd.randint(0, 6), passes_completed=10,
+                                   passes_attempted=12, rating=round(rnd.uniform(4, 10), 1))
+                db.session.add(perf)
+                record_performance(perf)
+                version = bump_leaderboards()
+                db.session.commit()
+                index.record(player, perf, version)
+            per_update = (time.perf_counter() - t0) * 1000 / args.updates
+            print(f"{'add_stats':<16}{per_update:>10.2f}  per performance (commit + index)")
+
+            # Ανάγνωση ανάμεσα στο commit και το record(): η σεζόν φορτώνεται με τον
+            # νέο αγώνα, οπότε το record() δεν πρέπει να τον ξαναπροσθέσει
+            index._seasons.pop(season, None)
+            perf = Performance(player_id=players[0].id, date=date.today(), goals=5, rating=8)
+            db.session.add(perf)
+            record_performance(perf)
+            version = bump_leaderboards()
+            db.session.commit()
+            index.top('goals', season=season)
+            index.record(players[0], perf, version)
+
+            fresh = LeaderboardIndex(ttl=0)
+            for s in ('career', season):
+                for metric in METRICS:
+                    for team in (None, 1):
+                        kw = dict(season=s, team_id=team, min_apps=3, limit=100)
+                        if index.top(metric, **kw) != fresh.top(metric, **kw):
+                            raise SystemExit(f"incremental {metric}/{s}/{team} differs from rebuild")
+            print("incremental rankings match a rebuild")
+            db.engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""Synthetic league generator for the benchmarks.
+
+Fills an empty database (inside an app context) with teams, coaches,
+players with user accounts, K seasons of weekly matches, trainings and
+coach/player message threads. Generation is seeded, so the same
+arguments always produce the same league.
+"""
+import random
+from datetime import date, datetime, timedelta
+from sqlalchemy import insert
+from models import db, User, Team, Player, Performance, Training, TrainingAttendance, Message
+from aggregates import rebuild_player_totals, season_for
+from messaging import rebuild_conversations
+from passwords import hash_password
+
+PASSWORD = 'bench-password'
+POSITIONS = ('GK', 'DF', 'MF', 'FW')
+CHUNK = 5000
+
+
+def _insert(model, rows):
+    for i in range(0, len(rows), CHUNK):
+        db.session.execute(insert(model), rows[i:i + CHUNK])
+
+
+def generate_league(teams=10, players=25, seasons=3, matches=30,
+                    trainings=40, messages=20, seed=42):
+    """Populate the database and return the ids the benchmarks log in as.
+
+    `players`, `matches`, `trainings` and `messages` are per team, per
+    team/season, per team/season and per coach-player thread respectively.
+    """
+    rnd = random.Random(seed)
+    pwhash = hash_password(PASSWORD)
+    today = date.today()
+    first_season = int(season_for(today)[:4]) - seasons + 1
+
+    users = [{'id': 1, 'username': 'admin', 'email': 'admin@bench.local',
+              'password_hash': pwhash, 'role': 'admin', 'approved': 1}]
+    team_rows, player_rows, perf_rows, training_rows, message_rows = [], [], [], [], []
+    attendance_rows = []
+    next_user = 2
+
+    for t in range(1, teams + 1):
+        coach_id = next_user
+        next_user += 1
+        users.append({'id': coach_id, 'username': f'coach{t}', 'email': f'coach{t}@bench.local',
+                      'password_hash': pwhash, 'role': 'coach', 'approved': 1})
+        team_rows.append({'id': t, 'name': f'Team {t:03d}', 'coach_id': coach_id,
+                          'season': season_for(today)})
+
+        for p in range(players):
+            player_id = len(player_rows) + 1
+            user_id = next_user
+            next_user += 1
+            users.append({'id': user_id, 'username': f'player{player_id}',
+                          'email': f'player{player_id}@bench.local',
+                          'password_hash': pwhash, 'role': 'player', 'approved': 1})
+            player_rows.append({'id': player_id, 'user_id': user_id, 'name': f'Player {player_id:05d}',
+                                'position': rnd.choice(POSITIONS), 'team_id': t,
+                                'age': rnd.randint(17, 36)})
+
+            # Νήμα συνομιλίας coach <-> παίκτη
+            start = datetime.now() - timedelta(days=messages)
+            for m in range(messages):
+                sender, receiver = (coach_id, user_id) if m % 2 == 0 else (user_id, coach_id)
+                message_rows.append({'sender_id': sender, 'receiver_id': receiver,
+                                     'content': f'message {m}',
+                                     'timestamp': start + timedelta(hours=m * 12)})
+
+        for s in range(seasons):
+            season_start = date(first_season + s, 8, 1)
+            for m in range(matches):
+                match_day = season_start + timedelta(weeks=m)
+                for player in player_rows[-players:]:
+                    pa = rnd.randint(10, 60)
+                    pc = rnd.randint(0, pa)
+                    perf_rows.append({
+                        'player_id': player['id'], 'date': match_day,
+                        'goals': rnd.choices((0, 1, 2, 3), (70, 20, 8, 2))[0],
+                        'assists': rnd.choices((0, 1, 2), (75, 20, 5))[0],
+                        'passes_completed': pc, 'passes_attempted': pa,
+                        'pass_accuracy': round(pc / pa * 100, 2),
+                        'tackles': rnd.randint(0, 8), 'rating': rnd.randint(4, 10)
+                    })
+            for n in range(trainings):
+                training_id = len(training_rows) + 1
+                squad = [p['id'] for p in player_rows[-players:]]
+                present = rnd.sample(squad, rnd.randint(len(squad) // 2, len(squad)))
+                training_rows.append({'id': training_id, 'team_id': t,
+                                      'date': season_start + timedelta(days=n * 7 + 2),
+                                      'focus': rnd.choice(('Τακτική', 'Φυσική', 'Στημένα', 'Τεχνική')),
+                                      'duration': rnd.choice((60, 75, 90)),
+                                      'attendance': len(present)})
+                attendance_rows += [{'training_id': training_id, 'player_id': p} for p in present]
+
+    for model, rows in ((User, users), (Team, team_rows), (Player, player_rows),
+                        (Performance, perf_rows), (Training, training_rows),
+                        (TrainingAttendance, attendance_rows), (Message, message_rows)):
+        _insert(model, rows)
+    db.session.commit()
+    rebuild_player_totals()
+    rebuild_conversations()
+
+    return {
+        'admin': 'admin',
+        'coach': 'coach1',
+        'coach_user_id': 2,
+        'player': 'player1',
+        'player_id': 1,
+        'player_user_id': 3,
+        'team_id': 1,
+        'counts': {
+            'users': len(users), 'teams': len(team_rows), 'players': len(player_rows),
+            'performances': len(perf_rows), 'trainings': len(training_rows),
+            'attendance': len(attendance_rows),
+            'messages': len(message_rows)
+        }
+    }
@@ -0,0 +1,166 @@
+"""Notification queue check against a local SMTP stand-in.
+
+Starts a minimal SMTP server on 127.0.0.1 (with a per-command delay to
+mimic a remote relay) and compares:
+  inline   mail.send() per message, one SMTP connection each
+  queued   notifications.MailQueue: enqueue time seen by the request,
+           total delivery time and SMTP connections used
+  retry    the stand-in refuses the first connections; every message
+           must still arrive
+  chat     latency of the chat POST route with notifications queued
+Usage:
+
+    python benchmarks/mail_queue.py [--messages 200] [--latency-ms 2]
+"""
+import argparse
+import os
+import socketserver
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from flask_mail import Message as MailMessage  # noqa: E402
+from app import create_app  # noqa: E402
+from extensions import mail  # noqa: E402
+from models import db  # noqa: E402
+from notifications import MailQueue  # noqa: E402
+from league import generate_league, PASSWORD  # noqa: E402
+
+
+# ---------------- SMTP STAND-IN ----------------
+class SMTPHandler(socketserver.StreamRequestHandler):
+
+    def reply(self, line):
+        time.sleep(self.server.latency)
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+            refuse = server.connections <= server.refuse
+        if refuse:
+            self.reply("421 stand-in busy")
+            return
+
+        self.reply("220 stand-in ESMTP")
+        for line in self.rfile:
+            cmd = line[:4].upper()
+            if cmd in (b"EHLO", b"HELO"):
+                self.reply("250 stand-in")
+            elif cmd == b"DATA":
+                self.reply("354 end with <CRLF>.<CRLF>")
+                for data in self.rfile:
+                    if data == b".\r\n":
+                        break
+                with server.lock:
+                    server.messages += 1
+                self.reply("250 queued")
+            elif cmd == b"QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("250 ok")
+
+
+class SMTPStandIn(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, latency, refuse=0):
+        super().__init__(('127.0.0.1', 0), SMTPHandler)
+        self.latency = latency
+        self.refuse = refuse
+        self.connections = self.messages = 0
+        self.lock = threading.Lock()
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+
+def make_app(tmp, port, **extra):
+    return create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tmp, 'mail.db'),
+        'TRAINING_CLEANUP_INTERVAL': 0,
+        'WTF_CSRF_ENABLED': False,
+        'MAIL_SERVER': '127.0.0.1',
+        'MAIL_PORT': port,
+        'MAIL_DEFAULT_SENDER': 'bench@localhost',
+        'MAIL_NOTIFICATIONS': True,
+        'MAIL_QUEUE_BACKOFF': 0.05,
+        **extra
+    })
+
+
+def messages(n):
+    return [MailMessage(subject=f"bench {i}", recipients=[f"p{i}@bench.local"], body="x") for i in range(n)]
+
+
+def report(name, request_ms, total_ms, server):
+    print(f"{name:<8}{request_ms:>12.1f}{total_ms:>12.1f}{server.connections:>8}{server.messages:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--messages', type=int, default=200)
+    parser.add_argument('--latency-ms', type=float, default=2, help='delay of every SMTP reply')
+    parser.add_argument('--chat-requests', type=int, default=50)
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+    n = args.messages
+
+    print(f"{'variant':<8}{'request ms':>12}{'total ms':>12}{'conns':>8}{'received':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        server = SMTPStandIn(latency)
+        app = make_app(tmp, server.port)
+        with app.test_request_context():
+            batch = messages(n)
+            t0 = time.perf_counter()
+            for msg in batch:
+                mail.send(msg)
+            elapsed = (time.perf_counter() - t0) * 1000
+            report('inline', elapsed, elapsed, server)
+
+            for name, refuse in (('queued', 0), ('retry', 2)):
+                server = SMTPStandIn(latency, refuse=refuse)
+                app.config['MAIL_PORT'] = server.port
+                mail.init_app(app)
+                q = MailQueue(app, batch_size=50, backoff=0.05)
+                batch = messages(n)
+                t0 = time.perf_counter()
+                q.enqueue(*batch)
+                request_ms = (time.perf_counter() - t0) * 1000
+                if not q.flush(timeout=120):
+                    raise SystemExit(f"{name}: queue did not drain")
+                report(name, request_ms, (time.perf_counter() - t0) * 1000, server)
+                if server.messages != n:
+                    raise SystemExit(f"{name}: {server.messages}/{n} messages delivered")
+
+        # Το chat route με ειδοποίηση στην ουρά
+        server = SMTPStandIn(latency)
+        app = make_app(tmp, server.port)
+        with app.app_context():
+            db.create_all()
+            ids = generate_league(teams=1, players=2, seasons=1, matches=1, trainings=1, messages=1)
+        client = app.test_client()
+        client.post('/login', data={'username': ids['coach'], 'password': PASSWORD})
+        times = []
+        for i in range(args.chat_requests):
+            t0 = time.perf_counter()
+            client.post(f"/message/chat/{ids['player_user_id']}", data={'content': f'hi {i}'})
+            times.append((time.perf_counter() - t0) * 1000)
+        app.extensions['mail_queue'].flush(timeout=60)
+        report('chat', statistics.median(times), sum(times), server)
+        if server.messages != args.chat_requests:
+            raise SystemExit(f"chat: {server.messages}/{args.chat_requests} notifications delivered")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""Prometheus counters check: exact totals and bounded shards under thread churn.
+
+Runs three workloads against metrics.py and exits with status 1 if a
+total is off or per-thread shards pile up:
+  churn    one short-lived thread per "request" (as app.run()/flask run
+           serve), then how many shards remain and how long a scrape takes
+  steady   a few long-lived threads incrementing concurrently (lock-free path)
+  app      GET requests through the Flask test client, each from its own
+           thread, then /metrics must report every one of them
+Usage:
+
+    python benchmarks/metrics_shards.py [--threads 2000] [--incs 50]
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import metrics  # noqa: E402
+from app import create_app  # noqa: E402
+from models import db  # noqa: E402
+
+
+def run_threads(n, target, concurrent=1):
+    for start in range(0, n, concurrent):
+        threads = [threading.Thread(target=target) for _ in range(min(concurrent, n - start))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+
+def total(name, labels):
+    return metrics._counters().get((name, labels), 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=2000, help='short-lived threads in the churn run')
+    parser.add_argument('--incs', type=int, default=50, help='increments per thread')
+    parser.add_argument('--requests', type=int, default=300, help='requests in the app run')
+    args = parser.parse_args()
+    failures = []
+
+    tmp = tempfile.TemporaryDirectory()
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tmp.name, 'metrics.db'),
+        'TRAINING_CLEANUP_INTERVAL': 0,
+        'METRICS_ENABLED': True,
+        'METRICS_DIR': None,
+    })
+    with app.app_context():
+        db.create_all()
+
+    # -------- churn --------
+    churn = (('run', 'churn'),)
+
+    def request_like():
+        for _ in range(args.incs):
+            metrics.inc('bench_total', churn)
+        metrics.observe('bench_seconds', churn, 0.01)
+
+    t0 = time.perf_counter()
+    run_threads(args.threads, request_like, concurrent=16)
+    elapsed = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    with app.app_context():
+        metrics.render()
+    scrape_ms = (time.perf_counter() - t0) * 1000
+
+    got = total('bench_total', churn)
+    print(f"{'churn':<8}{args.threads} threads, {len(metrics._shards)} shards left, "
+          f"{elapsed * 1000:.0f} ms, scrape {scrape_ms:.2f} ms")
+    if got != args.threads * args.incs:
+        failures.append(f"churn total {got} != {args.threads * args.incs}")
+    if len(metrics._shards) > 16:
+        failures.append(f"{len(metrics._shards)} shards left after the churn threads exited")
+
+    # -------- steady --------
+    steady = (('run', 'steady'),)
+    per_thread = args.incs * 2000
+
+    def hot_loop():
+        for _ in range(per_thread):
+            metrics.inc('bench_total', steady)
+
+    t0 = time.perf_counter()
+    run_threads(8, hot_loop, concurrent=8)
+    ns = (time.perf_counter() - t0) * 1e9 / (8 * per_thread)
+    got = total('bench_total', steady)
+    print(f"{'steady':<8}8 threads x {per_thread} increments, {ns:.0f} ns per increment")
+    if got != 8 * per_thread:
+        failures.append(f"steady total {got} != {8 * per_thread}")
+
+    # -------- app --------
+    def one_request():
+        app.test_client().get('/login')
+
+    run_threads(args.requests, one_request, concurrent=8)
+    body = app.test_client().get('/metrics').get_data(as_text=True)
+    with app.app_context():
+        db.engine.dispose()
+    tmp.cleanup()
+
+    served = sum(
+        float(v) for v in re.findall(
+            r'^afm_http_requests_total\{endpoint="auth\.login",[^}]*\} (\S+)$', body, re.M
+        )
+    )
+    print(f"{'app':<8}{args.requests} requests, /metrics reports {served:.0f}, "
+          f"{len(metrics._shards)} shards left")
+    if served != args.requests:
+        failures.append(f"/metrics reports {served:.0f} login requests, expected {args.requests}")
+
+    if failures:
+        raise SystemExit("\n".join(failures))
+    print("all totals exact")
+
+
+if __name__ == '__main__':
+    main()
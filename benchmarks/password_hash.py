@@ -0,0 +1,63 @@
+"""Password hashing benchmark: cost of each candidate PASSWORD_HASH_METHOD.
+
+Run it on the production host and pick the strongest method whose median
+stays within the login latency budget (a few hundred ms at most), then
+set PASSWORD_HASH_METHOD. Usage:
+
+    python benchmarks/password_hash.py [--runs 5] [--method scrypt:65536:8:1 ...]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from passwords import _hash, _verify  # noqa: E402
+
+CANDIDATES = [
+    'scrypt:16384:8:1',
+    'scrypt:32768:8:1',
+    'scrypt:65536:8:1',
+    'pbkdf2:sha256:600000',
+    'pbkdf2:sha256:1000000',
+    'bcrypt:10',
+    'bcrypt:12',
+]
+
+
+def measure(method, runs):
+    hash_ms, verify_ms = [], []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        pwhash = _hash('correct horse battery staple', method)
+        t1 = time.perf_counter()
+        _verify(pwhash, 'correct horse battery staple')
+        t2 = time.perf_counter()
+        hash_ms.append((t1 - t0) * 1000)
+        verify_ms.append((t2 - t1) * 1000)
+    return hash_ms, verify_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--method', action='append', help='method to measure (repeatable)')
+    args = parser.parse_args()
+
+    print(f"{'method':<24}{'hash ms':>10}{'verify ms':>12}{'max ms':>10}")
+    for method in args.method or CANDIDATES:
+        try:
+            hash_ms, verify_ms = measure(method, args.runs)
+        except (ImportError, ValueError) as e:
+            print(f"{method:<24}  skipped: {e}")
+            continue
+        print(
+            f"{method:<24}{statistics.median(hash_ms):>10.1f}"
+            f"{statistics.median(verify_ms):>12.1f}{max(hash_ms + verify_ms):>10.1f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""Constant-query-count check for the listing routes.
+
+Every route is requested against a small and a large synthetic league
+(benchmarks/league.py). A route whose query count grows with the number
+of rows rendered has an N+1 (a relationship lazy-loaded per row), and the
+script exits with status 1. Usage:
+
+    python benchmarks/query_counts.py
+"""
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sqlalchemy import event  # noqa: E402
+from app import create_app  # noqa: E402
+from models import db  # noqa: E402
+from league import generate_league, PASSWORD  # noqa: E402
+
+SIZES = {
+    'small': dict(teams=1, players=2, seasons=1, matches=2, trainings=2, messages=2),
+    'large': dict(teams=4, players=30, seasons=2, matches=10, trainings=15, messages=30),
+}
+
+# (όνομα, ρόλος, url από τα ids του league)
+ROUTES = [
+    ('dashboard (admin)', 'admin', lambda ids: '/dashboard'),
+    ('dashboard (coach)', 'coach', lambda ids: '/dashboard'),
+    ('dashboard (player)', 'player', lambda ids: '/dashboard'),
+    ('coach_trainings', 'coach', lambda ids: '/coach/trainings'),
+    ('player_trainings', 'player', lambda ids: '/player/trainings'),
+    ('team_players', 'coach', lambda ids: f"/team/{ids['team_id']}/players"),
+    ('coach_players', 'coach', lambda ids: '/coach/players'),
+    ('coach_chat_list', 'coach', lambda ids: '/coach/chat'),
+    ('chat', 'coach', lambda ids: f"/message/chat/{ids['player_user_id']}"),
+    ('inbox (coach)', 'coach', lambda ids: '/messages'),
+    ('inbox (player)', 'player', lambda ids: '/messages'),
+    ('api_inbox', 'player', lambda ids: '/api/chat/inbox'),
+    ('player_detail', 'coach', lambda ids: f"/player/{ids['player_id']}"),
+]
+
+
+def query_counts(size):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tmp, 'counts.db'),
+            'WTF_CSRF_ENABLED': False,
+            'TRAINING_CLEANUP_INTERVAL': 0,
+        })
+        with app.app_context():
+            db.create_all()
+            ids = generate_league(**size)
+            # Όλες οι ομάδες στον ίδιο coach, ώστε οι λίστες του να μεγαλώνουν με το league
+            db.session.execute(db.text("UPDATE team SET coach_id = :c"), {'c': ids['coach_user_id']})
+            db.session.commit()
+            engine = db.engine
+
+        statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *a: statements.append(1))
+
+        clients = {}
+        for role in ('admin', 'coach', 'player'):
+            clients[role] = app.test_client()
+            clients[role].post('/login', data={'username': ids[role], 'password': PASSWORD})
+
+        counts = {}
+        for name, role, url_for_ids in ROUTES:
+            url = url_for_ids(ids)
+            clients[role].get(url)  # warm-up (identity στο session)
+            statements.clear()
+            assert clients[role].get(url).status_code == 200, f"{name}: {url}"
+            counts[name] = len(statements)
+
+        engine.dispose()
+    return counts
+
+
+def main():
+    results = {size: query_counts(args) for size, args in SIZES.items()}
+
+    failed = False
+    print(f"{'route':<22}{'small':>7}{'large':>7}")
+    for name, _, _ in ROUTES:
+        small, large = results['small'][name], results['large'][name]
+        status = '' if small == large else '  N+1: grows with the data'
+        failed = failed or small != large
+        print(f"{name:<22}{small:>7}{large:>7}{status}")
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
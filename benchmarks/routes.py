@@ -0,0 +1,137 @@
+"""Route load benchmark: latency, query count and peak memory per route.
+
+Generates a synthetic league (benchmarks/league.py) into a temporary
+SQLite file for each scale factor, then drives the Flask test client
+through the main pages and chart APIs. Timing runs without tracing; peak
+memory comes from one extra traced request per route. Usage:
+
+    python benchmarks/routes.py [--requests 50] [--scale 1 --scale 4] [--json out.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sqlalchemy import event  # noqa: E402
+from app import create_app  # noqa: E402
+from models import db  # noqa: E402
+from league import generate_league, PASSWORD  # noqa: E402
+
+# (όνομα, ρόλος που κάνει το request, url από τα ids του league)
+ROUTES = [
+    ('dashboard (admin)', 'admin', lambda ids: '/dashboard'),
+    ('dashboard (coach)', 'coach', lambda ids: '/dashboard'),
+    ('dashboard (player)', 'player', lambda ids: '/dashboard'),
+    ('player_detail', 'coach', lambda ids: f"/player/{ids['player_id']}"),
+    ('team_players', 'coach', lambda ids: f"/team/{ids['team_id']}/players"),
+    ('chat', 'coach', lambda ids: f"/message/chat/{ids['player_user_id']}"),
+    ('api player performance', 'coach', lambda ids: f"/api/player/{ids['player_id']}/performance"),
+    ('api team performance', 'coach', lambda ids: f"/api/team/{ids['team_id']}/performance"),
+    ('api team performance (month)', 'coach',
+     lambda ids: f"/api/team/{ids['team_id']}/performance?bucket=month"),
+    ('api team attendance', 'coach', lambda ids: f"/api/team/{ids['team_id']}/attendance"),
+    ('api player attendance', 'player', lambda ids: f"/api/player/{ids['player_id']}/attendance"),
+]
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(p / 100 * (len(ordered) - 1)))]
+
+
+def run_scale(scale, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tmp, 'bench.db'),
+            'WTF_CSRF_ENABLED': False,
+            'TRAINING_CLEANUP_INTERVAL': 0,
+            'CHART_CACHE_BACKEND': args.cache_backend,
+        })
+
+        with app.app_context():
+            db.create_all()
+            t0 = time.perf_counter()
+            ids = generate_league(
+                teams=args.teams * scale, players=args.players, seasons=args.seasons,
+                matches=args.matches, trainings=args.trainings, messages=args.messages
+            )
+            generate_s = time.perf_counter() - t0
+            engine = db.engine
+
+        queries = []
+        event.listen(engine, 'before_cursor_execute', lambda *a: queries.append(1))
+
+        clients = {}
+        for role in ('admin', 'coach', 'player'):
+            client = app.test_client()
+            r = client.post('/login', data={'username': ids[role], 'password': PASSWORD})
+            assert r.status_code == 302, f"login as {role} failed"
+            clients[role] = client
+
+        results = []
+        for name, role, url_for_ids in ROUTES:
+            client, url = clients[role], url_for_ids(ids)
+            assert client.get(url).status_code == 200, f"{name}: {url}"  # warm-up
+
+            latencies = []
+            queries.clear()
+            for _ in range(args.requests):
+                t0 = time.perf_counter()
+                client.get(url)
+                latencies.append((time.perf_counter() - t0) * 1000)
+            query_count = len(queries) / args.requests
+
+            tracemalloc.start()
+            client.get(url)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            results.append({
+                'route': name, 'url': url,
+                'p50_ms': statistics.median(latencies), 'p99_ms': percentile(latencies, 99),
+                'queries': query_count, 'peak_kib': peak / 1024
+            })
+
+        engine.dispose()
+
+    return {'scale': scale, 'generate_s': generate_s, 'counts': ids['counts'], 'routes': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=50, help='timed requests per route')
+    parser.add_argument('--scale', type=int, action='append', help='multiplies --teams (repeatable)')
+    parser.add_argument('--teams', type=int, default=10)
+    parser.add_argument('--players', type=int, default=25, help='players per team')
+    parser.add_argument('--seasons', type=int, default=3)
+    parser.add_argument('--matches', type=int, default=30, help='matches per season')
+    parser.add_argument('--trainings', type=int, default=40, help='trainings per team and season')
+    parser.add_argument('--messages', type=int, default=20, help='messages per coach/player thread')
+    parser.add_argument('--cache-backend', default='none', help='CHART_CACHE_BACKEND during the run')
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args()
+
+    report = [run_scale(scale, args) for scale in args.scale or [1]]
+
+    for run in report:
+        counts = ', '.join(f"{k}={v}" for k, v in run['counts'].items())
+        print(f"\nscale {run['scale']}: {counts} (generated in {run['generate_s']:.1f}s)")
+        print(f"{'route':<32}{'p50 ms':>10}{'p99 ms':>10}{'queries':>10}{'peak KiB':>11}")
+        for r in run['routes']:
+            print(f"{r['route']:<32}{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}"
+                  f"{r['queries']:>10.1f}{r['peak_kib']:>11.0f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
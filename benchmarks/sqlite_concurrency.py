@@ -0,0 +1,143 @@
+"""SQLite concurrency check: do readers and writers wait on each other?
+
+Runs the same workload twice, once with SQLite's defaults (rollback
+journal) and once with the SQLITE_PRAGMAS profile (WAL):
+
+- an admin streams the league-wide CSV export slowly, which keeps a read
+  cursor open;
+- a writer commits small batches of stats, as coaches entering matches do;
+- reader threads request the player chart API.
+
+For each profile the script reports reader and writer latency and the
+"database is locked" failures. Usage:
+
+    python benchmarks/sqlite_concurrency.py [--seconds 5] [--readers 4]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from app import create_app  # noqa: E402
+from config import Config  # noqa: E402
+from models import db, Performance  # noqa: E402
+from league import generate_league, PASSWORD  # noqa: E402
+
+PROFILES = {
+    'default (rollback journal)': {'busy_timeout': 1000},
+    'tuned (SQLITE_PRAGMAS)': dict(Config.SQLITE_PRAGMAS, busy_timeout=1000),
+}
+
+
+def run(pragmas, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(tmp, 'bench.db'),
+            'SQLITE_PRAGMAS': pragmas,
+            'WTF_CSRF_ENABLED': False,
+            'TRAINING_CLEANUP_INTERVAL': 0,
+            'CHART_CACHE_BACKEND': 'none',
+        })
+        # Τα "database is locked" μετριούνται, δεν τυπώνονται
+        app.logger.disabled = True
+        with app.app_context():
+            db.create_all()
+            ids = generate_league(teams=4, players=20, seasons=3, matches=38)
+
+        stop = threading.Event()
+        reads, writes, failures = [], [], {'read': 0, 'write': 0}
+
+        def writer():
+            with app.app_context():
+                rows = [{'player_id': ids['player_id'], 'date': date(2020, 1, 1), 'rating': 5}] * args.batch
+                while not stop.is_set():
+                    t0 = time.perf_counter()
+                    try:
+                        db.session.execute(insert(Performance), rows)
+                        db.session.commit()
+                    except OperationalError:
+                        db.session.rollback()
+                        failures['write'] += 1
+                    writes.append((time.perf_counter() - t0) * 1000)
+                    time.sleep(0.02)
+
+        def reader():
+            client = app.test_client()
+            client.post('/login', data={'username': ids['coach'], 'password': PASSWORD})
+            url = f"/api/player/{ids['player_id']}/performance"
+            while not stop.is_set():
+                t0 = time.perf_counter()
+                try:
+                    ok = client.get(url).status_code == 200
+                except OperationalError:
+                    ok = False
+                reads.append((time.perf_counter() - t0) * 1000)
+                if not ok:
+                    failures['read'] += 1
+
+        def exporter():
+            client = app.test_client()
+            client.post('/login', data={'username': ids['admin'], 'password': PASSWORD})
+            while not stop.is_set():
+                response = client.get('/export/performance.csv', buffered=False)
+                for _ in response.response:
+                    time.sleep(0.05)
+                response.close()
+
+        threads = [threading.Thread(target=writer), threading.Thread(target=exporter)] + [
+            threading.Thread(target=reader) for _ in range(args.readers)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(args.seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+
+        with app.app_context():
+            db.engine.dispose()
+
+    return {
+        'reads': _summary(reads, failures['read']),
+        'writes': _summary(writes, failures['write']),
+    }
+
+
+def _summary(latencies, failed):
+    latencies = sorted(latencies) or [0.0]
+    return {
+        'count': len(latencies),
+        'failed': failed,
+        'p50': statistics.median(latencies),
+        'p99': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        'max': latencies[-1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--batch', type=int, default=20, help='rows per writer commit')
+    args = parser.parse_args()
+
+    print(f"{'profile':<28}{'op':<7}{'count':>7}{'failed':>8}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for name, pragmas in PROFILES.items():
+        result = run(pragmas, args)
+        for op in ('reads', 'writes'):
+            r = result[op]
+            print(f"{name:<28}{op:<7}{r['count']:>7}{r['failed']:>8}{r['p50']:>9.1f}"
+                  f"{r['p99']:>9.1f}{r['max']:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,8 @@
+from blueprints import main, auth, admin, coach, player, chat, api, metrics
+
+BLUEPRINTS = (main.bp, auth.bp, admin.bp, coach.bp, player.bp, chat.bp, api.bp, metrics.bp)
+
+
+def register_blueprints(app):
+    for bp in BLUEPRINTS:
+        app.register_blueprint(bp)
@@ -0,0 +1,140 @@
+from flask import Blueprint, current_app, render_template, redirect, url_for, flash, request
+from flask_login import current_user, login_required
+from models import db, User, Player
+from deletion import delete_user
+from cache import invalidate_team
+from identity import invalidate_identity
+from leaderboard import invalidate_leaderboards
+from instrumentation import endpoint_stats, reset_stats
+from notifications import notify_approved
+
+bp = Blueprint('admin', __name__)
+
+
+# ---------------- APPROVE / REJECT ----------------
+@bp.route('/approve/<int:user_id>', methods=['POST'])
+@login_required
+def approve(user_id):
+    if current_user.role != 'admin':
+        flash('Unauthorized', 'danger')
+        return redirect(url_for('main.dashboard'))
+
+    user = User.query.get_or_404(user_id)
+    user.approved = 1
+    db.session.commit()
+
+    # === AUTO-CREATE OR LINK PLAYER PROFILE IF ROLE = "player" ===
+    if user.role == "player":
+
+        existing_player = Player.query.filter_by(
+            name=user.username,
+            user_id=None   # 👈 ΜΟΝΟ unregistered
+        ).first()
+
+        if existing_player:
+            # 🔗 ΣΥΝΔΕΣΗ υπάρχοντος player με user
+            existing_player.user_id = user.id
+            db.session.commit()
+
+        else:
+            # ➕ Δημιουργία νέου player
+            new_player = Player(
+                name=user.username,
+                age=0,
+                position="Unknown",
+                team_id=None,
+                user_id=user.id
+            )
+            db.session.add(new_player)
+            db.session.commit()
+
+    invalidate_identity(user.id)
+    notify_approved(user)
+
+    flash(f"Ο χρήστης {user.username} εγκρίθηκε.", "success")
+    return redirect(url_for('main.dashboard'))
+
+
+
+@bp.route('/reject/<int:user_id>', methods=['POST'])
+@login_required
+def reject(user_id):
+    if current_user.role != 'admin':
+        flash('Unauthorized', 'danger')
+        return redirect(url_for('main.dashboard'))
+
+    User.query.get_or_404(user_id)
+    report = delete_user(user_id)
+    invalidate_team(*report["team_ids"])
+    invalidate_leaderboards()
+    invalidate_identity(*report["user_ids"])
+
+    flash("Ο χρήστης απορρίφθηκε και διαγράφηκε.", "warning")
+    return redirect(url_for('main.dashboard'))
+
+
+# ---------------- ADMIN DELETE USER ----------------
+DELETE_LABELS = {
+    'teams': 'ομάδες',
+    'trainings': 'προπονήσεις',
+    'attendance': 'παρουσίες',
+    'players_unassigned': 'παίκτες χωρίς ομάδα',
+    'players_deleted': 'προφίλ παίκτη',
+    'performances': 'αγώνες',
+    'season_stats': 'σύνολα σεζόν',
+    'conversations': 'συνομιλίες',
+    'messages': 'μηνύματα',
+}
+
+
+@bp.route('/admin/delete_user/<int:user_id>', methods=['POST'])
+@login_required
+def admin_delete_user(user_id):
+    if current_user.role != 'admin':
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    user = User.query.get_or_404(user_id)
+
+    if user.username == "admin":
+        flash("Δεν μπορείς να διαγράψεις τον admin.", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    dry_run = request.args.get('dry_run', type=int) == 1
+    report = delete_user(user.id, dry_run=dry_run)
+    summary = ", ".join(
+        f"{DELETE_LABELS[step]}: {n}" for step, n in report["counts"].items()
+        if n and step in DELETE_LABELS
+    ) or "καμία εξαρτημένη εγγραφή"
+
+    if dry_run:
+        flash(f"Η διαγραφή του {user.username} θα επηρεάσει: {summary}.", "info")
+        return redirect(url_for('main.dashboard'))
+
+    invalidate_team(*report["team_ids"])
+    invalidate_leaderboards()
+    invalidate_identity(*report["user_ids"])
+
+    flash(f"Ο χρήστης διαγράφηκε επιτυχώς ({summary}).", "success")
+    return redirect(url_for('main.dashboard'))
+
+
+# ---------------- ADMIN METRICS ----------------
+@bp.route('/admin/metrics', methods=['GET', 'POST'])
+@login_required
+def admin_metrics():
+    if current_user.role != 'admin':
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    if request.method == 'POST':
+        reset_stats()
+        flash("Τα στατιστικά μηδενίστηκαν.", "info")
+        return redirect(url_for('admin.admin_metrics'))
+
+    return render_template(
+        'admin_metrics.html',
+        enabled=current_app.config['SQL_INSTRUMENTATION'],
+        slow_query_ms=current_app.config['SLOW_QUERY_MS'],
+        stats=endpoint_stats()
+    )
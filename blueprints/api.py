@@ -0,0 +1,136 @@
+from datetime import date
+from flask import Blueprint, request
+from flask_login import login_required
+from models import Team
+from aggregates import player_totals, player_rating_series, team_performance_series, CAREER
+from analytics import team_form, player_form, DEFAULT_ALPHA
+from attendance import team_attendance, player_attendance
+from cache import cached_json
+from leaderboard import leaderboards
+
+bp = Blueprint('api', __name__)
+
+
+# ---------------------- API PLAYER PERFORMANCE ----------------------
+@bp.route('/api/player/<int:player_id>/performance')
+@login_required
+def api_player_performance(player_id):
+
+    return cached_json(
+        f"player:{player_id}",
+        "performance",
+        lambda: player_rating_series(player_id)
+    )
+
+
+# ---------------------- API PLAYER TOTALS ----------------------
+@bp.route('/api/player/<int:player_id>/totals')
+@login_required
+def api_player_totals(player_id):
+
+    season = request.args.get("season", CAREER)
+    return player_totals(player_id, season)
+
+
+# ---------------------- API ROUTE FOR TEAM PERFORMANCE ----------------------
+@bp.route('/api/team/<int:team_id>/performance')
+@login_required
+def api_team_performance(team_id):
+
+    team = Team.query.get(team_id)
+    if not team:
+        return {"error": "Team not found"}, 404
+
+    start = request.args.get("from", type=date.fromisoformat)
+    end = request.args.get("to", type=date.fromisoformat)
+    bucket = request.args.get("bucket", "match")
+
+    try:
+        return cached_json(
+            f"team:{team_id}",
+            f"performance:{bucket}:{start}:{end}",
+            lambda: team_performance_series(team_id, start=start, end=end, bucket=bucket)
+        )
+    except ValueError as e:
+        return {"error": str(e)}, 400
+
+
+# ---------------------- API FORM (rolling / EWM) ----------------------
+@bp.route('/api/team/<int:team_id>/form')
+@login_required
+def api_team_form(team_id):
+
+    team = Team.query.get(team_id)
+    if not team:
+        return {"error": "Team not found"}, 404
+
+    start = request.args.get("from", type=date.fromisoformat)
+    end = request.args.get("to", type=date.fromisoformat)
+    alpha = request.args.get("alpha", DEFAULT_ALPHA, type=float)
+
+    try:
+        return cached_json(
+            f"team:{team_id}",
+            f"form:{alpha}:{start}:{end}",
+            lambda: team_form(team_id, start=start, end=end, alpha=alpha)
+        )
+    except ValueError as e:
+        return {"error": str(e)}, 400
+
+
+@bp.route('/api/player/<int:player_id>/form')
+@login_required
+def api_player_form(player_id):
+
+    start = request.args.get("from", type=date.fromisoformat)
+    end = request.args.get("to", type=date.fromisoformat)
+    alpha = request.args.get("alpha", DEFAULT_ALPHA, type=float)
+
+    try:
+        return cached_json(
+            f"player:{player_id}",
+            f"form:{alpha}:{start}:{end}",
+            lambda: player_form(player_id, start=start, end=end, alpha=alpha)
+        )
+    except ValueError as e:
+        return {"error": str(e)}, 400
+
+
+# ---------------------- API LEADERBOARD ----------------------
+@bp.route('/api/leaderboard/<metric>')
+@login_required
+def api_leaderboard(metric):
+
+    try:
+        return leaderboards().top(
+            metric,
+            season=request.args.get("season", CAREER),
+            team_id=request.args.get("team", type=int),
+            min_apps=request.args.get("min_apps", 1, type=int),
+            limit=request.args.get("limit", 20, type=int)
+        )
+    except ValueError as e:
+        return {"error": str(e)}, 400
+
+
+# ---------------------- API TRAINING ATTENDANCE ----------------------
+@bp.route('/api/team/<int:team_id>/attendance')
+@login_required
+def api_team_attendance(team_id):
+
+    team = Team.query.get(team_id)
+    if not team:
+        return {"error": "Team not found"}, 404
+
+    start = request.args.get("from", type=date.fromisoformat)
+    end = request.args.get("to", type=date.fromisoformat)
+    return team_attendance(team_id, start=start, end=end)
+
+
+@bp.route('/api/player/<int:player_id>/attendance')
+@login_required
+def api_player_attendance(player_id):
+
+    start = request.args.get("from", type=date.fromisoformat)
+    end = request.args.get("to", type=date.fromisoformat)
+    return player_attendance(player_id, start=start, end=end)
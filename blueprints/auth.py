@@ -0,0 +1,72 @@
+from flask import Blueprint, render_template, redirect, url_for, flash
+from flask_login import current_user, login_user, logout_user, login_required
+from forms import RegistrationForm, LoginForm
+from identity import forget_identity
+from models import db, User
+from passwords import hash_password, verify_password, needs_rehash
+
+bp = Blueprint('auth', __name__)
+
+
+# -------- REGISTER --------
+@bp.route('/register', methods=['GET', 'POST'])
+def register():
+    if current_user.is_authenticated:
+        return redirect(url_for('main.dashboard'))
+
+    form = RegistrationForm()
+    if form.validate_on_submit():
+        if User.query.filter(
+            (User.username == form.username.data) |
+            (User.email == form.email.data)
+        ).first():
+            flash('Username ή email υπάρχει ήδη.', 'danger')
+        else:
+            user = User(
+                username=form.username.data,
+                email=form.email.data,
+                password_hash=hash_password(form.password.data),
+                role=form.role.data,
+                approved=0
+            )
+            db.session.add(user)
+            db.session.commit()
+            flash('Η εγγραφή υποβλήθηκε. Περιμένει έγκριση από admin.', 'info')
+            return redirect(url_for('auth.login'))
+
+    return render_template('register.html', form=form)
+
+
+# -------- LOGIN --------
+@bp.route('/login', methods=['GET','POST'])
+def login():
+    if current_user.is_authenticated:
+        return redirect(url_for('main.dashboard'))
+
+    form = LoginForm()
+    if form.validate_on_submit():
+        user = User.query.filter_by(username=form.username.data).first()
+
+        if user and verify_password(user.password_hash, form.password.data):
+            if user.approved:
+                # Παλιός αλγόριθμος/κόστος: ξανα-hash με την τρέχουσα πολιτική
+                if needs_rehash(user.password_hash):
+                    user.password_hash = hash_password(form.password.data)
+                    db.session.commit()
+                login_user(user)
+                return redirect(url_for('main.dashboard'))
+            else:
+                flash('Ο λογαριασμός σου περιμένει έγκριση από admin.', 'warning')
+        else:
+            flash('Λάθος στοιχεία σύνδεσης.', 'danger')
+
+    return render_template('login.html', form=form)
+
+
+# -------- LOGOUT --------
+@bp.route('/logout')
+@login_required
+def logout():
+    logout_user()
+    forget_identity()
+    return redirect(url_for('main.index'))
@@ -0,0 +1,125 @@
+from flask import Blueprint, Response, current_app, render_template, redirect, url_for, request
+from flask_login import current_user, login_required
+from models import db, User, Team, Message
+from notifications import notify_message
+from listings import chat_players_for_coach
+from messaging import (
+    latest_messages, messages_since, message_to_dict, sse_stream,
+    record_message, mark_read, inbox, summary_to_dict
+)
+
+bp = Blueprint('chat', __name__)
+
+
+# ---------------- CHAT ----------------
+@bp.route('/message/chat/<int:user_id>', methods=['GET','POST'])
+@login_required
+def chat(user_id):
+
+    user = User.query.get_or_404(user_id)
+
+    if request.method == 'POST':
+        content = request.form.get("content", "").strip()
+
+        if content:
+            msg = Message(
+                sender_id=current_user.id,
+                receiver_id=user_id,
+                content=content
+            )
+            db.session.add(msg)
+            db.session.flush()
+            record_message(msg)
+            db.session.commit()
+            notify_message(msg, current_user.username)
+
+        return redirect(url_for('chat.chat', user_id=user_id))
+
+    try:
+        messages, older_cursor = latest_messages(
+            current_user.id, user_id, before=request.args.get("before")
+        )
+    except ValueError:
+        return redirect(url_for('chat.chat', user_id=user_id))
+
+    mark_read(current_user.id, user_id)
+
+    return render_template(
+        'chat.html',
+        messages=messages,
+        older_cursor=older_cursor,
+        user=user
+    )
+
+
+# ---------------- CHAT: ΝΕΑ ΜΗΝΥΜΑΤΑ (POLLING) ----------------
+@bp.route('/api/chat/<int:user_id>/messages')
+@login_required
+def api_chat_messages(user_id):
+
+    since = request.args.get("since", 0, type=int)
+    messages = messages_since(current_user.id, user_id, since)
+
+    # Ό,τι φτάνει στο ανοιχτό chat θεωρείται διαβασμένο
+    if any(m.sender_id == user_id for m in messages):
+        mark_read(current_user.id, user_id)
+
+    return {"messages": [message_to_dict(m) for m in messages]}
+
+
+@bp.route('/api/chat/<int:user_id>/read', methods=['POST'])
+@login_required
+def api_chat_read(user_id):
+
+    # Μηνύματα που ήρθαν από το SSE stream στο ανοιχτό chat
+    return {"read": mark_read(current_user.id, user_id)}
+
+
+# ---------------- INBOX ----------------
+@bp.route('/messages')
+@login_required
+def inbox_page():
+
+    players, coach = [], None
+    if current_user.role == 'coach':
+        players = chat_players_for_coach(current_user.id).all()
+    elif current_user.role == 'player' and current_user.player_team_id:
+        coach = (
+            User.query
+            .join(Team, Team.coach_id == User.id)
+            .filter(Team.id == current_user.player_team_id)
+            .first()
+        )
+
+    return render_template(
+        'messages.html',
+        chats=inbox(current_user.id).all(),
+        players=players,
+        coach=coach
+    )
+
+
+@bp.route('/api/chat/inbox')
+@login_required
+def api_inbox():
+
+    chats = inbox(current_user.id).all()
+    return {
+        "unread": sum(c.unread for c in chats),
+        "conversations": [summary_to_dict(c) for c in chats]
+    }
+
+
+# ---------------- CHAT: SSE STREAM ----------------
+@bp.route('/api/chat/stream')
+@login_required
+def api_chat_stream():
+
+    return Response(
+        sse_stream(current_user.id, timeout=current_app.config['CHAT_STREAM_TIMEOUT']),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
@@ -0,0 +1,388 @@
+from flask import (
+    Blueprint, Response, current_app, render_template, redirect, url_for, flash, request,
+    stream_with_context
+)
+from flask_login import current_user, login_required
+from forms import TeamForm, PlayerForm, StatForm, TrainingForm
+from models import db, Team, Player, Performance, Training
+from aggregates import record_performance
+from attendance import record_attendance
+from cache import invalidate_player, invalidate_team, invalidate_imported
+from exporter import export_rows, parquet_available, FORMATS
+from identity import invalidate_identity
+from leaderboard import leaderboards, bump_leaderboards, invalidate_leaderboards
+from importer import import_stats, iter_rows, format_for, player_lookup
+from listings import trainings_for_coach, chat_players_for_coach, free_agents, team_roster
+from maintenance import training_cutoff
+from notifications import notify_training
+
+bp = Blueprint('coach', __name__)
+
+
+# ---------------- PLAYER TEAM ASSIGNMENT ----------------
+@bp.route('/coach/assign/<int:player_id>', methods=['GET', 'POST'])
+@login_required
+def coach_assign_player(player_id):
+    if current_user.role != "coach":
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    player = Player.query.get_or_404(player_id)
+    teams = Team.query.filter_by(coach_id=current_user.id).all()
+
+    if request.method == "POST":
+        new_team_id = request.form.get("team_id", type=int)
+
+        # Έλεγχος αν η ομάδα όντως ανήκει στον coach
+        team = next((t for t in teams if t.id == new_team_id), None)
+
+        if not team:
+            flash("Δεν μπορείς να αναθέσεις παίκτη σε αυτή την ομάδα.", "danger")
+            return redirect(url_for('coach.coach_assign_player', player_id=player.id))
+
+        old_team_id = player.team_id
+        player.team_id = team.id
+        db.session.commit()
+        invalidate_team(old_team_id, team.id)
+        invalidate_leaderboards()
+        invalidate_identity(player.user_id)
+
+        flash(f"Ο παίκτης {player.name} προστέθηκε στην ομάδα {team.name}.", "success")
+        return redirect(url_for('main.dashboard'))
+
+    return render_template("assign_player.html", player=player, teams=teams)
+
+
+# ---------------- EMFANISH PAIXTON ----------------
+@bp.route('/coach/players')
+@login_required
+def coach_players():
+    if current_user.role != "coach":
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    # Παίκτες που ΔΕΝ έχουν team_id
+    available_players = free_agents().all()
+
+    return render_template("coach_players.html", players=available_players)
+
+
+# ---------------- ADD TEAM ----------------
+@bp.route('/team/add', methods=['GET','POST'])
+@login_required
+def add_team():
+
+    if current_user.role != 'coach':
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    form = TeamForm()
+
+    if form.validate_on_submit():
+
+        # === UNIQUE TEAM NAME BETWEEN COACHES ===
+        existing_team = Team.query.filter_by(name=form.name.data).first()
+        if existing_team and existing_team.coach_id != current_user.id:
+            flash("Υπάρχει ήδη ομάδα με αυτό το όνομα από άλλον προπονητή.", "danger")
+            return redirect(url_for('coach.add_team'))
+
+        # === Προαιρετικό: να μην κάνει ο ίδιος coach 2 φορές ίδια ομάδα ===
+        same_coach_team = Team.query.filter_by(
+            name=form.name.data,
+            coach_id=current_user.id
+        ).first()
+        if same_coach_team:
+            flash("Έχεις ήδη ομάδα με αυτό το όνομα.", "warning")
+            return redirect(url_for('coach.add_team'))
+
+        team = Team(
+            name=form.name.data,
+            season=form.season.data,
+            coach_id=current_user.id
+        )
+        db.session.add(team)
+        db.session.commit()
+        invalidate_identity(current_user.id)
+
+        flash("Η ομάδα δημιουργήθηκε επιτυχώς.", "success")
+        return redirect(url_for('main.dashboard'))
+
+    return render_template('add_team.html', form=form)
+
+
+# ---------------- TEAM PLAYERS LIST ----------------
+@bp.route('/team/<int:team_id>/players')
+@login_required
+def team_players(team_id):
+
+    team = Team.query.get_or_404(team_id)
+
+    if not (
+        current_user.role == 'admin' or
+        (current_user.role == 'coach' and team.coach_id == current_user.id)
+    ):
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    players = team_roster(team_id).all()
+
+    return render_template('team_players.html', team=team, players=players)
+
+
+# ---------------- ADD PLAYER ----------------
+@bp.route('/player/add', methods=['GET', 'POST'])
+@login_required
+def add_player():
+
+    if current_user.role != 'coach':
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    form = PlayerForm()
+
+    teams = Team.query.filter_by(coach_id=current_user.id).all()
+    form.team.choices = [(t.id, t.name) for t in teams]
+
+    if form.validate_on_submit():
+
+        # 🔍 Έλεγχος: υπάρχει ήδη Player με ίδιο όνομα;
+        existing_player = Player.query.filter_by(
+            name=form.name.data
+        ).first()
+
+        if existing_player:
+            flash(
+                "Ο παίκτης υπάρχει ήδη. "
+                "Αν δεν έχει ομάδα, πρόσθεσέ τον από τους Available Players.",
+                "warning"
+            )
+            return redirect(url_for('coach.coach_players'))
+
+        # ✅ Δημιουργία ΝΕΟΥ unregistered player
+        player = Player(
+            name=form.name.data,
+            position=form.position.data,
+            age=form.age.data,
+            team_id=form.team.data,
+            user_id=None  # 👈 ξεκάθαρα unregistered
+        )
+
+        db.session.add(player)
+        db.session.commit()
+
+        flash("Ο παίκτης προστέθηκε επιτυχώς.", "success")
+        return redirect(url_for('main.dashboard'))
+
+    return render_template('add_player.html', form=form)
+
+
+# ---------------- COACH REMOVE PLAYER ----------------
+
+@bp.route('/coach/remove_player/<int:player_id>', methods=['POST'])
+@login_required
+def coach_remove_player(player_id):
+    if current_user.role != "coach":
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    player = Player.query.get_or_404(player_id)
+
+    # Επιτρέπεται ΜΟΝΟ για παίκτες της δικής του ομάδας
+    team_id = player.team_id
+
+    if not current_user.owns_team(team_id):
+        flash("Δεν έχεις δικαίωμα να αφαιρέσεις αυτόν τον παίκτη.", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    # 🔥 Βγάζουμε τον παίκτη από την ομάδα!
+    player.team_id = None
+    db.session.commit()
+    invalidate_team(team_id)
+    invalidate_leaderboards()
+    invalidate_identity(player.user_id)
+
+    flash(f"Ο παίκτης {player.name} μεταφέρθηκε στους Available Players.", "success")
+
+    return redirect(url_for('coach.team_players', team_id=team_id))
+
+
+# ---------------- COACH ADD STATS ----------------
+@bp.route('/coach/add_stats/<int:player_id>', methods=['GET', 'POST'])
+@login_required
+def add_stats(player_id):
+    if current_user.role != "coach":
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    player = Player.query.get_or_404(player_id)
+
+    # Ο coach πρέπει να είναι προπονητής της ομάδας του παίκτη
+    if not current_user.owns_team(player.team_id):
+        flash("Δεν έχεις δικαίωμα να προσθέσεις στατιστικά σε αυτόν τον παίκτη.", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    form = StatForm()
+
+    if form.validate_on_submit():
+        perf = Performance(
+            player_id=player.id,
+            date=form.date.data,
+            goals=form.goals.data,
+            assists=form.assists.data,
+            passes_completed=form.passes_completed.data,
+            passes_attempted=form.passes_attempted.data,
+            tackles=form.tackles.data,
+            rating=form.rating.data
+        )
+
+        db.session.add(perf)
+        record_performance(perf)
+        version = bump_leaderboards()
+        db.session.commit()
+        invalidate_player(player.id, player.team_id)
+        leaderboards().record(player, perf, version)
+
+        flash("Τα στατιστικά καταχωρήθηκαν επιτυχώς!", "success")
+        return redirect(url_for('coach.team_players', team_id=player.team_id))
+
+    return render_template("add_stats.html", form=form, player=player)
+
+
+# ---------------- COACH IMPORT STATS ----------------
+@bp.route('/coach/import_stats', methods=['GET', 'POST'])
+@login_required
+def import_stats_view():
+    if current_user.role != "coach":
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    report = None
+
+    if request.method == "POST":
+        upload = request.files.get("file")
+        if not upload or not upload.filename:
+            flash("Δεν επιλέχθηκε αρχείο.", "danger")
+            return redirect(url_for('coach.import_stats_view'))
+
+        # Μόνο παίκτες των ομάδων του coach
+        report = import_stats(
+            iter_rows(upload.stream, format_for(upload.filename)),
+            player_lookup(current_user.team_ids)
+        )
+        invalidate_imported(report)
+
+    return render_template("import_stats.html", report=report)
+
+
+# ---------------- ADD TRAINING ----------------
+@bp.route('/training/add', methods=['GET', 'POST'])
+@login_required
+def add_training():
+
+    if current_user.role != 'coach':
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    form = TrainingForm()
+
+    # ---- ΠΑΡΑΛΑΒΗ ΤΟΥ team_id ΑΠΟ ΤΟ URL ----
+    preselected_team = request.args.get("team_id", type=int)
+
+    # Φόρτωση όλων των ομάδων του coach
+    teams = Team.query.filter_by(coach_id=current_user.id).all()
+    form.team_id.choices = [(t.id, t.name) for t in teams]
+
+    # ❗ Αν υπάρχει preselected team → προεπιλογή στο dropdown
+    if preselected_team and request.method != 'POST':
+        form.team_id.data = preselected_team
+
+    # Στο POST η ομάδα έρχεται από τη φόρμα· οι επιλογές πρέπει να υπάρχουν για το validate
+    selected_team = form.team_id.data if request.method == 'POST' else preselected_team
+
+    if selected_team and current_user.owns_team(selected_team):
+        # Φόρτωσε παίκτες αυτής της ομάδας
+        players = team_roster(selected_team).all()
+    else:
+        # Αν δεν έχει team_id ακόμα, δεν δείχνουμε παίκτες
+        players = []
+
+    # ❗ Δώσε τους παίκτες στο πεδίο attendance (checkboxes)
+    form.attendance.choices = [(p.id, p.name) for p in players]
+
+    # ---- SUBMIT ----
+    if form.validate_on_submit():
+        training = Training(
+            team_id=form.team_id.data,
+            date=form.date.data,
+            focus=form.focus.data,
+            duration=form.duration.data
+        )
+        db.session.add(training)
+        db.session.flush()
+        record_attendance(training, form.attendance.data)
+        db.session.commit()
+        notify_training(training, dict(form.team_id.choices)[training.team_id])
+
+        flash("Η προπόνηση προστέθηκε επιτυχώς.", "success")
+        return redirect(url_for('main.dashboard'))
+
+    return render_template('add_training.html', form=form)
+
+
+# ---------------- COACH CHAT LIST ----------------
+@bp.route('/coach/chat')
+@login_required
+def coach_chat_list():
+    if current_user.role != 'coach':
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    players = chat_players_for_coach(current_user.id).all()
+
+    return render_template('coach_chat_list.html', players=players)
+
+
+# ---------------- COACH VIEW ALL TRAININGS ----------------
+@bp.route('/coach/trainings')
+@login_required
+def coach_trainings():
+
+    if current_user.role != 'coach':
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    trainings = trainings_for_coach(
+        current_user.id, training_cutoff(current_app.config['TRAINING_RETENTION_DAYS'])
+    ).all()
+
+    return render_template('coach_trainings.html', trainings=trainings)
+
+
+# ---------------------- EXPORT (STREAMING) ----------------------
+@bp.route('/export/<kind>.<fmt>')
+@login_required
+def export_data(kind, fmt):
+
+    if current_user.role == 'admin':
+        team_ids = None
+    elif current_user.role == 'coach':
+        team_ids = list(current_user.team_ids)
+    else:
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    if fmt not in FORMATS:
+        return {"error": f"Unknown format '{fmt}'"}, 400
+    if fmt == 'parquet' and not parquet_available():
+        return {"error": "Parquet export requires pyarrow"}, 400
+    try:
+        columns, rows = export_rows(kind, team_ids)
+    except ValueError as e:
+        return {"error": str(e)}, 400
+
+    writer, mimetype = FORMATS[fmt]
+    return Response(
+        stream_with_context(writer(columns, rows)),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename={kind}.{fmt}'}
+    )
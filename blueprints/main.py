@@ -0,0 +1,60 @@
+from flask import Blueprint, render_template, redirect, url_for, flash
+from flask_login import current_user, login_required
+from models import User, Team, Player, Performance
+from aggregates import rating_series
+
+bp = Blueprint('main', __name__)
+
+
+@bp.route('/')
+def index():
+    return render_template('index.html')
+
+
+# ---------------- DASHBOARD ----------------
+@bp.route('/dashboard')
+@login_required
+def dashboard():
+
+    if current_user.role == 'admin':
+        pending = User.query.filter_by(approved=0).all()
+        all_users = User.query.filter(User.username != "admin").all()
+        teams = Team.query.order_by(Team.name).all()
+
+        return render_template(
+            'admin_dashboard.html',
+            pending=pending,
+            all_users=all_users,
+            total_teams=len(teams),
+            total_players=Player.query.count(),
+            teams=teams
+        )
+
+    elif current_user.role == 'coach':
+
+        teams = Team.query.filter_by(coach_id=current_user.id).all()
+        return render_template('coach_dashboard.html', teams=teams)
+
+    elif current_user.role == 'player':
+        player = Player.query.filter_by(user_id=current_user.id).first()
+
+        if not player:
+            flash("Δεν υπάρχει προφίλ παίκτη.", "danger")
+            return redirect(url_for('auth.logout'))
+
+        team = Team.query.get(player.team_id)
+        coach = User.query.get(team.coach_id) if team else None
+
+        performances = Performance.query.filter_by(
+            player_id=player.id
+        ).order_by(Performance.date.asc()).all()
+
+        return render_template(
+            'player_dashboard.html',
+            player=player,
+            coach=coach,
+            performances=performances,
+            chart=rating_series(performances)
+        )
+
+    return redirect(url_for('auth.logout'))
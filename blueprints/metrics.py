@@ -0,0 +1,19 @@
+import hmac
+from flask import Blueprint, Response, abort, current_app, request
+from metrics import render
+
+bp = Blueprint('metrics', __name__)
+
+
+# ---------------- PROMETHEUS SCRAPE ----------------
+@bp.route('/metrics')
+def metrics():
+    if not current_app.config['METRICS_ENABLED']:
+        abort(404)
+
+    # Με METRICS_TOKEN το scrape χρειάζεται "Authorization: Bearer <token>"
+    token = current_app.config['METRICS_TOKEN']
+    if token and not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        abort(401)
+
+    return Response(render(), mimetype='text/plain; version=0.0.4')
@@ -0,0 +1,57 @@
+from flask import Blueprint, current_app, render_template, redirect, url_for, flash
+from flask_login import current_user, login_required
+from models import Team, Player, Performance
+from aggregates import player_totals, rating_series
+from listings import trainings_for_team
+from maintenance import training_cutoff
+
+bp = Blueprint('player', __name__)
+
+
+# ---------------- PLAYER TRAININGS ----------------
+@bp.route('/player/trainings')
+@login_required
+def player_trainings():
+
+    if current_user.role != 'player':
+        flash("Unauthorized", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    if current_user.player_id is None:
+        flash("Δεν υπάρχει προφίλ παίκτη.", "danger")
+        return redirect(url_for('main.dashboard'))
+
+    trainings = trainings_for_team(
+        current_user.player_team_id,
+        training_cutoff(current_app.config['TRAINING_RETENTION_DAYS'])
+    ).all()
+
+    return render_template('player_trainings.html', trainings=trainings)
+
+
+# ---------------------- PLAYER DETAIL PAGE ----------------------
+@bp.route('/player/<int:player_id>')
+@login_required
+def player_detail(player_id):
+
+    player = Player.query.get_or_404(player_id)
+    team = Team.query.get(player.team_id)
+
+    performances = Performance.query.filter_by(
+        player_id=player.id
+    ).order_by(Performance.date.asc()).all()
+
+    # ---- TOTALS (προϋπολογισμένα στο player_season_stats) ----
+    totals = player_totals(player.id)
+
+    # Το γράφημα χτίζεται από τις ίδιες γραμμές, χωρίς δεύτερο fetch στο API
+    chart = rating_series(performances) if current_app.config['INLINE_CHART_DATA'] else None
+
+    return render_template(
+        'player_detail.html',
+        player=player,
+        team=team,
+        performances=performances,
+        totals=totals,
+        chart=chart
+    )
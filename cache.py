@@ -0,0 +1,178 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate
+from flask import request, jsonify
+
+
+# ---------------- BACKENDS ----------------
+class LRUCache:
+    """Thread-safe in-process LRU with a per-entry TTL."""
+
+    def __init__(self, maxsize=512, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        # Οι μετρητές εκδόσεων κρατιούνται χωριστά ώστε να μην εκτοπίζονται
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] < time.monotonic():
+                if item is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def version(self, key):
+        return self._versions.get(key, 0)
+
+    def incr(self, key):
+        with self._lock:
+            self._versions[key] = self._versions.get(key, 0) + 1
+            return self._versions[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class RedisCache:
+    """Same interface on top of a local Redis-compatible server (pip install redis)."""
+
+    def __init__(self, url, ttl=300, prefix='afm:'):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(raw)
+
+    def set(self, key, value):
+        self.client.set(self.prefix + key, json.dumps(value), ex=self.ttl)
+
+    def version(self, key):
+        return int(self.client.get(self.prefix + key) or 0)
+
+    def incr(self, key):
+        return self.client.incr(self.prefix + key)
+
+    def clear(self):
+        for key in self.client.scan_iter(self.prefix + '*'):
+            self.client.delete(key)
+
+
+class NullCache:
+    hits = misses = 0
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value):
+        pass
+
+    def version(self, key):
+        return 0
+
+    def incr(self, key):
+        return 0
+
+    def clear(self):
+        pass
+
+
+chart_cache = NullCache()
+
+
+def init_cache(app):
+    global chart_cache
+    backend = app.config.get('CHART_CACHE_BACKEND', 'memory')
+    ttl = app.config.get('CHART_CACHE_TTL', 300)
+
+    if backend == 'redis':
+        chart_cache = RedisCache(app.config['CHART_CACHE_URL'], ttl=ttl)
+    elif backend == 'memory':
+        chart_cache = LRUCache(app.config.get('CHART_CACHE_SIZE', 512), ttl=ttl)
+    else:
+        chart_cache = NullCache()
+    return chart_cache
+
+
+# ---------------- INVALIDATION ----------------
+# Κάθε scope ("player:3", "team:1") έχει μετρητή έκδοσης μέσα στο κλειδί.
+# Το invalidate απλώς τον αυξάνει, οπότε όλες οι παραλλαγές
+# (bucket, from/to) του scope ακυρώνονται με μία πράξη.
+def version(scope):
+    return chart_cache.version(f"v:{scope}")
+
+
+def invalidate(*scopes):
+    for scope in scopes:
+        chart_cache.incr(f"v:{scope}")
+
+
+def invalidate_player(player_id, team_id=None):
+    invalidate(f"player:{player_id}")
+    if team_id:
+        invalidate(f"team:{team_id}")
+
+
+def invalidate_team(*team_ids):
+    invalidate(*(f"team:{t}" for t in team_ids if t))
+
+
+def invalidate_imported(report):
+    invalidate(*(f"player:{p}" for p in report["player_ids"]))
+    invalidate_team(*report["team_ids"])
+
+
+# ---------------- CACHED JSON RESPONSE ----------------
+def cached_json(scope, key, compute):
+    """Serve compute() as JSON through the chart cache with ETag/Last-Modified.
+
+    Conditional requests that still match the cached entry get a 304
+    without touching the database.
+    """
+    full_key = f"{scope}:{version(scope)}:{key}"
+    entry = chart_cache.get(full_key)
+
+    if entry is None:
+        body = compute()
+        payload = json.dumps(body, sort_keys=True)
+        entry = {
+            "body": body,
+            "etag": hashlib.sha1(payload.encode()).hexdigest(),
+            "last_modified": time.time()
+        }
+        chart_cache.set(full_key, entry)
+
+    response = jsonify(entry["body"])
+    response.set_etag(entry["etag"])
+    response.headers['Last-Modified'] = formatdate(entry["last_modified"], usegmt=True)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
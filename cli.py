@@ -0,0 +1,195 @@
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from models import db, User
+from passwords import hash_password
+from aggregates import rebuild_player_totals
+from database import sqlite_settings
+from cache import invalidate_imported, invalidate_team
+from leaderboard import invalidate_leaderboards
+from deletion import delete_user
+from messaging import rebuild_conversations
+from identity import invalidate_identity
+from exporter import export_rows, FORMATS
+from importer import import_stats, iter_rows, format_for, player_lookup, IMPORT_BATCH_SIZE
+from maintenance import purge_expired_trainings
+from query_plans import full_table_scans
+
+
+# ---------------- DB INIT / SEED ----------------
+@click.command('init-db')
+@with_appcontext
+def init_db_command():
+    """Create any missing tables (new installs; use 'flask db upgrade' afterwards)."""
+    db.create_all()
+    click.echo("Database tables created.")
+
+
+@click.command('seed-admin')
+@click.option('--username', default='admin')
+@click.option('--email', default='admin@example.com')
+@click.option('--password', default='adminpass')
+@with_appcontext
+def seed_admin_command(username, email, password):
+    """Create the admin account if it does not exist yet."""
+    if User.query.filter_by(username=username).first():
+        click.echo(f"User '{username}' already exists.")
+        return
+
+    admin = User(
+        username=username,
+        email=email,
+        password_hash=hash_password(password),
+        role='admin',
+        approved=1
+    )
+    db.session.add(admin)
+    db.session.commit()
+    click.echo(f"Admin '{username}' created.")
+
+
+# ---------------- MAINTENANCE ----------------
+@click.command('rebuild-totals')
+@with_appcontext
+@click.option('--player-id', type=int, default=None, help='Rebuild only this player.')
+def rebuild_totals_command(player_id):
+    """Rebuild player season/career totals from the Performance history."""
+    written = rebuild_player_totals(player_id)
+    invalidate_leaderboards()
+    click.echo(f"Rebuilt {written} player/season total rows.")
+
+
+@click.command('rebuild-inbox')
+@with_appcontext
+def rebuild_inbox_command():
+    """Rebuild the per-conversation summaries (last message, unread) from the messages."""
+    written = rebuild_conversations()
+    click.echo(f"Rebuilt {written} conversation summaries.")
+
+
+@click.command('purge-trainings')
+@with_appcontext
+@click.option('--retention-days', type=int, default=None,
+              help='Keep trainings newer than this many days (default: TRAINING_RETENTION_DAYS).')
+def purge_trainings_command(retention_days):
+    """Bulk-delete trainings older than the retention window that have no attendance."""
+    if retention_days is None:
+        retention_days = current_app.config['TRAINING_RETENTION_DAYS']
+    deleted = purge_expired_trainings(retention_days)
+    click.echo(f"Deleted {deleted} expired trainings without attendance.")
+
+
+@click.command('import-stats')
+@with_appcontext
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'json']), default=None,
+              help='File format (default: from the extension).')
+@click.option('--batch-size', type=int, default=IMPORT_BATCH_SIZE)
+def import_stats_command(path, fmt, batch_size):
+    """Bulk-import match stats from a CSV or JSON Lines file."""
+    with open(path, 'rb') as f:
+        report = import_stats(
+            iter_rows(f, fmt or format_for(path)),
+            player_lookup(),
+            batch_size=batch_size
+        )
+    invalidate_imported(report)
+
+    for e in report["errors"]:
+        click.echo(f"line {e['line']}: {e['errors']}", err=True)
+    click.echo(f"Imported {report['imported']} rows, {len(report['errors'])} rejected.")
+    if report["aborted"]:
+        a = report["aborted"]
+        raise click.ClickException(
+            f"Stopped at line {a['line']}: {a['error']}. "
+            f"The {report['imported']} rows above were imported; fix the file and import the rest."
+        )
+
+
+@click.command('export')
+@with_appcontext
+@click.argument('kind', type=click.Choice(['performance', 'training', 'team_aggregates']))
+@click.option('--format', 'fmt', type=click.Choice(list(FORMATS)), default='csv')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), default='-',
+              help='Output file (default: stdout).')
+def export_command(kind, fmt, output):
+    """Stream performance, training or team aggregate data to CSV/Parquet."""
+    columns, rows = export_rows(kind)
+    writer = FORMATS[fmt][0]
+
+    try:
+        with click.open_file(output, 'w' if fmt == 'csv' else 'wb') as f:
+            for chunk in writer(columns, rows):
+                f.write(chunk)
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+
+
+@click.command('check-query-plans')
+@with_appcontext
+def check_query_plans_command():
+    """Fail if any route query does a full table scan (SQLite EXPLAIN QUERY PLAN)."""
+    failed = False
+    for route, (plan, scans) in full_table_scans().items():
+        status = "FULL SCAN: " + ", ".join(scans) if scans else "ok"
+        click.echo(f"{route:<35} {status}")
+        for line in plan:
+            click.echo(f"    {line}")
+        failed = failed or bool(scans)
+
+    if failed:
+        raise SystemExit(1)
+
+
+@click.command('delete-user')
+@click.argument('username')
+@click.option('--dry-run', is_flag=True, help='Only report the rows that would be affected.')
+@with_appcontext
+def delete_user_command(username, dry_run):
+    """Delete a user with set-based cascades (players of a coach are unassigned)."""
+    user = User.query.filter_by(username=username).first()
+    if user is None:
+        raise click.ClickException(f"User '{username}' not found.")
+    if user.username == 'admin':
+        raise click.ClickException("The admin account cannot be deleted.")
+
+    report = delete_user(user.id, dry_run=dry_run)
+    if not dry_run:
+        invalidate_team(*report["team_ids"])
+        invalidate_leaderboards()
+        invalidate_identity(*report["user_ids"])
+
+    click.echo(f"{'Would delete' if dry_run else 'Deleted'} '{username}':")
+    for step, rows in report["counts"].items():
+        click.echo(f"  {step:<20} {rows}")
+
+
+@click.command('sqlite-settings')
+@with_appcontext
+def sqlite_settings_command():
+    """Show the SQLITE_PRAGMAS values as the connections actually see them."""
+    if not current_app.config['SQLITE_PRAGMAS']:
+        click.echo("SQLITE_PRAGMAS is empty (SQLITE_TUNING=False): SQLite defaults.")
+        return
+
+    for name, value in sqlite_settings().items():
+        click.echo(f"{name:<15} {value}")
+
+
+COMMANDS = (
+    init_db_command,
+    seed_admin_command,
+    rebuild_totals_command,
+    rebuild_inbox_command,
+    purge_trainings_command,
+    import_stats_command,
+    export_command,
+    check_query_plans_command,
+    delete_user_command,
+    sqlite_settings_command,
+)
+
+
+def register_cli(app):
+    for command in COMMANDS:
+        app.cli.add_command(command)
@@ -0,0 +1,98 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class Config:
+    SECRET_KEY = os.environ.get('SECRET_KEY', 'replace-with-secure-secret')
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 'sqlite:///app.db')
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Connection pool (εκτός από SQLite στη μνήμη)
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 10))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 20))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+
+    # GET σε αυτά τα blueprints/routes διαβάζουν από τον replica (DATABASE_REPLICA_URL,
+    # αλλιώς read-only σύνδεση mode=ro στο ίδιο αρχείο SQLite). Οι εγγραφές πάνε στον primary.
+    DB_READ_ROUTING = os.environ.get('DB_READ_ROUTING', 'False') == 'True'
+    DATABASE_REPLICA_URL = os.environ.get('DATABASE_REPLICA_URL')
+    DB_READ_ROUTES = os.environ.get(
+        'DB_READ_ROUTES',
+        'api,main.dashboard,player.player_detail,player.player_trainings,'
+        'coach.team_players,coach.coach_players,coach.coach_trainings,coach.export_data'
+    ).split(',')
+    # Δευτερόλεπτα που ο χρήστης διαβάζει από τον primary μετά από δική του εγγραφή
+    DB_READ_STICKY_SECONDS = int(os.environ.get('DB_READ_STICKY_SECONDS', 5))
+
+    # SQLite profile: WAL ώστε οι αναγνώστες να μην περιμένουν τους writers,
+    # busy_timeout αντί για "database is locked". SQLITE_TUNING=False για τα defaults.
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', 5000)),
+        'foreign_keys': 'ON',
+        'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+        'cache_size': -int(os.environ.get('SQLITE_CACHE_KIB', 64 * 1024)),
+    } if os.environ.get('SQLITE_TUNING', 'True') == 'True' else {}
+
+    # Διατήρηση παλιών προπονήσεων (ημέρες) και διάστημα αυτόματου καθαρισμού (sec, 0 = off)
+    TRAINING_RETENTION_DAYS = int(os.environ.get('TRAINING_RETENTION_DAYS', 0))
+    TRAINING_CLEANUP_INTERVAL = int(os.environ.get('TRAINING_CLEANUP_INTERVAL', 0))
+
+    # Δευτερόλεπτα που ο χρήστης/ρόλος/ομάδες κρατιούνται στο session χωρίς query (0 = off)
+    IDENTITY_CACHE_TTL = int(os.environ.get('IDENTITY_CACHE_TTL', 60))
+
+    # True: τα δεδομένα του γραφήματος ενσωματώνονται στη σελίδα παίκτη (χωρίς fetch στο API)
+    INLINE_CHART_DATA = os.environ.get('INLINE_CHART_DATA', 'True') == 'True'
+
+    # Cache για τα chart APIs: memory | redis | none
+    CHART_CACHE_BACKEND = os.environ.get('CHART_CACHE_BACKEND', 'memory')
+    CHART_CACHE_URL = os.environ.get('CHART_CACHE_URL', 'redis://localhost:6379/0')
+    CHART_CACHE_SIZE = int(os.environ.get('CHART_CACHE_SIZE', 512))
+    CHART_CACHE_TTL = int(os.environ.get('CHART_CACHE_TTL', 300))
+
+    # Chat: μέγιστη διάρκεια (sec) ενός SSE stream πριν ο browser ξανασυνδεθεί, και κάθε πόσα
+    # sec το ανοιχτό chat ρωτά και με polling (μηνύματα που γράφτηκαν σε άλλο worker process)
+    CHAT_STREAM_TIMEOUT = int(os.environ.get('CHAT_STREAM_TIMEOUT', 300))
+    CHAT_POLL_SECONDS = int(os.environ.get('CHAT_POLL_SECONDS', 30))
+
+    # Μέγιστη ηλικία (sec) του in-process leaderboard index πριν ξαναχτιστεί από SQL (0 = χωρίς όριο)
+    LEADERBOARD_TTL = int(os.environ.get('LEADERBOARD_TTL', 300))
+
+    # Αλγόριθμος/κόστος hashing κωδικών (benchmarks/password_hash.py) και μέγιστος αριθμός
+    # hashes που τρέχουν ταυτόχρονα ανά process.
+    # Παλιά hashes αναβαθμίζονται αυτόματα στο επόμενο επιτυχές login.
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 4))
+
+    # Μέτρηση queries/χρόνου βάσης ανά request (Server-Timing, /admin/metrics) και όριο αργού query (ms)
+    SQL_INSTRUMENTATION = os.environ.get('SQL_INSTRUMENTATION', 'False') == 'True'
+    SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', 100))
+
+    # Prometheus /metrics. Με πολλά worker processes όρισε κοινό METRICS_DIR.
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'False') == 'True'
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+    METRICS_DIR = os.environ.get('METRICS_DIR')
+    METRICS_FLUSH_INTERVAL = float(os.environ.get('METRICS_FLUSH_INTERVAL', 5))
+
+    # SMTP (Flask-Mail)
+    MAIL_SERVER = os.environ.get('MAIL_SERVER', 'localhost')
+    MAIL_PORT = int(os.environ.get('MAIL_PORT', 25))
+    MAIL_USE_TLS = os.environ.get('MAIL_USE_TLS', 'False') == 'True'
+    MAIL_USE_SSL = os.environ.get('MAIL_USE_SSL', 'False') == 'True'
+    MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
+    MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
+    MAIL_DEFAULT_SENDER = os.environ.get('MAIL_DEFAULT_SENDER', 'noreply@localhost')
+
+    # Ειδοποιήσεις (έγκριση, μήνυμα, προπόνηση) μέσω ουράς στο background.
+    # Ενεργές από προεπιλογή μόνο όταν έχει οριστεί MAIL_SERVER.
+    MAIL_NOTIFICATIONS = os.environ.get(
+        'MAIL_NOTIFICATIONS', 'True' if os.environ.get('MAIL_SERVER') else 'False'
+    ) == 'True'
+    MAIL_QUEUE_BATCH_SIZE = int(os.environ.get('MAIL_QUEUE_BATCH_SIZE', 50))
+    MAIL_QUEUE_RETRIES = int(os.environ.get('MAIL_QUEUE_RETRIES', 3))
+    MAIL_QUEUE_BACKOFF = float(os.environ.get('MAIL_QUEUE_BACKOFF', 1.0))
+    MAIL_QUEUE_IDLE_TIMEOUT = float(os.environ.get('MAIL_QUEUE_IDLE_TIMEOUT', 30))
+    MAIL_QUEUE_SIZE = int(os.environ.get('MAIL_QUEUE_SIZE', 1000))
@@ -0,0 +1,71 @@
+from flask import current_app
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from models import db
+
+
+# ---------------- POOL ----------------
+def _in_memory(url):
+    url = make_url(url)
+    return url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:')
+
+
+def configure_engine_options(app):
+    """Fill SQLALCHEMY_ENGINE_OPTIONS with the DB_POOL_* settings.
+
+    Must run before db.init_app(). In-memory SQLite keeps Flask-SQLAlchemy's
+    single static connection, which takes no pool options.
+    """
+    if _in_memory(app.config['SQLALCHEMY_DATABASE_URI']):
+        return
+
+    options = app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {})
+    options.setdefault('pool_size', app.config['DB_POOL_SIZE'])
+    options.setdefault('max_overflow', app.config['DB_MAX_OVERFLOW'])
+    options.setdefault('pool_timeout', app.config['DB_POOL_TIMEOUT'])
+    options.setdefault('pool_pre_ping', True)
+
+
+# ---------------- SQLITE PRAGMAS ----------------
+def _pragma_listener(pragmas):
+    def on_connect(dbapi_conn, record):
+        cursor = dbapi_conn.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    return on_connect
+
+
+def init_sqlite(app):
+    """Apply SQLITE_PRAGMAS to every new connection of each SQLite engine."""
+    pragmas = app.config['SQLITE_PRAGMAS']
+    if not pragmas:
+        return
+
+    with app.app_context():
+        for engine in db.engines.values():
+            if engine.dialect.name != 'sqlite':
+                continue
+
+            engine_pragmas = dict(pragmas)
+            if _in_memory(engine.url):
+                # Η μνήμη δεν έχει WAL/mmap
+                engine_pragmas.pop('journal_mode', None)
+                engine_pragmas.pop('mmap_size', None)
+            elif engine.url.query.get('mode') == 'ro':
+                # Το WAL είναι μόνιμο στο αρχείο· το ορίζει η σύνδεση του primary
+                engine_pragmas.pop('journal_mode', None)
+
+            event.listen(engine, 'connect', _pragma_listener(engine_pragmas))
+
+
+def sqlite_settings():
+    """Current value of each configured pragma, read back from a pooled connection."""
+    with db.engine.connect() as conn:
+        return {
+            name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in current_app.config['SQLITE_PRAGMAS']
+        }
@@ -0,0 +1,88 @@
+from sqlalchemy import delete, func, or_, select, update
+from models import (
+    db, User, Team, Player, Performance, PlayerSeasonStats, Training, TrainingAttendance, Message,
+    ConversationSummary
+)
+
+
+# ---------------- CASCADE PLAN ----------------
+# Οι κανόνες ON DELETE του schema.sql ως set-based statements, ώστε να ισχύουν
+# και σε βάσεις που φτιάχτηκαν με create_all (χωρίς ON DELETE στα FKs):
+#   team.coach_id -> ομάδες του coach σβήνονται, με τις προπονήσεις τους (CASCADE)
+#   player.team_id -> παίκτες τους μένουν χωρίς ομάδα (SET NULL)
+#   player.user_id -> το προφίλ παίκτη σβήνεται (CASCADE), με performance/totals
+#   training_attendance -> φεύγει μαζί με την προπόνηση ή τον παίκτη (CASCADE)
+#   conversation_summary -> και οι δύο πλευρές των συνομιλιών του χρήστη (CASCADE)
+def _plan(user_id):
+    teams = select(Team.id).where(Team.coach_id == user_id).scalar_subquery()
+    players = select(Player.id).where(Player.user_id == user_id).scalar_subquery()
+    trainings = select(Training.id).where(Training.team_id.in_(teams)).scalar_subquery()
+
+    # (όνομα, πίνακας, φίλτρο, τιμές για UPDATE ή None για DELETE): 10 statements
+    return [
+        ('players_unassigned', Player, Player.team_id.in_(teams), {'team_id': None}),
+        ('attendance', TrainingAttendance,
+         or_(TrainingAttendance.training_id.in_(trainings), TrainingAttendance.player_id.in_(players)), None),
+        ('trainings', Training, Training.team_id.in_(teams), None),
+        ('teams', Team, Team.coach_id == user_id, None),
+        ('performances', Performance, Performance.player_id.in_(players), None),
+        ('season_stats', PlayerSeasonStats, PlayerSeasonStats.player_id.in_(players), None),
+        ('players_deleted', Player, Player.user_id == user_id, None),
+        ('conversations', ConversationSummary,
+         or_(ConversationSummary.user_id == user_id, ConversationSummary.peer_id == user_id), None),
+        ('messages', Message, or_(Message.sender_id == user_id, Message.receiver_id == user_id), None),
+        ('users', User, User.id == user_id, None),
+    ]
+
+
+def _affected(user_id):
+    """Teams and user accounts whose caches must be invalidated afterwards."""
+    coach_teams = [t for (t,) in db.session.query(Team.id).filter(Team.coach_id == user_id)]
+    player_teams = [
+        t for (t,) in db.session.query(Player.team_id)
+        .filter(Player.user_id == user_id, Player.team_id.isnot(None))
+    ]
+
+    # Οι παίκτες των ομάδων του coach αλλάζουν ομάδα -> ανανέωση identity
+    user_ids = [user_id]
+    if coach_teams:
+        user_ids += [
+            u for (u,) in db.session.query(Player.user_id)
+            .filter(Player.team_id.in_(coach_teams), Player.user_id.isnot(None))
+        ]
+    return coach_teams + player_teams, user_ids
+
+
+# ---------------- SERVICE ----------------
+def delete_user(user_id, dry_run=False):
+    """Delete a user and everything that depends on it in one transaction.
+
+    Runs the ten UPDATE/DELETE statements of _plan() after at most three
+    SELECTs for the affected teams and users, whatever the number of teams.
+    Returns {"counts": {step: rows}, "team_ids": [...], "user_ids": [...]}.
+    With dry_run the counts are what would be affected and nothing changes.
+    """
+    team_ids, user_ids = _affected(user_id)
+    counts = {}
+
+    try:
+        for name, model, condition, values in _plan(user_id):
+            if dry_run:
+                counts[name] = db.session.query(func.count()).select_from(model).filter(condition).scalar()
+                continue
+
+            stmt = update(model).values(**values) if values is not None else delete(model)
+            result = db.session.execute(
+                stmt.where(condition).execution_options(synchronize_session=False)
+            )
+            counts[name] = result.rowcount
+
+        if dry_run:
+            db.session.rollback()
+        else:
+            db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return {"counts": counts, "team_ids": team_ids, "user_ids": user_ids}
@@ -0,0 +1,210 @@
+import csv
+import importlib.util
+import io
+from sqlalchemy import func
+from models import db, Team, Player, Performance, Training
+from aggregates import BUCKETS, bucket_label
+
+EXPORT_YIELD_PER = 1000
+
+
+# ---------------- QUERIES (tuples, όχι ORM objects) ----------------
+def _performance_query(team_ids):
+    q = (
+        db.session.query(
+            Performance.id,
+            Performance.player_id,
+            Player.name,
+            Player.team_id,
+            Performance.date,
+            Performance.goals,
+            Performance.assists,
+            Performance.passes_completed,
+            Performance.passes_attempted,
+            Performance.pass_accuracy,
+            Performance.tackles,
+            Performance.rating
+        )
+        .join(Player, Performance.player_id == Player.id)
+        .order_by(Performance.id)
+    )
+    if team_ids is not None:
+        q = q.filter(Player.team_id.in_(team_ids))
+    return q
+
+
+def _training_query(team_ids):
+    q = (
+        db.session.query(
+            Training.id,
+            Training.team_id,
+            Team.name,
+            Training.date,
+            Training.focus,
+            Training.duration,
+            Training.attendance
+        )
+        .join(Team, Training.team_id == Team.id)
+        .order_by(Training.id)
+    )
+    if team_ids is not None:
+        q = q.filter(Training.team_id.in_(team_ids))
+    return q
+
+
+def _team_aggregates_query(team_ids):
+    season = BUCKETS['season'](Performance.date)
+    q = (
+        db.session.query(
+            Team.id,
+            Team.name,
+            season,
+            func.count(Performance.id),
+            func.round(func.avg(Performance.rating), 2),
+            func.sum(Performance.goals),
+            func.sum(Performance.assists),
+            func.sum(Performance.tackles)
+        )
+        .join(Player, Player.team_id == Team.id)
+        .join(Performance, Performance.player_id == Player.id)
+        # Χωρίς ημερομηνία δεν υπάρχει σεζόν
+        .filter(Performance.date.isnot(None))
+        .group_by(Team.id, season)
+        .order_by(Team.id, season)
+    )
+    if team_ids is not None:
+        q = q.filter(Team.id.in_(team_ids))
+    return q
+
+
+def _season_label(row):
+    row = list(row)
+    row[2] = bucket_label('season', row[2])
+    return row
+
+
+# kind -> ([(στήλη, τύπος)], query builder, μετασχηματισμός γραμμής)
+# Τύποι: 'int', 'float', 'str', 'date' (δίνουν το schema του Parquet)
+EXPORTS = {
+    'performance': (
+        [('id', 'int'), ('player_id', 'int'), ('player', 'str'), ('team_id', 'int'),
+         ('date', 'date'), ('goals', 'int'), ('assists', 'int'), ('passes_completed', 'int'),
+         ('passes_attempted', 'int'), ('pass_accuracy', 'float'), ('tackles', 'int'),
+         ('rating', 'float')],
+        _performance_query,
+        None
+    ),
+    'training': (
+        [('id', 'int'), ('team_id', 'int'), ('team', 'str'), ('date', 'date'), ('focus', 'str'),
+         ('duration', 'int'), ('attendance', 'int')],
+        _training_query,
+        None
+    ),
+    'team_aggregates': (
+        [('team_id', 'int'), ('team', 'str'), ('season', 'str'), ('appearances', 'int'),
+         ('avg_rating', 'float'), ('goals', 'int'), ('assists', 'int'), ('tackles', 'int')],
+        _team_aggregates_query,
+        _season_label
+    ),
+}
+
+
+def export_rows(kind, team_ids=None):
+    """(columns, row iterator) streamed from a server-side cursor.
+
+    `columns` is a list of (name, type) pairs, see EXPORTS. `team_ids`
+    limits the export to those teams (None = whole league).
+    """
+    if kind not in EXPORTS:
+        raise ValueError(f"Unknown export '{kind}'")
+
+    columns, build, transform = EXPORTS[kind]
+    rows = build(team_ids).execution_options(yield_per=EXPORT_YIELD_PER)
+    if transform:
+        rows = map(transform, rows)
+    return columns, rows
+
+
+# ---------------- CSV ----------------
+def iter_csv(columns, rows, chunk_rows=EXPORT_YIELD_PER):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow([name for name, _ in columns])
+
+    for i, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if i % chunk_rows == 0:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+
+    yield buf.getvalue()
+
+
+# ---------------- PARQUET (προαιρετικό: pip install pyarrow) ----------------
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object whose content is drained after each row group."""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.chunks.append(bytes(b))
+        self.position += len(b)
+        return len(b)
+
+    def tell(self):
+        return self.position
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def parquet_available():
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def iter_parquet(columns, rows, chunk_rows=EXPORT_YIELD_PER):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    # Σταθερό schema από τους τύπους των στηλών: μια στήλη που είναι όλη NULL στο
+    # πρώτο batch δεν γίνεται τύπου null
+    types = {'int': pa.int64(), 'float': pa.float64(), 'str': pa.string(), 'date': pa.date32()}
+    schema = pa.schema([(name, types[kind]) for name, kind in columns])
+
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    batch = []
+
+    def write_batch():
+        writer.write_table(pa.Table.from_pydict(
+            {name: [r[i] for r in batch] for i, (name, _) in enumerate(columns)}, schema=schema
+        ))
+        batch.clear()
+
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= chunk_rows:
+            write_batch()
+            yield sink.drain()
+
+    if batch:
+        write_batch()
+    writer.close()
+    yield sink.drain()
+
+
+FORMATS = {
+    'csv': (iter_csv, 'text/csv'),
+    'parquet': (iter_parquet, 'application/vnd.apache.parquet'),
+}
@@ -0,0 +1,16 @@
+from flask_login import LoginManager
+from flask_mail import Mail
+from flask_migrate import Migrate
+from identity import load_identity
+
+migrate = Migrate()
+mail = Mail()
+
+# ---------------- LOGIN ----------------
+login_manager = LoginManager()
+login_manager.login_view = 'auth.login'
+
+
+@login_manager.user_loader
+def load_user(user_id):
+    return load_identity(int(user_id))
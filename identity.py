@@ -0,0 +1,117 @@
+import time
+from flask import current_app, has_request_context, session
+from flask_login import UserMixin
+from sqlalchemy import update
+from models import db, User, Team, Player
+
+SESSION_KEY = 'identity'
+
+
+# ---------------- CACHED IDENTITY ----------------
+class CachedUser(UserMixin):
+    """current_user built from the session, without a User query.
+
+    Carries what the routes check for authorisation: role, the player
+    profile of a player account and the teams a coach owns.
+    """
+
+    def __init__(self, data):
+        self.id = data['id']
+        self.username = data['username']
+        self.role = data['role']
+        self.approved = data['approved']
+        self.player_id = data['player_id']
+        self.player_team_id = data['player_team_id']
+        self.team_ids = frozenset(data['team_ids'])
+
+    def owns_team(self, team_id):
+        return team_id is not None and team_id in self.team_ids
+
+    def __repr__(self):
+        return f'<CachedUser {self.username} ({self.role})>'
+
+
+def _build(user):
+    player = None
+    team_ids = []
+
+    if user.role == 'player':
+        player = (
+            db.session.query(Player.id, Player.team_id)
+            .filter(Player.user_id == user.id)
+            .first()
+        )
+    elif user.role == 'coach':
+        team_ids = [t for (t,) in db.session.query(Team.id).filter(Team.coach_id == user.id)]
+
+    return {
+        'id': user.id,
+        'username': user.username,
+        'role': user.role,
+        'approved': user.approved,
+        'player_id': player.id if player else None,
+        'player_team_id': player.team_id if player else None,
+        'team_ids': team_ids,
+        'ver': user.identity_version,
+        'ts': time.time()
+    }
+
+
+def load_identity(user_id):
+    """Flask-Login user_loader: session copy while fresh, else check the DB.
+
+    Within IDENTITY_CACHE_TTL the copy is trusted as is (no query), so a
+    change made for another user (role, approval, teams) reaches them
+    after at most the TTL. When it expires, one primary-key lookup of
+    User.identity_version decides between renewing it and rebuilding it.
+    """
+    ttl = current_app.config['IDENTITY_CACHE_TTL']
+    data = session.get(SESSION_KEY)
+
+    if ttl and data and data['id'] == user_id:
+        if time.time() - data['ts'] < ttl:
+            return CachedUser(data)
+
+        current = db.session.query(User.identity_version).filter(User.id == user_id).scalar()
+        if current is not None and data['ver'] == current:
+            data['ts'] = time.time()
+            session[SESSION_KEY] = data
+            return CachedUser(data)
+
+    user = db.session.get(User, user_id)
+    if user is None:
+        session.pop(SESSION_KEY, None)
+        return None
+
+    data = _build(user)
+    if ttl:
+        session[SESSION_KEY] = data
+    return CachedUser(data)
+
+
+def forget_identity():
+    session.pop(SESSION_KEY, None)
+
+
+# ---------------- INVALIDATION ----------------
+def invalidate_identity(*user_ids):
+    """Force a reload of these users (role, approval, teams changed).
+
+    The current user reloads on the next request; others within IDENTITY_CACHE_TTL.
+    """
+    user_ids = [u for u in user_ids if u]
+    if not user_ids:
+        return
+    db.session.execute(
+        update(User)
+        .where(User.id.in_(user_ids))
+        .values(identity_version=User.identity_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+
+    # Ο τρέχων χρήστης βλέπει αμέσως τις δικές του αλλαγές (π.χ. νέα ομάδα)
+    if has_request_context():
+        data = session.get(SESSION_KEY)
+        if data and data['id'] in user_ids:
+            session.pop(SESSION_KEY, None)
@@ -0,0 +1,213 @@
+import csv
+import itertools
+import json
+from werkzeug.datastructures import MultiDict
+from forms import StatForm
+from models import db, Player, Performance
+from aggregates import record_performance_rows
+from leaderboard import bump_leaderboards
+
+IMPORT_BATCH_SIZE = 500
+
+COLUMNS = ('date', 'goals', 'assists', 'passes_completed', 'passes_attempted', 'tackles', 'rating')
+
+
+# ---------------- PARSING (streaming) ----------------
+class ImportFileError(ValueError):
+    """The file cannot be read past `line` (encoding, CSV quoting, broken JSON array)."""
+
+    def __init__(self, line, message):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+        self.message = message
+
+
+def _lines(stream):
+    # Αποκωδικοποίηση ανά γραμμή, ώστε ένα λάθος byte να δείχνει τη γραμμή του
+    if not isinstance(stream.read(0), bytes):
+        yield from stream
+        return
+    for line_no, raw in enumerate(stream, start=1):
+        try:
+            yield raw.decode('utf-8-sig' if line_no == 1 else 'utf-8')
+        except UnicodeDecodeError as e:
+            raise ImportFileError(line_no, f"Not UTF-8 text ({e.reason})") from e
+
+
+def iter_rows(stream, fmt):
+    """Yield (line_no, dict) from a binary or text stream.
+
+    csv  -> header row + one row per line
+    json -> JSON Lines (one object per line); a top-level JSON array is
+            also accepted but is read in one go.
+
+    Raises ImportFileError when the rest of the file is unreadable; a bad
+    JSON line is yielded as its JSONDecodeError instead.
+    """
+    lines = _lines(stream)
+
+    if fmt == 'csv':
+        reader = csv.DictReader(lines)
+        try:
+            for row in reader:
+                yield reader.line_num, row
+        except csv.Error as e:
+            raise ImportFileError(reader.line_num, str(e)) from e
+        return
+
+    if fmt != 'json':
+        raise ValueError(f"Unknown format '{fmt}'")
+
+    first = next(lines, '')
+    if first.lstrip().startswith('['):
+        try:
+            data = json.loads(first + ''.join(lines))
+        except json.JSONDecodeError as e:
+            raise ImportFileError(e.lineno, e.msg) from e
+        for i, row in enumerate(data, start=1):
+            yield i, row
+        return
+
+    for line_no, line in enumerate(itertools.chain([first], lines), start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            row = e
+        yield line_no, row
+
+
+def format_for(filename):
+    return 'json' if filename.lower().endswith(('.json', '.jsonl', '.ndjson')) else 'csv'
+
+
+# ---------------- VALIDATION ----------------
+def validate_row(row, players):
+    """Return (values, errors) using the same rules as StatForm."""
+    if not isinstance(row, dict):
+        return None, {"row": [str(row) if isinstance(row, Exception) else "Not an object"]}
+
+    player_id, player_errors = players.resolve(row)
+    if player_errors:
+        return None, player_errors
+
+    # Το StatForm.date έχει default τη σημερινή μέρα· ένα import δεν επινοεί ημερομηνίες
+    if not str(row.get('date') or '').strip():
+        return None, {"date": ["This field is required."]}
+
+    formdata = MultiDict(
+        (col, str(row[col])) for col in COLUMNS if row.get(col) not in (None, '')
+    )
+    form = StatForm(formdata=formdata, meta={'csrf': False})
+    if not form.validate():
+        return None, form.errors
+
+    values = {col: getattr(form, col).data for col in COLUMNS}
+    for col in COLUMNS[1:-1]:
+        values[col] = values[col] or 0
+    values['player_id'] = player_id
+    return values, None
+
+
+# ---------------- IMPORT ----------------
+class PlayerLookup:
+    """The players an import may write to, keyed by id and by name.
+
+    A row names its player with `player_id` or, without one, with `player`.
+    A name shared by several players is rejected rather than guessed.
+    """
+
+    def __init__(self, pairs):
+        self.ids = set()
+        self.by_name = {}
+        for name, player_id in pairs:
+            self.ids.add(player_id)
+            self.by_name.setdefault(name, []).append(player_id)
+
+    def resolve(self, row):
+        """Return (player_id, errors) for an import row."""
+        raw_id = row.get('player_id')
+        if raw_id not in (None, ''):
+            try:
+                player_id = int(raw_id)
+            except (TypeError, ValueError):
+                return None, {"player_id": [f"Not a number: '{raw_id}'"]}
+            if player_id not in self.ids:
+                return None, {"player_id": [f"Unknown player id {player_id}"]}
+            return player_id, None
+
+        name = str(row.get('player') or '').strip()
+        matches = self.by_name.get(name, ())
+        if not matches:
+            return None, {"player": [f"Unknown player '{name}'"]}
+        if len(matches) > 1:
+            return None, {"player": [f"{len(matches)} players are named '{name}', use player_id"]}
+        return matches[0], None
+
+
+def player_lookup(team_ids=None):
+    """PlayerLookup built with one query (optionally limited to teams)."""
+    q = db.session.query(Player.name, Player.id)
+    if team_ids is not None:
+        q = q.filter(Player.team_id.in_(team_ids))
+    return PlayerLookup(q.all())
+
+
+def import_stats(rows, players, batch_size=IMPORT_BATCH_SIZE):
+    """Validate and insert Performance rows in batched executemany commits.
+
+    `rows` is an iterable of (line_no, dict) as produced by iter_rows().
+    Returns {"imported": n, "errors": [{"line": .., "errors": {..}}, ..],
+    "aborted": None, "player_ids": [..], "team_ids": [..]} with the
+    players/teams that got new rows, so the caller can invalidate their
+    cached charts. If the file turns unreadable, the rows before it are
+    still imported and "aborted" is {"line": .., "error": ..}; "imported"
+    is always the number of committed rows.
+    """
+    imported = 0
+    errors = []
+    aborted = None
+    batch = []
+    touched = set()
+
+    def flush():
+        nonlocal imported
+        if not batch:
+            return
+        db.session.execute(db.insert(Performance), batch)
+        touched.update(row["player_id"] for row in batch)
+        record_performance_rows(batch)
+        bump_leaderboards()
+        db.session.commit()
+        imported += len(batch)
+        batch.clear()
+
+    try:
+        for line_no, row in rows:
+            values, row_errors = validate_row(row, players)
+            if row_errors:
+                errors.append({"line": line_no, "errors": row_errors})
+                continue
+
+            batch.append(values)
+            if len(batch) >= batch_size:
+                flush()
+    except ImportFileError as e:
+        aborted = {"line": e.line, "error": e.message}
+
+    flush()
+
+    team_ids = [
+        t for (t,) in db.session.query(Player.team_id)
+        .filter(Player.id.in_(touched), Player.team_id.isnot(None))
+        .distinct()
+    ] if touched else []
+
+    return {
+        "imported": imported,
+        "errors": errors,
+        "aborted": aborted,
+        "player_ids": sorted(touched),
+        "team_ids": team_ids
+    }
@@ -0,0 +1,148 @@
+import logging
+import threading
+import time
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from models import db
+
+log = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, float('inf'))
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, float('inf'))
+
+# Ορίζεται από το SLOW_QUERY_MS στο init_instrumentation
+_slow_query_ms = float('inf')
+
+
+# ---------------- PER-ENDPOINT HISTOGRAMS ----------------
+class EndpointStats:
+    """Request latency and query-count histograms for one endpoint."""
+
+    def __init__(self):
+        self.requests = 0
+        self.total_ms = 0.0
+        self.db_ms = 0.0
+        self.queries = 0
+        self.max_queries = 0
+        self.latency = [0] * len(LATENCY_BUCKETS_MS)
+        self.query_counts = [0] * len(QUERY_BUCKETS)
+
+    def add(self, total_ms, queries, db_ms):
+        self.requests += 1
+        self.total_ms += total_ms
+        self.db_ms += db_ms
+        self.queries += queries
+        self.max_queries = max(self.max_queries, queries)
+        self.latency[_bucket(LATENCY_BUCKETS_MS, total_ms)] += 1
+        self.query_counts[_bucket(QUERY_BUCKETS, queries)] += 1
+
+    def as_dict(self):
+        n = self.requests or 1
+        return {
+            'requests': self.requests,
+            'avg_ms': round(self.total_ms / n, 2),
+            'avg_db_ms': round(self.db_ms / n, 2),
+            'avg_queries': round(self.queries / n, 2),
+            'max_queries': self.max_queries,
+            'latency': list(zip(_labels(LATENCY_BUCKETS_MS), self.latency)),
+            'query_counts': list(zip(_labels(QUERY_BUCKETS), self.query_counts)),
+        }
+
+
+def _bucket(bounds, value):
+    for i, bound in enumerate(bounds):
+        if value <= bound:
+            return i
+    return len(bounds) - 1
+
+
+def _labels(bounds):
+    return [f"≤{b:g}" if b != float('inf') else f">{bounds[-2]:g}" for b in bounds]
+
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def endpoint_stats():
+    """{endpoint: summary dict}, busiest endpoint first."""
+    with _stats_lock:
+        rows = {endpoint: s.as_dict() for endpoint, s in _stats.items()}
+    return dict(sorted(rows.items(), key=lambda kv: -kv[1]['requests']))
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+# ---------------- SQLALCHEMY HOOKS ----------------
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info['query_start'].pop()) * 1000
+
+    endpoint = None
+    if has_request_context():
+        endpoint = request.endpoint
+        sql = g.get('sql')
+        if sql is not None:
+            sql[0] += 1
+            sql[1] += elapsed_ms
+
+    if elapsed_ms >= _slow_query_ms:
+        log.warning("Slow query (%.1f ms) in %s: %s", elapsed_ms, endpoint or '-', statement)
+
+
+# ---------------- REQUEST HOOKS ----------------
+def _start_request():
+    # [πλήθος queries, χρόνος στη βάση σε ms]
+    g.sql = [0, 0.0]
+    g.request_start = time.perf_counter()
+
+
+def _finish_request(response):
+    sql = g.get('sql')
+    if sql is None:
+        return response
+
+    total_ms = (time.perf_counter() - g.request_start) * 1000
+    queries, db_ms = sql
+
+    response.headers.add(
+        'Server-Timing',
+        f'db;dur={db_ms:.2f};desc="{queries} queries", app;dur={total_ms:.2f}'
+    )
+
+    endpoint = request.endpoint or 'unmatched'
+    with _stats_lock:
+        stats = _stats.get(endpoint)
+        if stats is None:
+            stats = _stats[endpoint] = EndpointStats()
+        stats.add(total_ms, queries, db_ms)
+
+    return response
+
+
+def init_instrumentation(app):
+    """Count queries and DB time per request when SQL_INSTRUMENTATION is on.
+
+    When it is off nothing is registered, so requests and queries pay no
+    extra cost.
+    """
+    global _slow_query_ms
+    if not app.config['SQL_INSTRUMENTATION']:
+        return
+
+    _slow_query_ms = app.config['SLOW_QUERY_MS']
+
+    with app.app_context():
+        for engine in db.engines.values():
+            if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+                event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+                event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
@@ -0,0 +1,204 @@
+import threading
+import time
+from bisect import bisect_left, insort
+from flask import current_app
+from sqlalchemy import update
+from models import db, Player, PlayerSeasonStats, DataVersion
+from aggregates import season_for, CAREER
+
+SCOPE = 'leaderboard'
+
+METRICS = ('goals', 'assists', 'tackles', 'avg_rating')
+MAX_LIMIT = 100
+
+
+def _value(entry, metric):
+    if metric == 'avg_rating':
+        # Όπως το PlayerSeasonStats.avg_rating
+        return round(entry['rating_sum'] / entry['appearances'], 2) if entry['appearances'] else 0.0
+    return entry[metric]
+
+
+# ---------------- RANKING INDEX ----------------
+class LeaderboardIndex:
+    """Per-season sorted rankings, built from PlayerSeasonStats on first use.
+
+    Every (season, team or whole league, metric) keeps a list of
+    (-value, player_id) in ascending order, so the top N is a slice from
+    the front and a new performance moves one player with two bisects.
+    The index is dropped when the "leaderboard" row of DataVersion
+    changes (team moves, imports, deletions, rebuild-totals, from any
+    process or CLI command) or after `ttl`.
+    """
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._seasons = {}
+        self._version = None
+        self._built = 0.0
+        self._lock = threading.Lock()
+
+    # -------- build --------
+    def _check_fresh(self):
+        current = _version()
+        if current != self._version or (self.ttl and time.monotonic() - self._built > self.ttl):
+            self._seasons.clear()
+            self._version = current
+            self._built = time.monotonic()
+
+    def _load(self, season):
+        rows = (
+            db.session.query(
+                PlayerSeasonStats.player_id, Player.name, Player.team_id,
+                PlayerSeasonStats.appearances, PlayerSeasonStats.goals,
+                PlayerSeasonStats.assists, PlayerSeasonStats.tackles,
+                PlayerSeasonStats.rating_sum
+            )
+            .join(Player, PlayerSeasonStats.player_id == Player.id)
+            .filter(PlayerSeasonStats.season == season)
+        )
+
+        players = {}
+        boards = {}
+        for pid, name, team_id, apps, goals, assists, tackles, rating_sum in rows:
+            entry = {'name': name, 'team_id': team_id, 'appearances': apps, 'goals': goals,
+                     'assists': assists, 'tackles': tackles, 'rating_sum': rating_sum}
+            players[pid] = entry
+            for metric in METRICS:
+                key = (-_value(entry, metric), pid)
+                boards.setdefault((None, metric), []).append(key)
+                if team_id:
+                    boards.setdefault((team_id, metric), []).append(key)
+
+        for board in boards.values():
+            board.sort()
+        return {'players': players, 'boards': boards}
+
+    def _season(self, season):
+        self._check_fresh()
+        data = self._seasons.get(season)
+        if data is None:
+            data = self._load(season)
+            # Commit ανάμεσα στον έλεγχο έκδοσης και το load: τα δεδομένα είναι
+            # νεότερα από την έκδοση, οπότε δεν κρατιούνται
+            if _version() == self._version:
+                self._seasons[season] = data
+            else:
+                self._seasons.clear()
+                self._version = None
+        return data
+
+    # -------- incremental update --------
+    def record(self, player, perf, version):
+        """Move `player` in the loaded seasons after a committed Performance.
+
+        `version` is what bump_leaderboards() returned in the transaction
+        that inserted `perf`. Only an index loaded at exactly the version
+        before it lacks the match; one loaded at `version` already has it.
+        """
+        with self._lock:
+            if self._version != version - 1:
+                if self._version != version:
+                    self._seasons.clear()
+                    self._version = None
+                return
+            self._version = version
+
+            for season in (season_for(perf.date), CAREER):
+                data = self._seasons.get(season)
+                if data is None:
+                    continue
+
+                entry = data['players'].get(player.id)
+                old = dict(entry) if entry else None
+                if entry is None:
+                    entry = data['players'][player.id] = {
+                        'name': player.name, 'team_id': player.team_id, 'appearances': 0,
+                        'goals': 0, 'assists': 0, 'tackles': 0, 'rating_sum': 0.0
+                    }
+
+                entry['appearances'] += 1
+                entry['rating_sum'] += perf.rating or 0
+                for field in ('goals', 'assists', 'tackles'):
+                    entry[field] += getattr(perf, field) or 0
+
+                for metric in METRICS:
+                    for scope in {None, entry['team_id']}:
+                        board = data['boards'].setdefault((scope, metric), [])
+                        if old is not None:
+                            i = bisect_left(board, (-_value(old, metric), player.id))
+                            del board[i]
+                        insort(board, (-_value(entry, metric), player.id))
+
+    # -------- read --------
+    def top(self, metric, season=CAREER, team_id=None, min_apps=1, limit=20):
+        """The first `limit` players of a board with at least `min_apps` appearances."""
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        limit = max(1, min(limit, MAX_LIMIT))
+
+        with self._lock:
+            data = self._season(season)
+            players = data['players']
+            result = []
+            for neg_value, pid in data['boards'].get((team_id, metric), ()):
+                entry = players[pid]
+                if entry['appearances'] < min_apps:
+                    continue
+                result.append({
+                    'rank': len(result) + 1,
+                    'player_id': pid,
+                    'name': entry['name'],
+                    'team_id': entry['team_id'],
+                    'appearances': entry['appearances'],
+                    'value': -neg_value
+                })
+                if len(result) == limit:
+                    break
+
+        return {
+            'metric': metric,
+            'season': season,
+            'team_id': team_id,
+            'min_apps': min_apps,
+            'players': result
+        }
+
+
+# ---------------- APP WIRING ----------------
+def init_leaderboards(app):
+    app.extensions['leaderboards'] = LeaderboardIndex(app.config['LEADERBOARD_TTL'])
+
+
+def leaderboards():
+    return current_app.extensions['leaderboards']
+
+
+# ---------------- SHARED VERSION ----------------
+def _version():
+    return db.session.query(DataVersion.version).filter(DataVersion.scope == SCOPE).scalar() or 0
+
+
+def bump_leaderboards():
+    """Bump the shared version in the caller's transaction and return the new value.
+
+    Call it before committing a change to the totals, so the version and
+    the rows it describes become visible together.
+    """
+    # Το UPDATE κρατά το lock εγγραφής μέχρι το commit, οπότε το SELECT βλέπει τη δική μας τιμή
+    updated = db.session.execute(
+        update(DataVersion)
+        .where(DataVersion.scope == SCOPE)
+        .values(version=DataVersion.version + 1)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not updated:
+        db.session.add(DataVersion(scope=SCOPE, version=1))
+        db.session.flush()
+    return _version()
+
+
+def invalidate_leaderboards():
+    """Rebuild every process's index from SQL on its next read (commits)."""
+    bump_leaderboards()
+    db.session.commit()
@@ -0,0 +1,53 @@
+from sqlalchemy import and_
+from sqlalchemy.orm import contains_eager
+from models import db, Team, Player, Training, ConversationSummary
+
+# Queries των σελίδων-λιστών, με ρητό loading για ό,τι διαβάζει το template.
+# Σχέση που χρησιμοποιείται στο template χωρίς loader option εδώ κάνει
+# ένα query ανά γραμμή (έλεγχος: python benchmarks/query_counts.py).
+
+
+# ---------------- TRAININGS ----------------
+def trainings_for_coach(coach_id, since):
+    # Το JOIN με την ομάδα υπάρχει ήδη για το φίλτρο· γεμίζει και το tr.team
+    return (
+        Training.query
+        .join(Training.team)
+        .options(contains_eager(Training.team))
+        .filter(Team.coach_id == coach_id)
+        .filter(Training.date >= since)
+        .order_by(Training.date.desc())
+    )
+
+
+def trainings_for_team(team_id, since):
+    return (
+        Training.query
+        .filter_by(team_id=team_id)
+        .filter(Training.date >= since)
+        .order_by(Training.date.desc())
+    )
+
+
+# ---------------- PLAYERS ----------------
+def team_roster(team_id):
+    return Player.query.filter_by(team_id=team_id).order_by(Player.name)
+
+
+def free_agents():
+    return Player.query.filter_by(team_id=None)
+
+
+def chat_players_for_coach(coach_id):
+    # (player, conversation summary ή None): unread/τελευταίο μήνυμα στο ίδιο query
+    return (
+        db.session.query(Player, ConversationSummary)
+        .filter(Player.user_id.isnot(None))
+        .join(Team, Player.team_id == Team.id)
+        .filter(Team.coach_id == coach_id)
+        .outerjoin(ConversationSummary, and_(
+            ConversationSummary.user_id == coach_id,
+            ConversationSummary.peer_id == Player.user_id
+        ))
+        .order_by(Player.name.asc())
+    )
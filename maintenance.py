@@ -0,0 +1,57 @@
+import logging
+import threading
+from datetime import date, timedelta
+from models import db, Training, TrainingAttendance
+
+log = logging.getLogger(__name__)
+
+
+# ---------------- TRAINING RETENTION ----------------
+def training_cutoff(retention_days, today=None):
+    # Προπονήσεις πριν από αυτή την ημερομηνία θεωρούνται ληγμένες
+    return (today or date.today()) - timedelta(days=retention_days)
+
+
+def purge_expired_trainings(retention_days=0, today=None):
+    """Delete trainings older than the retention window that have no attendance.
+
+    Trainings with recorded attendance are history for the attendance-rate
+    APIs and are kept; the lists hide them like any other past training.
+    Returns the number of deleted rows.
+    """
+    cutoff = training_cutoff(retention_days, today)
+
+    attended = db.session.query(TrainingAttendance.training_id).filter(
+        TrainingAttendance.training_id == Training.id
+    ).exists()
+
+    deleted = (
+        Training.query
+        .filter(Training.date < cutoff, ~attended)
+        .delete(synchronize_session=False)
+    )
+    db.session.commit()
+
+    return deleted
+
+
+# ---------------- BACKGROUND SCHEDULER ----------------
+def start_cleanup_scheduler(app, interval):
+    """Run purge_expired_trainings every `interval` seconds in a daemon thread."""
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            with app.app_context():
+                try:
+                    deleted = purge_expired_trainings(app.config['TRAINING_RETENTION_DAYS'])
+                    log.info("Training cleanup removed %d rows", deleted)
+                except Exception:
+                    db.session.rollback()
+                    log.exception("Training cleanup failed")
+                finally:
+                    db.session.remove()
+
+    thread = threading.Thread(target=run, name='training-cleanup', daemon=True)
+    thread.start()
+    return stop
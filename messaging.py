@@ -0,0 +1,286 @@
+import json
+import queue
+import threading
+import time
+from sqlalchemy import event, func, select, union_all, update
+from sqlalchemy.orm import Session, contains_eager
+from models import db, Message, ConversationSummary
+
+CHAT_PAGE_SIZE = 50
+SUBSCRIBER_QUEUE_SIZE = 100
+PREVIEW_LENGTH = 120
+
+
+# ---------------- CONVERSATION QUERY ----------------
+def conversation_filter(user_a, user_b):
+    return (
+        ((Message.sender_id == user_a) & (Message.receiver_id == user_b)) |
+        ((Message.sender_id == user_b) & (Message.receiver_id == user_a))
+    )
+
+
+# ---------------- CURSOR (id) ----------------
+# Το id αυξάνει με κάθε εισαγωγή. Το timestamp (CURRENT_TIMESTAMP) έχει ακρίβεια
+# δευτερολέπτου, οπότε μηνύματα του ίδιου δευτερολέπτου δεν ξεχωρίζουν με αυτό.
+def encode_cursor(msg):
+    return str(msg.id)
+
+
+def decode_cursor(cursor):
+    """'42' -> 42 (παλιά cursors '2025-01-05T10:00:00_42' -> 42). Raises ValueError."""
+    return int(cursor.rpartition('_')[2])
+
+
+# ---------------- PAGES ----------------
+def conversation_page(user_a, user_b, limit, *criteria, newest=True):
+    """Query for `limit` messages of a conversation in id order.
+
+    Each direction is read separately through ix_message_sender_receiver_id,
+    which already has its rows in id order, so both stop after `limit`
+    rows. An OR of the two directions would read and sort the whole
+    conversation instead.
+    """
+    order = Message.id.desc() if newest else Message.id.asc()
+    directions = [
+        select(Message.id)
+        .where(Message.sender_id == sender, Message.receiver_id == receiver, *criteria)
+        .order_by(order)
+        .limit(limit)
+        .subquery()
+        for sender, receiver in ((user_a, user_b), (user_b, user_a))
+    ]
+    ids = union_all(*(select(d.c.id) for d in directions))
+    return Message.query.filter(Message.id.in_(ids)).order_by(order).limit(limit)
+
+
+def latest_messages(user_a, user_b, limit=CHAT_PAGE_SIZE, before=None):
+    """One page of a conversation, oldest first.
+
+    `before` is a cursor from encode_cursor(); only messages strictly older
+    than it are returned. Returns (messages, older_cursor) where
+    older_cursor is None when there is nothing older.
+    """
+    criteria = [Message.id < decode_cursor(before)] if before else []
+
+    # limit + 1 για να ξέρουμε αν υπάρχουν παλαιότερα χωρίς COUNT
+    page = conversation_page(user_a, user_b, limit + 1, *criteria).all()
+
+    has_older = len(page) > limit
+    page = page[:limit]
+    page.reverse()
+
+    older_cursor = encode_cursor(page[0]) if has_older else None
+    return page, older_cursor
+
+
+def messages_since(user_a, user_b, since_id, limit=CHAT_PAGE_SIZE):
+    return conversation_page(user_a, user_b, limit, Message.id > since_id, newest=False).all()
+
+
+def message_to_dict(msg):
+    return {
+        "id": msg.id,
+        "sender_id": msg.sender_id,
+        "receiver_id": msg.receiver_id,
+        "content": msg.content,
+        "timestamp": msg.timestamp.isoformat() if msg.timestamp else None,
+        "read_at": msg.read_at.isoformat() if msg.read_at else None,
+    }
+
+
+# ---------------- CONVERSATION SUMMARIES ----------------
+def _set_last(user_id, peer_id, msg, unread_delta):
+    values = {
+        "last_message_id": msg.id,
+        "last_sender_id": msg.sender_id,
+        "last_preview": msg.content[:PREVIEW_LENGTH],
+        "last_timestamp": msg.timestamp,
+    }
+    updated = db.session.execute(
+        update(ConversationSummary)
+        .where(ConversationSummary.user_id == user_id, ConversationSummary.peer_id == peer_id)
+        .values(unread=ConversationSummary.unread + unread_delta, **values)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+    if not updated:
+        db.session.add(ConversationSummary(user_id=user_id, peer_id=peer_id, unread=unread_delta, **values))
+        db.session.flush()
+
+
+def record_message(msg):
+    """Update both sides' conversation summaries for a new, flushed Message.
+
+    Runs in the caller's session; commit together with the Message insert.
+    """
+    _set_last(msg.sender_id, msg.receiver_id, msg, 0)
+    _set_last(msg.receiver_id, msg.sender_id, msg, 1)
+
+
+def mark_read(user_id, peer_id):
+    """Mark everything peer_id sent to user_id as read. Commits only if something was unread."""
+    summary = db.session.get(ConversationSummary, (user_id, peer_id))
+    if summary is None or not summary.unread:
+        return 0
+
+    db.session.execute(
+        update(Message)
+        .where(Message.sender_id == peer_id, Message.receiver_id == user_id, Message.read_at.is_(None))
+        # UTC, όπως το CURRENT_TIMESTAMP του timestamp
+        .values(read_at=func.current_timestamp())
+        .execution_options(synchronize_session=False)
+    )
+    unread, summary.unread = summary.unread, 0
+    db.session.commit()
+    return unread
+
+
+def inbox(user_id):
+    """The user's conversations, latest first, with the peer loaded (one query)."""
+    return (
+        ConversationSummary.query
+        .join(ConversationSummary.peer)
+        .options(contains_eager(ConversationSummary.peer))
+        .filter(ConversationSummary.user_id == user_id)
+        .order_by(ConversationSummary.last_timestamp.desc())
+    )
+
+
+def summary_to_dict(summary):
+    return {
+        "peer_id": summary.peer_id,
+        "peer": summary.peer.username,
+        "last_message_id": summary.last_message_id,
+        "last_sender_id": summary.last_sender_id,
+        "last_preview": summary.last_preview,
+        "last_timestamp": summary.last_timestamp.isoformat() if summary.last_timestamp else None,
+        "unread": summary.unread,
+    }
+
+
+def rebuild_conversations():
+    """Recompute every conversation summary from the Message table.
+
+    Returns the number of summary rows written.
+    """
+    ConversationSummary.query.delete(synchronize_session=False)
+
+    rows = {}
+    q = (
+        db.session.query(Message.id, Message.sender_id, Message.receiver_id, Message.content,
+                         Message.timestamp, Message.read_at)
+        .order_by(Message.timestamp, Message.id)
+        .yield_per(5000)
+    )
+    for msg_id, sender, receiver, content, ts, read_at in q:
+        last = {"last_message_id": msg_id, "last_sender_id": sender,
+                "last_preview": content[:PREVIEW_LENGTH], "last_timestamp": ts}
+        for user, peer, unread in ((sender, receiver, 0), (receiver, sender, read_at is None)):
+            row = rows.setdefault((user, peer), {"user_id": user, "peer_id": peer, "unread": 0})
+            row.update(last)
+            row["unread"] += unread
+
+    db.session.bulk_insert_mappings(ConversationSummary, list(rows.values()))
+    db.session.commit()
+    return len(rows)
+
+
+# ---------------- PUB/SUB ----------------
+class InProcessBroker:
+    """Fan-out of new messages to the SSE streams of this process.
+
+    Any object with the same publish/subscribe/unsubscribe methods (e.g. a
+    wrapper around a local Redis or other broker for multi-process servers)
+    can replace it through set_broker().
+    """
+
+    def __init__(self, queue_size=SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers = {}
+
+    def subscribe(self, user_id):
+        q = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(q)
+        return q
+
+    def unsubscribe(self, user_id, q):
+        with self._lock:
+            subs = self._subscribers.get(user_id)
+            if subs:
+                subs.discard(q)
+                if not subs:
+                    del self._subscribers[user_id]
+
+    def publish(self, user_id, payload):
+        with self._lock:
+            subs = list(self._subscribers.get(user_id, ()))
+        for q in subs:
+            try:
+                q.put_nowait(payload)
+            except queue.Full:
+                # Αργός client: χάνει το event, το ?since= polling το καλύπτει
+                pass
+
+
+broker = InProcessBroker()
+
+
+def set_broker(new_broker):
+    global broker
+    broker = new_broker
+
+
+def get_broker():
+    return broker
+
+
+# ---------------- PUBLISH ON COMMIT ----------------
+@event.listens_for(Session, 'after_flush')
+def _collect_new_messages(session, flush_context):
+    new = [obj for obj in session.new if isinstance(obj, Message)]
+    if new:
+        session.info.setdefault('new_messages', []).extend(new)
+
+
+@event.listens_for(Session, 'after_commit')
+def _publish_new_messages(session):
+    for msg in session.info.pop('new_messages', []):
+        payload = message_to_dict(msg)
+        broker.publish(msg.receiver_id, payload)
+        broker.publish(msg.sender_id, payload)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_new_messages(session):
+    session.info.pop('new_messages', None)
+
+
+# ---------------- SSE ----------------
+def sse_stream(user_id, heartbeat=15, timeout=None):
+    """Generator of text/event-stream chunks with the user's new messages.
+
+    Holds one server thread while open. After `timeout` seconds it ends, so
+    the thread is released and the browser reconnects (catching up with
+    ?since= on open).
+    """
+    b = broker
+    q = b.subscribe(user_id)
+    deadline = time.monotonic() + timeout if timeout else None
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            wait = heartbeat
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    return
+            try:
+                payload = q.get(timeout=wait)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            yield f"id: {payload['id']}\nevent: message\ndata: {json.dumps(payload)}\n\n"
+    finally:
+        b.unsubscribe(user_id, q)
@@ -0,0 +1,289 @@
+import atexit
+import glob
+import json
+import os
+import threading
+import time
+import weakref
+from flask import g, request
+from sqlalchemy import event
+from models import db
+import cache
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# name -> (type, help)
+METRICS = {
+    'afm_http_requests_total': ('counter', 'HTTP requests by endpoint, role and status.'),
+    'afm_http_request_duration_seconds': ('histogram', 'Request latency by endpoint and role.'),
+    'afm_db_pool_checkouts_total': ('counter', 'Connections checked out of the SQLAlchemy pool.'),
+    'afm_db_pool_connects_total': ('counter', 'New DBAPI connections opened by the pool.'),
+    'afm_db_pool_checked_out': ('gauge', 'Connections currently checked out.'),
+    'afm_db_pool_overflow': ('gauge', 'Connections currently open beyond pool_size.'),
+    'afm_db_pool_size': ('gauge', 'Configured pool size.'),
+    'afm_cache_hits_total': ('counter', 'Cache lookups that found an entry.'),
+    'afm_cache_misses_total': ('counter', 'Cache lookups that missed.'),
+    'afm_cache_hit_ratio': ('gauge', 'hits / (hits + misses) since start.'),
+}
+
+
+# ---------------- LOCK-FREE COUNTERS ----------------
+# Κάθε thread γράφει μόνο στο δικό του dict, οπότε η αύξηση δεν χρειάζεται lock.
+# Όταν το thread τερματίσει, το shard του προστίθεται στο _retired και φεύγει από
+# τη λίστα, ώστε ένας server με thread ανά request να μη μαζεύει shards.
+_local = threading.local()
+_shards = []
+_retired = {}
+_shards_lock = threading.RLock()
+
+
+class _Owner:
+    """Lives in the thread-local; collected when its thread exits."""
+    __slots__ = ('counters', '__weakref__')
+
+
+def _retire(shard):
+    with _shards_lock:
+        for key, value in shard.items():
+            _retired[key] = _retired.get(key, 0) + value
+        _shards.remove(shard)
+
+
+def _shard():
+    owner = getattr(_local, 'owner', None)
+    if owner is None:
+        owner = _local.owner = _Owner()
+        owner.counters = {}
+        with _shards_lock:
+            _shards.append(owner.counters)
+        weakref.finalize(owner, _retire, owner.counters)
+    return owner.counters
+
+
+def inc(name, labels=(), value=1):
+    shard = _shard()
+    key = (name, labels)
+    shard[key] = shard.get(key, 0) + value
+
+
+def observe(name, labels, seconds):
+    shard = _shard()
+    for bound in DURATION_BUCKETS:
+        if seconds <= bound:
+            key = (name + '_bucket', labels + (('le', repr(bound)),))
+            shard[key] = shard.get(key, 0) + 1
+    for key, value in (
+        ((name + '_bucket', labels + (('le', '+Inf'),)), 1),
+        ((name + '_sum', labels), seconds),
+        ((name + '_count', labels), 1),
+    ):
+        shard[key] = shard.get(key, 0) + value
+
+
+def _counters():
+    with _shards_lock:
+        totals = dict(_retired)
+        for shard in list(_shards):
+            for key, value in list(shard.items()):
+                totals[key] = totals.get(key, 0) + value
+    return totals
+
+
+# ---------------- PROCESS GAUGES ----------------
+def _process_values():
+    """Pool gauges and cache counters read directly from this process."""
+    counters, gauges = {}, {}
+
+    for bind, engine in db.engines.items():
+        pool = engine.pool
+        labels = (('bind', bind or 'default'),)
+        if hasattr(pool, 'checkedout'):
+            gauges[('afm_db_pool_checked_out', labels)] = pool.checkedout()
+            gauges[('afm_db_pool_overflow', labels)] = max(pool.overflow(), 0)
+            gauges[('afm_db_pool_size', labels)] = pool.size()
+
+    labels = (('cache', 'chart'),)
+    counters[('afm_cache_hits_total', labels)] = cache.chart_cache.hits
+    counters[('afm_cache_misses_total', labels)] = cache.chart_cache.misses
+
+    return counters, gauges
+
+
+# ---------------- MULTI-PROCESS (κοινός φάκελος) ----------------
+_metrics_dir = None
+_flush_interval = 5
+_last_flush = 0.0
+
+
+def _encode(values):
+    return [[name, [list(l) for l in labels], value] for (name, labels), value in values.items()]
+
+
+def _decode(rows):
+    return {(name, tuple(tuple(l) for l in labels)): value for name, labels, value in rows}
+
+
+def flush():
+    """Write this process's totals to <METRICS_DIR>/metrics-<pid>.json (atomic replace)."""
+    global _last_flush
+    if not _metrics_dir:
+        return
+
+    counters, gauges = _process_values()
+    counters.update(_counters())
+
+    path = os.path.join(_metrics_dir, f'metrics-{os.getpid()}.json')
+    tmp = f'{path}.{threading.get_ident()}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump({'pid': os.getpid(), 'counters': _encode(counters), 'gauges': _encode(gauges)}, f)
+    os.replace(tmp, path)
+    _last_flush = time.monotonic()
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def collect():
+    """Merged (counters, gauges) across every process sharing METRICS_DIR.
+
+    Counters of exited workers stay in the totals so they never go
+    backwards; their gauges are dropped.
+    """
+    if not _metrics_dir:
+        counters, gauges = _process_values()
+        counters.update(_counters())
+        return counters, gauges
+
+    flush()
+    counters, gauges = {}, {}
+    for path in glob.glob(os.path.join(_metrics_dir, 'metrics-*.json')):
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        for key, value in _decode(data['counters']).items():
+            counters[key] = counters.get(key, 0) + value
+        if _alive(data['pid']):
+            for key, value in _decode(data['gauges']).items():
+                gauges[key] = gauges.get(key, 0) + value
+    return counters, gauges
+
+
+# ---------------- TEXT EXPOSITION ----------------
+def _family(name):
+    for suffix in ('_bucket', '_sum', '_count'):
+        if name.endswith(suffix) and name[:-len(suffix)] in METRICS:
+            return name[:-len(suffix)]
+    return name
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    body = ','.join(
+        '{}="{}"'.format(k, str(v).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n'))
+        for k, v in labels
+    )
+    return '{' + body + '}'
+
+
+def _format_value(value):
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render():
+    counters, gauges = collect()
+
+    # Λόγος επιτυχιών ανά cache από τα (ήδη αθροισμένα) hits/misses
+    for (name, labels), hits in list(counters.items()):
+        if name == 'afm_cache_hits_total':
+            total = hits + counters.get(('afm_cache_misses_total', labels), 0)
+            gauges[('afm_cache_hit_ratio', labels)] = hits / total if total else 0.0
+
+    by_family = {}
+    for (name, labels), value in list(counters.items()) + list(gauges.items()):
+        by_family.setdefault(_family(name), []).append((name, labels, value))
+
+    lines = []
+    for family in sorted(by_family):
+        kind, help_text = METRICS.get(family, ('untyped', ''))
+        lines.append(f'# HELP {family} {help_text}')
+        lines.append(f'# TYPE {family} {kind}')
+        for name, labels, value in sorted(by_family[family], key=lambda s: (s[0], s[1])):
+            lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+# ---------------- FLASK / SQLALCHEMY HOOKS ----------------
+def _start_request():
+    g.metrics_start = time.perf_counter()
+
+
+def _finish_request(response):
+    start = g.get('metrics_start')
+    if start is None:
+        return response
+
+    # Μόνο αν το Flask-Login έχει ήδη φορτώσει τον χρήστη, χωρίς νέο lookup
+    user = g.get('_login_user')
+    role = getattr(user, 'role', None) or 'anonymous'
+    endpoint = request.endpoint or 'unmatched'
+
+    inc('afm_http_requests_total', (('endpoint', endpoint), ('role', role), ('status', str(response.status_code))))
+    observe('afm_http_request_duration_seconds', (('endpoint', endpoint), ('role', role)),
+            time.perf_counter() - start)
+
+    if _metrics_dir and time.monotonic() - _last_flush >= _flush_interval:
+        flush()
+    return response
+
+
+def _pool_listeners(bind):
+    labels = (('bind', bind or 'default'),)
+
+    def on_checkout(dbapi_conn, record, proxy):
+        inc('afm_db_pool_checkouts_total', labels)
+
+    def on_connect(dbapi_conn, record):
+        inc('afm_db_pool_connects_total', labels)
+
+    return on_checkout, on_connect
+
+
+def init_metrics(app):
+    """Install the request/pool hooks when METRICS_ENABLED is set.
+
+    With METRICS_DIR set (a directory shared by all worker processes),
+    each process writes its totals there and /metrics merges them.
+    """
+    global _metrics_dir, _flush_interval
+    if not app.config['METRICS_ENABLED']:
+        return
+
+    _metrics_dir = app.config['METRICS_DIR']
+    _flush_interval = app.config['METRICS_FLUSH_INTERVAL']
+    if _metrics_dir:
+        os.makedirs(_metrics_dir, exist_ok=True)
+
+        def flush_at_exit():
+            with app.app_context():
+                flush()
+
+        atexit.register(flush_at_exit)
+
+    with app.app_context():
+        for bind, engine in db.engines.items():
+            on_checkout, on_connect = _pool_listeners(bind)
+            event.listen(engine, 'checkout', on_checkout)
+            event.listen(engine, 'connect', on_connect)
+
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
@@ -0,0 +1,34 @@
+"""Add training attendance
+
+Revision ID: 3f1c7a2b9d40
+Revises: 9ca4ed83ec5b
+Create Date: 2026-10-17 12:10:04.118522
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c7a2b9d40'
+down_revision = '9ca4ed83ec5b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'training_attendance',
+        sa.Column('training_id', sa.Integer(), sa.ForeignKey('training.id'), nullable=False),
+        sa.Column('player_id', sa.Integer(), sa.ForeignKey('player.id'), nullable=False),
+        sa.PrimaryKeyConstraint('training_id', 'player_id'),
+        sqlite_with_rowid=False,
+        if_not_exists=True
+    )
+    op.create_index('ix_training_attendance_player_id', 'training_attendance',
+                    ['player_id', 'training_id'], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_training_attendance_player_id', table_name='training_attendance', if_exists=True)
+    op.drop_table('training_attendance')
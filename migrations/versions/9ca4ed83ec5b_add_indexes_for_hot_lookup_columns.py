@@ -0,0 +1,41 @@
+"""Add indexes for hot lookup columns
+
+Revision ID: 9ca4ed83ec5b
+Revises: 
+Create Date: 2026-10-17 00:39:26.751359
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9ca4ed83ec5b'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# (όνομα, πίνακας, στήλες) - ίδια με τα __table_args__ στο models.py.
+# Οι πίνακες δημιουργούνται από το db.create_all(), οπότε τα indexes
+# μπορεί να υπάρχουν ήδη σε νέες βάσεις (if_not_exists).
+INDEXES = [
+    ('ix_performance_player_id_date', 'performance', ['player_id', 'date']),
+    ('ix_performance_date', 'performance', ['date']),
+    ('ix_player_team_id_name', 'player', ['team_id', 'name']),
+    ('ix_player_name', 'player', ['name']),
+    ('ix_team_coach_id_name', 'team', ['coach_id', 'name']),
+    ('ix_team_name', 'team', ['name']),
+    ('ix_training_team_id_date', 'training', ['team_id', 'date']),
+    ('ix_message_sender_receiver_timestamp', 'message', ['sender_id', 'receiver_id', 'timestamp']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
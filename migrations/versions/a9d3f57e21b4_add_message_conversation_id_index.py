@@ -0,0 +1,24 @@
+"""Add per-direction message index for id-ordered chat pages
+
+Revision ID: a9d3f57e21b4
+Revises: f3b8d06a52c1
+Create Date: 2026-10-17 21:12:40.338190
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9d3f57e21b4'
+down_revision = 'f3b8d06a52c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_message_sender_receiver_id', 'message',
+                    ['sender_id', 'receiver_id', 'id'], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_message_sender_receiver_id', table_name='message', if_exists=True)
@@ -0,0 +1,48 @@
+"""Add message read tracking and conversation summaries
+
+Revision ID: b7e2d51c0a93
+Revises: 3f1c7a2b9d40
+Create Date: 2026-10-17 15:42:37.604118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2d51c0a93'
+down_revision = '3f1c7a2b9d40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = [c['name'] for c in sa.inspect(op.get_bind()).get_columns('message')]
+    if 'read_at' not in columns:
+        with op.batch_alter_table('message') as batch:
+            batch.add_column(sa.Column('read_at', sa.DateTime(), nullable=True))
+        # Χωρίς ιστορικό ανάγνωσης: τα παλιά μηνύματα θεωρούνται διαβασμένα
+        op.execute("UPDATE message SET read_at = timestamp")
+
+    op.create_table(
+        'conversation_summary',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('user.id'), nullable=False),
+        sa.Column('peer_id', sa.Integer(), sa.ForeignKey('user.id'), nullable=False),
+        sa.Column('last_message_id', sa.Integer(), sa.ForeignKey('message.id'), nullable=True),
+        sa.Column('last_sender_id', sa.Integer(), nullable=True),
+        sa.Column('last_preview', sa.String(length=200), nullable=True),
+        sa.Column('last_timestamp', sa.DateTime(), nullable=True),
+        sa.Column('unread', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('user_id', 'peer_id'),
+        sqlite_with_rowid=False,
+        if_not_exists=True
+    )
+    op.create_index('ix_conversation_summary_user_last', 'conversation_summary',
+                    ['user_id', 'last_timestamp'], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_conversation_summary_user_last', table_name='conversation_summary', if_exists=True)
+    op.drop_table('conversation_summary')
+    with op.batch_alter_table('message') as batch:
+        batch.drop_column('read_at')
@@ -0,0 +1,28 @@
+"""Add user identity version
+
+Revision ID: c4a9e0f3d218
+Revises: b7e2d51c0a93
+Create Date: 2026-10-17 18:03:51.270933
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4a9e0f3d218'
+down_revision = 'b7e2d51c0a93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = [c['name'] for c in sa.inspect(op.get_bind()).get_columns('user')]
+    if 'identity_version' not in columns:
+        with op.batch_alter_table('user') as batch:
+            batch.add_column(sa.Column('identity_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    with op.batch_alter_table('user') as batch:
+        batch.drop_column('identity_version')
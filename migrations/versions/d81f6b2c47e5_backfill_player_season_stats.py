@@ -0,0 +1,73 @@
+"""Create and backfill player season stats
+
+Revision ID: d81f6b2c47e5
+Revises: c4a9e0f3d218
+Create Date: 2026-10-17 18:41:12.905361
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd81f6b2c47e5'
+down_revision = 'c4a9e0f3d218'
+branch_labels = None
+depends_on = None
+
+CAREER = 'career'
+STAT_FIELDS = ('goals', 'assists', 'tackles', 'passes_completed', 'passes_attempted')
+
+
+def _season(d):
+    # Ίδιο με το aggregates.season_for: η σεζόν ξεκινά τον Ιούλιο
+    start = d.year if d.month >= 7 else d.year - 1
+    return f"{start}-{(start + 1) % 100:02d}"
+
+
+def upgrade():
+    table = op.create_table(
+        'player_season_stats',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('player_id', sa.Integer(), sa.ForeignKey('player.id'), nullable=False),
+        sa.Column('season', sa.String(length=20), nullable=False),
+        sa.Column('appearances', sa.Integer(), nullable=False, server_default='0'),
+        *(sa.Column(f, sa.Integer(), nullable=False, server_default='0') for f in STAT_FIELDS),
+        sa.Column('rating_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.UniqueConstraint('player_id', 'season', name='uq_player_season_stats'),
+        if_not_exists=True
+    )
+
+    # Πάντα από την αρχή: ένας πίνακας που έφτιαξε το create_all/init-db είναι
+    # άδειος ή έχει μόνο ό,τι γράφτηκε μετά, όχι το ιστορικό
+    op.execute(table.delete())
+
+    # Το GROUP BY (player, ημερομηνία) του rebuild_player_totals
+    perf = sa.table('performance', sa.column('id'), sa.column('player_id'), sa.column('date', sa.Date),
+                    sa.column('rating'), *(sa.column(f) for f in STAT_FIELDS))
+    grouped = op.get_bind().execute(
+        sa.select(
+            perf.c.player_id, perf.c.date, sa.func.count(perf.c.id),
+            *(sa.func.coalesce(sa.func.sum(perf.c[f]), 0) for f in STAT_FIELDS),
+            sa.func.coalesce(sa.func.sum(perf.c.rating), 0)
+        ).where(perf.c.player_id.isnot(None)).group_by(perf.c.player_id, perf.c.date)
+    )
+
+    rows = {}
+    for pid, d, apps, *sums, rating in grouped:
+        for season in ((_season(d), CAREER) if d else (CAREER,)):
+            acc = rows.setdefault((pid, season), [0, [0] * len(STAT_FIELDS), 0.0])
+            acc[0] += apps
+            acc[1] = [a + b for a, b in zip(acc[1], sums)]
+            acc[2] += rating
+
+    if rows:
+        op.bulk_insert(table, [
+            {'player_id': pid, 'season': season, 'appearances': apps,
+             **dict(zip(STAT_FIELDS, sums)), 'rating_sum': rating}
+            for (pid, season), (apps, sums, rating) in rows.items()
+        ])
+
+
+def downgrade():
+    op.drop_table('player_season_stats')
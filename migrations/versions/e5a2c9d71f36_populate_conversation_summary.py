@@ -0,0 +1,56 @@
+"""Populate conversation summaries from existing messages
+
+Revision ID: e5a2c9d71f36
+Revises: d81f6b2c47e5
+Create Date: 2026-10-17 19:06:48.217530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a2c9d71f36'
+down_revision = 'd81f6b2c47e5'
+branch_labels = None
+depends_on = None
+
+PREVIEW_LENGTH = 120
+
+
+def upgrade():
+    message = sa.table(
+        'message', sa.column('id'), sa.column('sender_id'), sa.column('receiver_id'),
+        sa.column('content'), sa.column('timestamp', sa.DateTime), sa.column('read_at', sa.DateTime)
+    )
+    summary = sa.table(
+        'conversation_summary', sa.column('user_id'), sa.column('peer_id'),
+        sa.column('last_message_id'), sa.column('last_sender_id'), sa.column('last_preview'),
+        sa.column('last_timestamp', sa.DateTime), sa.column('unread')
+    )
+
+    # Ίδιος υπολογισμός με το messaging.rebuild_conversations
+    op.execute(summary.delete())
+
+    rows = {}
+    result = op.get_bind().execute(
+        sa.select(message.c.id, message.c.sender_id, message.c.receiver_id, message.c.content,
+                  message.c.timestamp, message.c.read_at)
+        .order_by(message.c.timestamp, message.c.id)
+        .execution_options(yield_per=5000)
+    )
+    for msg_id, sender, receiver, content, ts, read_at in result:
+        last = {"last_message_id": msg_id, "last_sender_id": sender,
+                "last_preview": content[:PREVIEW_LENGTH], "last_timestamp": ts}
+        for user, peer, unread in ((sender, receiver, 0), (receiver, sender, read_at is None)):
+            row = rows.setdefault((user, peer), {"user_id": user, "peer_id": peer, "unread": 0})
+            row.update(last)
+            row["unread"] += unread
+
+    if rows:
+        op.bulk_insert(summary, list(rows.values()))
+
+
+def downgrade():
+    # Οι περιλήψεις ξαναχτίζονται από τα μηνύματα· δεν υπάρχει κάτι να αναιρεθεί
+    pass
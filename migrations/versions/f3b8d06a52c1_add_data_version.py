@@ -0,0 +1,29 @@
+"""Add shared data version counters
+
+Revision ID: f3b8d06a52c1
+Revises: e5a2c9d71f36
+Create Date: 2026-10-17 19:34:05.771208
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b8d06a52c1'
+down_revision = 'e5a2c9d71f36'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'data_version',
+        sa.Column('scope', sa.String(length=50), primary_key=True),
+        sa.Column('version', sa.Integer(), nullable=False, server_default='0'),
+        if_not_exists=True
+    )
+
+
+def downgrade():
+    op.drop_table('data_version')
@@ -1,7 +1,8 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
+from read_routing import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 class User(db.Model, UserMixin):
     __tablename__ = 'user'
@@ -11,6 +12,8 @@ class User(db.Model, UserMixin):
     password_hash = db.Column(db.String(200), nullable=False)
     role = db.Column(db.String(20), nullable=False)
     approved = db.Column(db.Integer, default=0)
+    # Αυξάνεται όταν αλλάζει ρόλος/έγκριση/ομάδες: ακυρώνει το identity στο session
+    identity_version = db.Column(db.Integer, default=0, server_default='0', nullable=False)
     def __repr__(self):
         return f'<User {self.username} ({self.role})>'
 
@@ -20,6 +23,12 @@ class Team(db.Model):
     name = db.Column(db.String(120), nullable=False)
     coach_id = db.Column(db.Integer, db.ForeignKey('user.id'))
     season = db.Column(db.String(20))
+
+    __table_args__ = (
+        db.Index('ix_team_coach_id_name', 'coach_id', 'name'),
+        db.Index('ix_team_name', 'name'),
+    )
+
     def __repr__(self):
         return f'<Team {self.name}>'
 
@@ -35,6 +44,11 @@ class Player(db.Model):
     team_id = db.Column(db.Integer, db.ForeignKey('team.id'))
     age = db.Column(db.Integer)
 
+    __table_args__ = (
+        db.Index('ix_player_team_id_name', 'team_id', 'name'),
+        db.Index('ix_player_name', 'name'),
+    )
+
 
 class Performance(db.Model):
     __tablename__ = 'performance'
@@ -48,6 +62,12 @@ class Performance(db.Model):
     pass_accuracy = db.Column(db.Float, default=0.0)
     tackles = db.Column(db.Integer, default=0)
     rating = db.Column(db.Integer, default=0)
+
+    __table_args__ = (
+        db.Index('ix_performance_player_id_date', 'player_id', 'date'),
+        db.Index('ix_performance_date', 'date'),
+    )
+
     def __repr__(self):
         return f'<Perf P{self.player_id} {self.date} R{self.rating}>'
 
@@ -58,10 +78,27 @@ class Training(db.Model):
     date = db.Column(db.Date, nullable=False)
     focus = db.Column(db.Text)
     duration = db.Column(db.Integer)
+    # Πλήθος παρόντων (αντίγραφο του TrainingAttendance για τις λίστες)
     attendance = db.Column(db.Integer, default=0)
 
     team = db.relationship('Team', backref='trainings')
 
+    __table_args__ = (
+        db.Index('ix_training_team_id_date', 'team_id', 'date'),
+    )
+
+
+class TrainingAttendance(db.Model):
+    # Μία γραμμή ανά παρόντα παίκτη· WITHOUT ROWID: μόνο το (training, player) B-tree
+    __tablename__ = 'training_attendance'
+    training_id = db.Column(db.Integer, db.ForeignKey('training.id'), primary_key=True)
+    player_id = db.Column(db.Integer, db.ForeignKey('player.id'), primary_key=True)
+
+    __table_args__ = (
+        db.Index('ix_training_attendance_player_id', 'player_id', 'training_id'),
+        {'sqlite_with_rowid': False},
+    )
+
 class Message(db.Model):
     __tablename__ = 'message'
     id = db.Column(db.Integer, primary_key=True)
@@ -69,10 +106,76 @@ class Message(db.Model):
     receiver_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     content = db.Column(db.Text, nullable=False)
     timestamp = db.Column(db.DateTime, default=db.func.current_timestamp())
+    # NULL = δεν το έχει δει ακόμα ο παραλήπτης
+    read_at = db.Column(db.DateTime)
 
     sender = db.relationship('User', foreign_keys=[sender_id])
     receiver = db.relationship('User', foreign_keys=[receiver_id])
 
+    __table_args__ = (
+        db.Index('ix_message_sender_receiver_timestamp', 'sender_id', 'receiver_id', 'timestamp'),
+        # Σελίδες συνομιλίας: κάθε κατεύθυνση σε σειρά id, χωρίς ταξινόμηση
+        db.Index('ix_message_sender_receiver_id', 'sender_id', 'receiver_id', 'id'),
+    )
+
     def __repr__(self):
         return f'<Message {self.id} from {self.sender_id} to {self.receiver_id}>'
 
+
+class ConversationSummary(db.Model):
+    # Μία γραμμή ανά (χρήστης, συνομιλητής), ενημερώνεται σε αποστολή/ανάγνωση
+    __tablename__ = 'conversation_summary'
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    peer_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    last_message_id = db.Column(db.Integer, db.ForeignKey('message.id'))
+    last_sender_id = db.Column(db.Integer)
+    last_preview = db.Column(db.String(200))
+    last_timestamp = db.Column(db.DateTime)
+    unread = db.Column(db.Integer, default=0, nullable=False)
+
+    peer = db.relationship('User', foreign_keys=[peer_id])
+
+    __table_args__ = (
+        db.Index('ix_conversation_summary_user_last', 'user_id', 'last_timestamp'),
+        {'sqlite_with_rowid': False},
+    )
+
+    def __repr__(self):
+        return f'<Conversation {self.user_id} <-> {self.peer_id} ({self.unread} unread)>'
+
+
+
+class DataVersion(db.Model):
+    # Μετρητές έκδοσης κοινοί σε όλες τις διεργασίες και τα CLI (π.χ. "leaderboard")
+    __tablename__ = 'data_version'
+    scope = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f'<DataVersion {self.scope}={self.version}>'
+
+
+class PlayerSeasonStats(db.Model):
+    __tablename__ = 'player_season_stats'
+    id = db.Column(db.Integer, primary_key=True)
+    player_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=False)
+    # "2024-25" για σεζόν, CAREER για το σύνολο καριέρας
+    season = db.Column(db.String(20), nullable=False)
+    appearances = db.Column(db.Integer, default=0, nullable=False)
+    goals = db.Column(db.Integer, default=0, nullable=False)
+    assists = db.Column(db.Integer, default=0, nullable=False)
+    tackles = db.Column(db.Integer, default=0, nullable=False)
+    passes_completed = db.Column(db.Integer, default=0, nullable=False)
+    passes_attempted = db.Column(db.Integer, default=0, nullable=False)
+    rating_sum = db.Column(db.Float, default=0.0, nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint('player_id', 'season', name='uq_player_season_stats'),
+    )
+
+    @property
+    def avg_rating(self):
+        return round(self.rating_sum / self.appearances, 2) if self.appearances else 0.0
+
+    def __repr__(self):
+        return f'<SeasonStats P{self.player_id} {self.season}>'
@@ -0,0 +1,200 @@
+import atexit
+import logging
+import queue
+import smtplib
+import threading
+import time
+from flask import current_app
+from flask_mail import Message as MailMessage, BadHeaderError
+from extensions import mail
+from models import db, User, Player
+
+log = logging.getLogger(__name__)
+
+# Λάθη του ίδιου του μηνύματος: δεν έχει νόημα να ξαναδοκιμαστεί
+REJECTED = (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError,
+            BadHeaderError, AssertionError)
+
+
+# ---------------- QUEUE + WORKER ----------------
+class MailQueue:
+    """Background delivery of Flask-Mail messages.
+
+    Requests only enqueue. One daemon thread takes up to `batch_size`
+    messages at a time and sends them over a single SMTP connection, kept
+    open for the next batch until the queue has been idle for
+    `idle_timeout` seconds. A batch that fails on the connection is retried
+    `retries` times with exponential backoff, reconnecting each time.
+    """
+
+    def __init__(self, app, batch_size=50, retries=3, backoff=1.0, idle_timeout=30, maxsize=1000):
+        self.app = app
+        self.batch_size = batch_size
+        self.retries = retries
+        self.backoff = backoff
+        self.idle_timeout = idle_timeout
+        self.sent = self.failed = self.connections = 0
+        self._queue = queue.Queue(maxsize)
+        self._conn = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, *messages):
+        self._ensure_worker()
+        for msg in messages:
+            try:
+                self._queue.put_nowait(msg)
+            except queue.Full:
+                self.failed += 1
+                log.warning("Mail queue full, dropping notification to %s", msg.recipients)
+
+    def _ensure_worker(self):
+        # Εκκίνηση στο πρώτο μήνυμα, ώστε κάθε worker process να έχει το δικό του thread
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='mail-queue', daemon=True)
+                self._thread.start()
+
+    def flush(self, timeout=10):
+        """Wait until everything queued so far was sent or given up. Returns True if drained."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    # -------- worker --------
+    def _run(self):
+        with self.app.app_context():
+            while True:
+                try:
+                    first = self._queue.get(timeout=self.idle_timeout)
+                except queue.Empty:
+                    self._disconnect()
+                    continue
+
+                batch = [first]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                try:
+                    self._deliver(batch)
+                except Exception:
+                    log.exception("Mail delivery crashed")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+
+    def _connect(self):
+        if self._conn is None:
+            conn = mail.connect()
+            conn.__enter__()
+            self._conn = conn
+            self.connections += 1
+        return self._conn
+
+    def _disconnect(self):
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.__exit__(None, None, None)
+            except (smtplib.SMTPException, OSError):
+                # Ο server την έχει ήδη κλείσει
+                pass
+
+    def _deliver(self, batch):
+        pending = list(batch)
+        for attempt in range(self.retries + 1):
+            try:
+                conn = self._connect()
+                while pending:
+                    try:
+                        conn.send(pending[0])
+                        self.sent += 1
+                    except REJECTED as e:
+                        self.failed += 1
+                        log.error("Notification to %s rejected: %s", pending[0].recipients, e)
+                    pending.pop(0)
+                return
+            except (smtplib.SMTPException, OSError) as e:
+                self._disconnect()
+                if attempt < self.retries:
+                    delay = self.backoff * 2 ** attempt
+                    log.warning("SMTP failed (%s), retrying %d messages in %.1fs", e, len(pending), delay)
+                    time.sleep(delay)
+
+        self.failed += len(pending)
+        log.error("Dropping %d notifications after %d attempts", len(pending), self.retries + 1)
+
+
+def init_notifications(app):
+    """Create the mail queue when MAIL_NOTIFICATIONS is set."""
+    if not app.config['MAIL_NOTIFICATIONS']:
+        return
+
+    mail_queue = MailQueue(
+        app,
+        batch_size=app.config['MAIL_QUEUE_BATCH_SIZE'],
+        retries=app.config['MAIL_QUEUE_RETRIES'],
+        backoff=app.config['MAIL_QUEUE_BACKOFF'],
+        idle_timeout=app.config['MAIL_QUEUE_IDLE_TIMEOUT'],
+        maxsize=app.config['MAIL_QUEUE_SIZE']
+    )
+    app.extensions['mail_queue'] = mail_queue
+    atexit.register(mail_queue.flush, 5)
+
+
+def _queue():
+    return current_app.extensions.get('mail_queue')
+
+
+def _send(messages):
+    mail_queue = _queue()
+    if mail_queue is not None and messages:
+        mail_queue.enqueue(*messages)
+
+
+# ---------------- NOTIFICATIONS ----------------
+def notify_approved(user):
+    _send([MailMessage(
+        subject="Ο λογαριασμός σας εγκρίθηκε",
+        recipients=[user.email],
+        body=f"Γεια σου {user.username},\n\nΟ λογαριασμός σου ({user.role}) εγκρίθηκε. "
+             f"Μπορείς πλέον να συνδεθείς."
+    )])
+
+
+def notify_message(msg, sender_name):
+    # Χωρίς ουρά (MAIL_NOTIFICATIONS off) ούτε query για διευθύνσεις
+    if _queue() is None:
+        return
+    receiver = db.session.query(User.email).filter(User.id == msg.receiver_id).scalar()
+    if receiver:
+        _send([MailMessage(
+            subject=f"Νέο μήνυμα από {sender_name}",
+            recipients=[receiver],
+            body=msg.content
+        )])
+
+
+def notify_training(training, team_name):
+    if _queue() is None:
+        return
+    emails = [
+        e for (e,) in db.session.query(User.email)
+        .join(Player, Player.user_id == User.id)
+        .filter(Player.team_id == training.team_id)
+    ]
+    body = (
+        f"Νέα προπόνηση για την ομάδα {team_name}: {training.date:%d/%m/%Y}"
+        f", {training.duration or '-'} λεπτά.\n{training.focus or ''}"
+    )
+    # Ένα μήνυμα ανά παίκτη: οι διευθύνσεις δεν φαίνονται μεταξύ τους
+    _send([
+        MailMessage(subject=f"Νέα προπόνηση: {team_name}", recipients=[e], body=body)
+        for e in emails
+    ])
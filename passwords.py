@@ -0,0 +1,80 @@
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+from werkzeug.security import generate_password_hash, check_password_hash
+
+DEFAULT_METHOD = 'scrypt:32768:8:1'
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+# ---------------- ALGORITHMS ----------------
+# Μέθοδος σε μορφή werkzeug ("scrypt:32768:8:1", "pbkdf2:sha256:600000")
+# ή "bcrypt:<cost>" μέσω του πακέτου bcrypt (έρχεται με το Flask-Bcrypt).
+def _hash(password, method):
+    if method.startswith('bcrypt'):
+        import bcrypt
+
+        _, _, cost = method.partition(':')
+        salt = bcrypt.gensalt(rounds=int(cost or 12))
+        return bcrypt.hashpw(password.encode(), salt).decode()
+
+    return generate_password_hash(password, method=method)
+
+
+def _verify(pwhash, password):
+    if pwhash.startswith('$2'):
+        import bcrypt
+
+        return bcrypt.checkpw(password.encode(), pwhash.encode())
+
+    return check_password_hash(pwhash, password)
+
+
+def method_of(pwhash):
+    """'scrypt:32768:8:1$salt$hash' -> 'scrypt:32768:8:1', '$2b$12$..' -> 'bcrypt:12'."""
+    if pwhash.startswith('$2'):
+        return f"bcrypt:{int(pwhash.split('$')[2])}"
+    return pwhash.split('$', 1)[0]
+
+
+@functools.lru_cache(maxsize=8)
+def normalize_method(method):
+    # Πάντα όπως θα το έγραφε το werkzeug: "scrypt" -> "scrypt:32768:8:1",
+    # "pbkdf2:sha256" -> "pbkdf2:sha256:1000000"
+    if method.startswith('bcrypt'):
+        return method if ':' in method else 'bcrypt:12'
+    return method_of(generate_password_hash('', method=method))
+
+
+# ---------------- THREAD POOL ----------------
+# Όριο ταυτόχρονων hashes ανά process: ο caller περιμένει το αποτέλεσμα, αλλά
+# όσα requests κι αν κάνουν login, μόνο PASSWORD_HASH_WORKERS hashes τρέχουν μαζί
+def _executor():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(
+                    max_workers=current_app.config['PASSWORD_HASH_WORKERS'],
+                    thread_name_prefix='password-hash'
+                )
+    return _pool
+
+
+# ---------------- POLICY ----------------
+def hash_password(password):
+    """Hash with the configured policy on the hashing pool (blocks the caller)."""
+    method = current_app.config['PASSWORD_HASH_METHOD']
+    return _executor().submit(_hash, password, method).result()
+
+
+def verify_password(pwhash, password):
+    return _executor().submit(_verify, pwhash, password).result()
+
+
+def needs_rehash(pwhash):
+    return method_of(pwhash) != normalize_method(current_app.config['PASSWORD_HASH_METHOD'])
+
@@ -0,0 +1,62 @@
+import re
+from datetime import date
+from models import db, User, Team, Player, Performance, Message
+from messaging import conversation_page, inbox
+from listings import trainings_for_coach, trainings_for_team, team_roster, free_agents, chat_players_for_coach
+
+# Τα queries των routes στο app.py με ενδεικτικά ids.
+# Αν προστεθεί route με νέο φίλτρο, πρόσθεσέ το εδώ.
+ROUTE_QUERIES = {
+    'dashboard (coach teams)': lambda: Team.query.filter_by(coach_id=1),
+    'dashboard (player profile)': lambda: Player.query.filter_by(user_id=1),
+    'dashboard (player performances)': lambda: (
+        Performance.query.filter_by(player_id=1).order_by(Performance.date.asc())
+    ),
+    'add_team (name check)': lambda: Team.query.filter_by(name='x', coach_id=1),
+    'add_player (name check)': lambda: Player.query.filter_by(name='x'),
+    'approve (unregistered player)': lambda: Player.query.filter_by(name='x', user_id=None),
+    'coach_players': lambda: free_agents(),
+    'team_players': lambda: team_roster(1),
+    'player_trainings': lambda: trainings_for_team(1, date(2000, 1, 1)),
+    'coach_trainings': lambda: trainings_for_coach(1, date(2000, 1, 1)),
+    'coach_chat_list': lambda: chat_players_for_coach(1),
+    'chat': lambda: conversation_page(1, 2, 51, Message.id < 100),
+    'inbox': lambda: inbox(1),
+    'api_chat_messages': lambda: conversation_page(1, 2, 50, Message.id > 100, newest=False),
+    'player_detail': lambda: (
+        Performance.query.filter_by(player_id=1).order_by(Performance.date.asc())
+    ),
+    'api_team_performance': lambda: (
+        db.session.query(Performance.date, db.func.avg(Performance.rating))
+        .join(Player, Performance.player_id == Player.id)
+        .filter(Player.team_id == 1)
+        .filter(Performance.date >= date(2000, 1, 1))
+        .group_by(Performance.date)
+    ),
+    'login': lambda: User.query.filter_by(username='x'),
+}
+
+# "SCAN player" χωρίς index = πλήρης σάρωση πίνακα
+# ("SCAN anon_1" είναι η σάρωση ενός ήδη περιορισμένου subquery, όχι πίνακα)
+FULL_SCAN = re.compile(r'^SCAN (?!anon_)(\w+)$')
+
+
+def explain(query):
+    compiled = query.statement.compile(dialect=db.engine.dialect)
+    params = tuple(compiled.params[k] for k in compiled.positiontup)
+    with db.engine.connect() as conn:
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + str(compiled), params).all()
+    return [row[-1] for row in rows]
+
+
+def full_table_scans():
+    """Run EXPLAIN QUERY PLAN for every route query (SQLite only).
+
+    Returns {route: (plan lines, scanned tables)}.
+    """
+    report = {}
+    for route, build in ROUTE_QUERIES.items():
+        plan = explain(build())
+        scans = [m.group(1) for m in (FULL_SCAN.match(line) for line in plan) if m]
+        report[route] = (plan, scans)
+    return report
@@ -0,0 +1,81 @@
+import time
+import sqlalchemy as sa
+from flask import g, has_request_context, request, session
+from flask_sqlalchemy.session import Session
+
+REPLICA = 'replica'
+SESSION_KEY = 'db_primary_until'
+
+
+# ---------------- SESSION ----------------
+class RoutingSession(Session):
+    """db.session that sends the SELECTs of read-only requests to the replica bind.
+
+    Flushes, bulk UPDATE/DELETE/INSERT and everything outside a read-only
+    request go to the primary. After the first write of a request, its
+    remaining reads also go to the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_request_context():
+            if self._flushing or isinstance(clause, sa.UpdateBase):
+                g.db_read_only = False
+                g.db_wrote = True
+            elif g.get('db_read_only') and isinstance(clause, (sa.Select, sa.CompoundSelect)):
+                engines = self._db.engines
+                if REPLICA in engines:
+                    return engines[REPLICA]
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+# ---------------- CONFIG ----------------
+def replica_url(primary_url):
+    """Read-only URI onto the same SQLite file (sqlite:///app.db -> file:app.db?mode=ro)."""
+    url = sa.engine.make_url(primary_url)
+    if url.get_backend_name() != 'sqlite' or url.database in (None, '', ':memory:'):
+        raise ValueError("Set DATABASE_REPLICA_URL: only a SQLite file can be opened read-only")
+
+    database = url.database if url.query.get('uri') else f'file:{url.database}'
+    url = url.set(database=database).update_query_dict({'mode': 'ro', 'uri': 'true'})
+    return url.render_as_string(hide_password=False)
+
+
+def configure_read_replica(app):
+    """Add the replica bind to SQLALCHEMY_BINDS (before db.init_app)."""
+    if not app.config['DB_READ_ROUTING']:
+        return
+
+    url = app.config['DATABASE_REPLICA_URL'] or replica_url(app.config['SQLALCHEMY_DATABASE_URI'])
+    app.config.setdefault('SQLALCHEMY_BINDS', {})[REPLICA] = url
+
+
+def is_read_route(endpoint, routes):
+    # "api" ταιριάζει σε όλο το blueprint, "main.dashboard" σε ένα route
+    return endpoint in routes or endpoint.partition('.')[0] in routes
+
+
+# ---------------- REQUEST HOOKS ----------------
+def init_read_routing(app):
+    if not app.config['DB_READ_ROUTING']:
+        return
+
+    routes = frozenset(app.config['DB_READ_ROUTES'])
+    sticky = app.config['DB_READ_STICKY_SECONDS']
+
+    @app.before_request
+    def choose_bind():
+        # Λίγα δευτερόλεπτα μετά από εγγραφή ο χρήστης διαβάζει από τον primary,
+        # ώστε να βλέπει τις δικές του αλλαγές παρά την καθυστέρηση του replica
+        g.db_read_only = (
+            request.method in ('GET', 'HEAD')
+            and request.endpoint is not None
+            and is_read_route(request.endpoint, routes)
+            and session.get(SESSION_KEY, 0) < time.time()
+        )
+
+    @app.after_request
+    def remember_write(response):
+        if g.get('db_wrote') and sticky:
+            session[SESSION_KEY] = time.time() + sticky
+        return response
@@ -7,6 +7,7 @@ CREATE TABLE user (
     password_hash TEXT NOT NULL,
     role TEXT NOT NULL CHECK (role IN ('admin', 'coach', 'player')),
     approved INTEGER NOT NULL DEFAULT 0,
+    identity_version INTEGER NOT NULL DEFAULT 0,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -69,3 +70,57 @@ CREATE TABLE goal (
     FOREIGN KEY (player_id) REFERENCES player(id) ON DELETE CASCADE,
     FOREIGN KEY (team_id) REFERENCES team(id) ON DELETE CASCADE
 );
+
+CREATE TABLE conversation_summary (
+    user_id INTEGER NOT NULL,
+    peer_id INTEGER NOT NULL,
+    last_message_id INTEGER,
+    last_sender_id INTEGER,
+    last_preview TEXT,
+    last_timestamp DATETIME,
+    unread INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, peer_id),
+    FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE,
+    FOREIGN KEY (peer_id) REFERENCES user(id) ON DELETE CASCADE,
+    FOREIGN KEY (last_message_id) REFERENCES message(id) ON DELETE SET NULL
+) WITHOUT ROWID;
+
+CREATE TABLE training_attendance (
+    training_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    PRIMARY KEY (training_id, player_id),
+    FOREIGN KEY (training_id) REFERENCES training(id) ON DELETE CASCADE,
+    FOREIGN KEY (player_id) REFERENCES player(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+CREATE TABLE data_version (
+    scope TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE player_season_stats (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    player_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    appearances INTEGER NOT NULL DEFAULT 0,
+    goals INTEGER NOT NULL DEFAULT 0,
+    assists INTEGER NOT NULL DEFAULT 0,
+    tackles INTEGER NOT NULL DEFAULT 0,
+    passes_completed INTEGER NOT NULL DEFAULT 0,
+    passes_attempted INTEGER NOT NULL DEFAULT 0,
+    rating_sum REAL NOT NULL DEFAULT 0,
+    UNIQUE (player_id, season),
+    FOREIGN KEY (player_id) REFERENCES player(id) ON DELETE CASCADE
+);
+
+CREATE INDEX ix_performance_player_id_date ON performance (player_id, date);
+CREATE INDEX ix_performance_date ON performance (date);
+CREATE INDEX ix_player_team_id_name ON player (team_id, name);
+CREATE INDEX ix_player_name ON player (name);
+CREATE INDEX ix_team_coach_id_name ON team (coach_id, name);
+CREATE INDEX ix_team_name ON team (name);
+CREATE INDEX ix_training_team_id_date ON training (team_id, date);
+CREATE INDEX ix_training_attendance_player_id ON training_attendance (player_id, training_id);
+CREATE INDEX ix_message_sender_receiver_timestamp ON message (sender_id, receiver_id, timestamp);
+CREATE INDEX ix_message_sender_receiver_id ON message (sender_id, receiver_id, id);
+CREATE INDEX ix_conversation_summary_user_last ON conversation_summary (user_id, last_timestamp);